@@ -0,0 +1,48 @@
+"""consumption composite indexes and foreign-key indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables are created by Base.metadata.create_all at startup, so every
+# statement here must be a no-op on a freshly created schema.
+INDEXES = [
+    ("ix_consumptions_user_created", "consumptions", "user_id, created_at", False),
+    ("ix_consumptions_agent_created", "consumptions", "agent_id, created_at", False),
+    ("ix_consumptions_provider_created", "consumptions", "provider_id, created_at", False),
+    ("ix_consumptions_model_created", "consumptions", "model_id, created_at", False),
+    ("ix_workspace_members_workspace_user", "workspace_members", "workspace_id, user_id", True),
+    ("ix_workspace_members_user", "workspace_members", "user_id", False),
+    ("ix_user_roles_role", "user_roles", "role_id", False),
+    ("ix_agent_session_messages_session_timestamp", "agent_session_messages", "session_id, timestamp", False),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{name} ON {table} ({columns})"
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_agent_session_messages_session_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_agent_session_messages_session_id "
+            "ON agent_session_messages (session_id)"
+        )
+        for name, _, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,45 @@
+"""agent_session_messages attachments/metadata as JSONB
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _alter_column_type(column: str, from_type: str, to_type: str, using: str, default: str) -> None:
+    # No-op when create_all already built the column with the target type
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'agent_session_messages'
+                  AND column_name = '{column}'
+                  AND data_type = '{from_type}'
+            ) THEN
+                ALTER TABLE agent_session_messages ALTER COLUMN "{column}" DROP DEFAULT;
+                ALTER TABLE agent_session_messages
+                    ALTER COLUMN "{column}" TYPE {to_type} USING {using};
+                ALTER TABLE agent_session_messages ALTER COLUMN "{column}" SET DEFAULT {default};
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    _alter_column_type("attachments", "text", "jsonb", "COALESCE(NULLIF(attachments, ''), '[]')::jsonb", "'[]'::jsonb")
+    _alter_column_type("metadata", "text", "jsonb", "COALESCE(NULLIF(metadata, ''), '{}')::jsonb", "'{}'::jsonb")
+
+
+def downgrade() -> None:
+    _alter_column_type("attachments", "jsonb", "text", "attachments::text", "'[]'")
+    _alter_column_type("metadata", "jsonb", "text", "metadata::text", "'{}'")
@@ -0,0 +1,44 @@
+"""roles.permissions_mask bitfield
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.models.role.PERMISSION_PAIRS at this revision
+_PERMISSION_PAIRS = (
+    ("users", "read"), ("users", "write"), ("users", "delete"),
+    ("roles", "read"), ("roles", "write"), ("roles", "delete"),
+    ("llm_config", "read"), ("llm_config", "write"),
+    ("consumption", "read"),
+    ("quotas", "read"), ("quotas", "write"),
+    ("costs", "read"), ("costs", "write"),
+    ("moderation", "read"), ("moderation", "write"),
+    ("agents", "read"), ("agents", "write"), ("agents", "delete"),
+    ("agents", "export"), ("agents", "import"),
+    ("catalog_management", "read"), ("catalog_management", "write"),
+    ("system", "read"), ("system", "update"),
+)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE roles ADD COLUMN IF NOT EXISTS permissions_mask BIGINT NOT NULL DEFAULT 0")
+    mask = " + ".join(
+        f"(CASE WHEN COALESCE((permissions->'{resource}'->>'{action}')::boolean, false) "
+        f"THEN {1 << i} ELSE 0 END)"
+        for i, (resource, action) in enumerate(_PERMISSION_PAIRS)
+    )
+    op.execute(f"UPDATE roles SET permissions_mask = {mask}")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE roles DROP COLUMN IF EXISTS permissions_mask")
@@ -0,0 +1,37 @@
+"""partial indexes on active LLM configs, providers, models and quotas
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Hot read paths all filter on is_active = true: index only the live rows
+INDEXES = [
+    ("ix_llm_providers_active", "llm_providers", "slug"),
+    ("ix_llm_models_active", "llm_models", "provider_id, slug"),
+    ("ix_agent_llm_configs_active", "agent_llm_configs", "agent_slug, provider_id, model_id"),
+    ("ix_quotas_active_target", "quotas", "target_type, target_id, quota_type"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns}) WHERE is_active"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,65 @@
+"""consumption costs as BIGINT micros, model costs as NUMERIC
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_column(table: str, old: str, new: str, new_type: str, using: str) -> None:
+    # No-op when create_all already built the new column and never had the old one
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = '{table}' AND column_name = '{old}'
+            ) THEN
+                ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {new} {new_type};
+                UPDATE {table} SET {new} = {using};
+                ALTER TABLE {table} DROP COLUMN {old};
+            END IF;
+        END $$;
+    """)
+
+
+def _alter_type(table: str, column: str, from_type: str, to_type: str) -> None:
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = '{table}' AND column_name = '{column}'
+                  AND data_type = '{from_type}'
+            ) THEN
+                ALTER TABLE {table} ALTER COLUMN {column} TYPE {to_type};
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    _replace_column("consumptions", "cost_in", "cost_in_micros", "BIGINT NOT NULL DEFAULT 0",
+                    "ROUND(cost_in::numeric * 1000000)::bigint")
+    _replace_column("consumptions", "cost_out", "cost_out_micros", "BIGINT NOT NULL DEFAULT 0",
+                    "ROUND(cost_out::numeric * 1000000)::bigint")
+    _alter_type("model_costs", "cost_per_token_in", "double precision", "NUMERIC(20, 10)")
+    _alter_type("model_costs", "cost_per_token_out", "double precision", "NUMERIC(20, 10)")
+
+
+def downgrade() -> None:
+    _alter_type("model_costs", "cost_per_token_in", "numeric", "DOUBLE PRECISION")
+    _alter_type("model_costs", "cost_per_token_out", "numeric", "DOUBLE PRECISION")
+    _replace_column("consumptions", "cost_in_micros", "cost_in", "DOUBLE PRECISION NOT NULL DEFAULT 0",
+                    "cost_in_micros / 1000000.0")
+    _replace_column("consumptions", "cost_out_micros", "cost_out", "DOUBLE PRECISION NOT NULL DEFAULT 0",
+                    "cost_out_micros / 1000000.0")
@@ -0,0 +1,34 @@
+"""covering index for agent session listing
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_agent_sessions_user_agent_updated "
+            "ON agent_sessions (user_id, agent_slug, updated_at) "
+            "INCLUDE (session_id, title, is_active, created_at)"
+        )
+        # Both are prefixes / subsets of the covering index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_agent_sessions_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_agent_sessions_agent_slug")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_agent_sessions_user_id ON agent_sessions (user_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_agent_sessions_agent_slug ON agent_sessions (agent_slug)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_agent_sessions_user_agent_updated")
@@ -0,0 +1,46 @@
+"""server-side defaults for created/updated timestamps
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expression as app.database.utc_now(): naive UTC, like datetime.utcnow
+UTC_NOW = "timezone('utc', now())"
+
+TIMESTAMP_COLUMNS = [
+    ("agents", "created_at"), ("agents", "updated_at"),
+    ("agent_llm_configs", "created_at"), ("agent_llm_configs", "updated_at"),
+    ("agent_sessions", "created_at"), ("agent_sessions", "updated_at"),
+    ("agent_session_messages", "timestamp"),
+    ("consumptions", "created_at"),
+    ("model_costs", "created_at"),
+    ("llm_providers", "created_at"), ("llm_providers", "updated_at"),
+    ("llm_models", "created_at"),
+    ("moderation_rules", "created_at"), ("moderation_rules", "updated_at"),
+    ("quotas", "created_at"), ("quotas", "updated_at"),
+    ("roles", "created_at"), ("roles", "updated_at"),
+    ("user_roles", "assigned_at"),
+    ("users", "created_at"), ("users", "updated_at"),
+    ("workspaces", "created_at"), ("workspaces", "updated_at"),
+    ("workspace_members", "joined_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" SET DEFAULT {UTC_NOW}')
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" DROP DEFAULT')
@@ -139,7 +139,7 @@ class WorkflowStudioAgent(BaseAgent):
                     "phase": "generated",
                     "workflow_json": workflow_json,
                     "publish_config": publish_config,
-                    "analysis": analysis.to_dict(),
+                    "analysis": analysis.as_dict,
                 }
 
                 # Clean markers from display text
@@ -212,7 +212,7 @@ class WorkflowStudioAgent(BaseAgent):
                     "phase": "generated",
                     "workflow_json": workflow_json,
                     "publish_config": publish_config,
-                    "analysis": analysis.to_dict(),
+                    "analysis": analysis.as_dict,
                 }
 
         yield AgentResponseChunk(content="", is_final=True, metadata=metadata)
@@ -253,11 +253,11 @@ class WorkflowStudioAgent(BaseAgent):
         lang = context.lang
         steps_text = "\n".join(
             f"  {s['order']}. **{s['name']}** — {s['description']}"
-            for s in analysis.to_dict()["steps"]
+            for s in analysis.as_dict["steps"]
         )
         inputs_text = "\n".join(
             f"  - **{i['label']}** ({i['type']})"
-            for i in analysis.to_dict()["inputs"]
+            for i in analysis.as_dict["inputs"]
         ) or "  - None detected"
 
         content = (
@@ -278,7 +278,7 @@ class WorkflowStudioAgent(BaseAgent):
                 "phase": "generated",
                 "workflow_json": workflow_json,
                 "publish_config": publish_config,
-                "analysis": analysis.to_dict(),
+                "analysis": analysis.as_dict,
             },
         )
 
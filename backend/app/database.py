@@ -1,15 +1,45 @@
+import os
+import time
+import uuid
+
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=True,  # drop connections closed server-side instead of failing the request
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated timestamps with RETURNING on INSERT and UPDATE, so
+    # instances stay usable after commit (expire_on_commit=False).
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def utc_now():
+    """Naive UTC timestamp computed by PostgreSQL (same semantics as datetime.utcnow)."""
+    return func.timezone("utc", func.now())
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 v7): 48-bit ms timestamp + random bits.
+
+    Used as primary key default on insert-heavy tables so new rows land on the
+    rightmost B-tree page instead of random ones.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
 
 
 async def get_db():
@@ -13,12 +13,16 @@ Enrichi avec:
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
 import logging
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 from app.framework.base.connector import BaseConnector
 from app.framework.schemas import ConnectorErrorCode, ConnectorMetadata, ConnectorResult
 
@@ -27,6 +31,11 @@ logger = logging.getLogger(__name__)
 CONNECTORS_ROOT = Path(__file__).parent
 SKIP_FILES = {"__init__.py", "registry.py", "generator.py", "validator.py"}
 
+# Health checks globaux : sondes en parallèle, bornées en nombre et en durée
+HEALTH_CHECK_CONCURRENCY = 10
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+HEALTH_CACHE_TTL_SECONDS = 5.0
+
 
 class ConnectorRegistry:
     """
@@ -42,6 +51,21 @@ class ConnectorRegistry:
     def __init__(self):
         self._connectors: dict[str, BaseConnector] = {}
         self._connected: set[str] = set()
+        # JSON pré-sérialisé à l'enregistrement (les métadonnées sont immuables) :
+        # détail par état de connexion, et liste des actions
+        self._detail_json: dict[str, dict[bool, bytes]] = {}
+        self._actions_json: dict[str, bytes] = {}
+        # Incrémenté à chaque changement du catalogue (enregistrement, connexion)
+        self._version = 0
+        # Dernier résultat de health_check_all : (version, expiration, résultats)
+        self._health_cache: Optional[tuple[int, float, dict[str, bool]]] = None
+        self._health_inflight: Optional[asyncio.Task] = None
+        self._health_sem = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+
+    @property
+    def version(self) -> int:
+        """Version du catalogue : change dès qu'un connecteur ou son état change."""
+        return self._version
 
     def discover(self, connectors_dir: Optional[Path] = None) -> int:
         """
@@ -98,6 +122,12 @@ class ConnectorRegistry:
         if slug in self._connectors:
             logger.warning(f"Connector '{slug}' already registered, replacing")
         self._connectors[slug] = connector
+        metadata = connector.metadata.model_dump(mode="json")
+        self._detail_json[slug] = {
+            flag: orjson.dumps({**metadata, "is_connected": flag}) for flag in (False, True)
+        }
+        self._actions_json[slug] = orjson.dumps(metadata["actions"])
+        self._version += 1
         logger.info(f"Connector registered: {slug} v{connector.metadata.version}")
 
     def unregister(self, slug: str) -> bool:
@@ -112,7 +142,10 @@ class ConnectorRegistry:
         """
         if slug in self._connectors:
             del self._connectors[slug]
+            self._detail_json.pop(slug, None)
+            self._actions_json.pop(slug, None)
             self._connected.discard(slug)
+            self._version += 1
             logger.info(f"Connector unregistered: {slug}")
             return True
         return False
@@ -129,6 +162,31 @@ class ConnectorRegistry:
         """
         return self._connectors.get(slug)
 
+    def get_detail_json(self, slug: str) -> Optional[bytes]:
+        """
+        Détail JSON d'un connecteur (métadonnées + is_connected), pré-sérialisé.
+
+        Args:
+            slug: Slug du connecteur
+
+        Returns:
+            JSON encodé ou None si inconnu
+        """
+        variants = self._detail_json.get(slug)
+        return variants[slug in self._connected] if variants else None
+
+    def get_actions_json(self, slug: str) -> Optional[bytes]:
+        """
+        Actions JSON d'un connecteur, pré-sérialisées.
+
+        Args:
+            slug: Slug du connecteur
+
+        Returns:
+            JSON encodé ou None si inconnu
+        """
+        return self._actions_json.get(slug)
+
     def list_connectors(self) -> list[ConnectorMetadata]:
         """
         Liste tous les connecteurs avec leurs métadonnées.
@@ -203,6 +261,7 @@ class ConnectorRegistry:
         try:
             await connector.connect(config)
             self._connected.add(slug)
+            self._version += 1
             logger.info(f"Connector connected: {slug}")
             return True
         except Exception as e:
@@ -251,6 +310,7 @@ class ConnectorRegistry:
                 logger.warning(f"Connector disconnect error ({slug}): {e}")
             finally:
                 self._connected.discard(slug)
+                self._version += 1
 
     async def disconnect_all(self) -> None:
         """Ferme toutes les connexions actives."""
@@ -346,19 +406,39 @@ class ConnectorRegistry:
         """
         Vérifie la santé de tous les connecteurs connectés.
 
+        Les sondes partent en parallèle (au plus HEALTH_CHECK_CONCURRENCY à la
+        fois, HEALTH_CHECK_TIMEOUT_SECONDS chacune). Le résultat est gardé
+        HEALTH_CACHE_TTL_SECONDS et partagé entre appels concurrents.
+
         Returns:
             Dict slug → is_healthy
         """
-        results = {}
-        for slug in self._connected:
-            connector = self.get_connector(slug)
-            if connector:
-                try:
-                    results[slug] = await connector.health_check()
-                except Exception:
-                    results[slug] = False
+        cached = self._health_cache
+        if cached and cached[0] == self._version and cached[1] > time.monotonic():
+            return cached[2]
+
+        if self._health_inflight is None or self._health_inflight.done():
+            self._health_inflight = asyncio.create_task(self._probe_all())
+        return await asyncio.shield(self._health_inflight)
+
+    async def _probe_all(self) -> dict[str, bool]:
+        version = self._version
+        slugs = [slug for slug in self._connected if slug in self._connectors]
+        results = dict(await asyncio.gather(*(self._probe(slug) for slug in slugs)))
+        self._health_cache = (version, time.monotonic() + HEALTH_CACHE_TTL_SECONDS, results)
         return results
 
+    async def _probe(self, slug: str) -> tuple[str, bool]:
+        connector = self._connectors[slug]
+        async with self._health_sem:
+            try:
+                healthy = await asyncio.wait_for(
+                    connector.health_check(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+                )
+                return slug, bool(healthy)
+            except Exception:
+                return slug, False
+
     def _load_connectors_from_file(self, py_file: Path) -> list[BaseConnector]:
         """Charge les connecteurs depuis un fichier Python."""
         import sys as _sys
@@ -166,6 +166,10 @@ class AgentImporter:
             # Extraire les fichiers
             self._extract_files(zf, backend_dir, frontend_dir)
 
+        # Les agents sont mis en cache par le runtime : forcer la redécouverte
+        from app.framework.runtime.bootstrap import invalidate_agents
+        invalidate_agents()
+
         # Valider l'agent importé
         validator = AgentValidator(
             tool_slugs=self._tool_slugs,
@@ -6,6 +6,7 @@ Composants:
     - pipeline.py : Pipeline d'exécution (auth, validation, modération, quotas, logging)
     - engine.py   : Moteur de chargement et d'exécution des agents
     - session.py  : Gestion des sessions de conversation
+    - bootstrap.py: Registres et agents partagés entre les requêtes
 """
 
 from app.framework.runtime.context import AgentContext, ToolContext
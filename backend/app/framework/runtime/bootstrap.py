@@ -0,0 +1,219 @@
+"""
+Bootstrap — Singletons du runtime partagés entre les requêtes.
+
+La découverte des tools, des connecteurs et des agents est un travail
+filesystem/import : elle est faite une seule fois par process puis réutilisée.
+Les clients externes (MinIO) sont eux aussi partagés. Seuls les services liés
+à la session DB (SessionManager, ConsumptionService...) restent construits à
+chaque exécution, via build_engine().
+
+Après déploiement d'un nouvel agent sur le filesystem, appeler
+invalidate_agents() : la génération publiée dans Redis change et chaque
+process (API, workers Celery) redécouvre ses agents au prochain get_agents() ;
+le catalogue sérialisé en cache Redis (CATALOG_CACHE_KEY) est supprimé en même
+temps. Un slug introuvable déclenche aussi une redécouverte.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Optional
+
+from app.framework.base.agent import BaseAgent
+from app.config import get_settings
+from app.framework.connectors.registry import ConnectorRegistry
+from app.framework.runtime.engine import AgentEngine
+from app.framework.runtime.session import SessionManager
+from app.framework.storage.agent_storage import AgentStorageManager, build_http_client
+from app.framework.tools.registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+# Catalogue des agents sérialisé (JSON) partagé entre les process API
+CATALOG_CACHE_KEY = "agent_runtime:catalog:v1"
+CATALOG_CACHE_TTL_SECONDS = 600
+# Compteur incrémenté par invalidate_agents() : chaque process compare sa copie
+AGENTS_GENERATION_KEY = "agent_runtime:agents:generation"
+AGENTS_GENERATION_CHECK_SECONDS = 2.0
+REDIS_TIMEOUT_SECONDS = 0.5
+
+_tool_registry: Optional[ToolRegistry] = None
+_connector_registry: Optional[ConnectorRegistry] = None
+_agents: Optional[dict[str, BaseAgent]] = None
+# Génération Redis correspondant à _agents, et horodatages (time.monotonic)
+_agents_generation: Optional[int] = None
+_agents_loaded_at = 0.0
+_generation_checked_at = 0.0
+_redis_client = None
+_storage_manager: Optional[AgentStorageManager] = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Retourne le registre de tools du process (découverte au premier appel)."""
+    global _tool_registry
+    if _tool_registry is None:
+        registry = ToolRegistry(
+            health_check_concurrency=get_settings().TOOLS_HEALTHCHECK_CONCURRENCY,
+        )
+        registry.discover()
+        _tool_registry = registry
+    return _tool_registry
+
+
+def get_connector_registry() -> ConnectorRegistry:
+    """Retourne le registre de connecteurs du process (découverte au premier appel)."""
+    global _connector_registry
+    if _connector_registry is None:
+        registry = ConnectorRegistry()
+        registry.discover()
+        _connector_registry = registry
+    return _connector_registry
+
+
+def _get_redis():
+    """Client Redis synchrone partagé (pool du process), timeouts courts."""
+    global _redis_client
+    if _redis_client is None:
+        import redis
+
+        settings = get_settings()
+        _redis_client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        )
+    return _redis_client
+
+
+def _read_agents_generation() -> Optional[int]:
+    """Génération des agents publiée dans Redis (None si Redis est indisponible)."""
+    try:
+        value = _get_redis().get(AGENTS_GENERATION_KEY)
+    except Exception as e:
+        logger.warning(f"Could not read agents generation: {e}")
+        return None
+    return int(value) if value is not None else 0
+
+
+def _discover_agents() -> dict[str, BaseAgent]:
+    global _agents, _agents_loaded_at
+    loader = AgentEngine(
+        db_session=None,
+        tool_registry=get_tool_registry(),
+        connector_registry=get_connector_registry(),
+        session_manager=None,
+    )
+    loader.discover_agents()
+    _agents = {m.slug: loader.get_agent(m.slug) for m in loader.list_agents()}
+    _agents_loaded_at = time.monotonic()
+    return _agents
+
+
+def get_agents(generation: Optional[int] = None) -> dict[str, BaseAgent]:
+    """
+    Retourne les agents chargés depuis le filesystem, indexés par slug.
+
+    La découverte est réutilisée tant que la génération publiée dans Redis par
+    invalidate_agents() ne change pas ; elle est relue au plus toutes les
+    AGENTS_GENERATION_CHECK_SECONDS. Les autres process (API, workers Celery)
+    voient ainsi un agent importé sans redémarrage.
+
+    Args:
+        generation: Génération déjà lue par l'appelant (client Redis async) ;
+            évite la lecture synchrone et le délai de revérification
+    """
+    global _agents_generation, _generation_checked_at
+    now = time.monotonic()
+    if generation is None:
+        if _agents is not None and now - _generation_checked_at < AGENTS_GENERATION_CHECK_SECONDS:
+            return _agents
+        generation = _read_agents_generation()
+    _generation_checked_at = now
+    if _agents is not None and (generation is None or generation == _agents_generation):
+        return _agents
+
+    if generation is not None:
+        _agents_generation = generation
+    return _discover_agents()
+
+
+def reload_agents_on_miss() -> dict[str, BaseAgent]:
+    """
+    Redécouvre les agents après un slug introuvable (au plus une fois par
+    AGENTS_GENERATION_CHECK_SECONDS, pour qu'un slug inconnu ne rescanne pas le
+    filesystem à chaque requête).
+    """
+    if _agents is not None and time.monotonic() - _agents_loaded_at < AGENTS_GENERATION_CHECK_SECONDS:
+        return _agents
+    return _discover_agents()
+
+
+def invalidate_agents() -> None:
+    """
+    Force une nouvelle découverte des agents, dans tous les process.
+
+    Incrémente la génération dans Redis (relue par get_agents()) et supprime
+    le catalogue sérialisé. I/O Redis bloquantes : depuis du code async,
+    appeler via run_in_threadpool.
+    """
+    global _agents
+    _agents = None
+
+    try:
+        client = _get_redis()
+        client.incr(AGENTS_GENERATION_KEY)
+        client.delete(CATALOG_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Could not publish agents invalidation: {e}")
+
+
+def get_storage_manager() -> AgentStorageManager:
+    """
+    Retourne le gestionnaire de stockage MinIO du process.
+
+    Le client et la vérification du bucket ne sont faits qu'une fois ; si MinIO
+    est injoignable, l'exception remonte et le prochain appel réessaie.
+    """
+    global _storage_manager
+    if _storage_manager is None:
+        settings = get_settings()
+        _storage_manager = AgentStorageManager(
+            endpoint=settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            bucket=settings.MINIO_STORAGE_BUCKET,
+            secure=settings.MINIO_SECURE,
+            http_client=build_http_client(settings.MINIO_POOL_MAXSIZE),
+        )
+    return _storage_manager
+
+
+def build_engine(
+    db_session: Any,
+    session_manager: Optional[SessionManager] = None,
+    **services: Any,
+) -> AgentEngine:
+    """
+    Construit un AgentEngine pour une exécution, sur les registres partagés.
+
+    Args:
+        db_session: Session DB de la requête / du job
+        session_manager: SessionManager à réutiliser (créé sur db_session sinon)
+        **services: Services optionnels (vault_service, consumption_service,
+            storage_service...) transmis tels quels à AgentEngine
+
+    Returns:
+        AgentEngine avec les agents déjà chargés
+    """
+    engine = AgentEngine(
+        db_session=db_session,
+        tool_registry=get_tool_registry(),
+        connector_registry=get_connector_registry(),
+        session_manager=session_manager or SessionManager(db_session),
+        **services,
+    )
+    engine.use_agents(get_agents(), reload=reload_agents_on_miss)
+    return engine
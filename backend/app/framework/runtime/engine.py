@@ -14,7 +14,7 @@ import importlib
 import importlib.util
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from app.framework.base.agent import BaseAgent
 from app.framework.runtime.context import (
@@ -70,6 +70,7 @@ class AgentEngine:
 
         # Cache des agents chargés
         self._agents: dict[str, BaseAgent] = {}
+        self._reload_agents: Optional[Callable[[], dict[str, BaseAgent]]] = None
 
         # Pipeline d'exécution
         self._pipeline = ExecutionPipeline(
@@ -115,6 +116,22 @@ class AgentEngine:
         logger.info(f"Total agents discovered: {len(discovered)}")
         return discovered
 
+    def use_agents(
+        self,
+        agents: dict[str, BaseAgent],
+        reload: Optional[Callable[[], dict[str, BaseAgent]]] = None,
+    ) -> None:
+        """
+        Réutilise des agents déjà chargés au lieu de rescanner le filesystem.
+
+        Args:
+            agents: Dict slug → instance de BaseAgent (cf. runtime.bootstrap)
+            reload: Rechargement appelé une fois si un slug est introuvable
+                (agent importé depuis un autre process)
+        """
+        self._agents = dict(agents)
+        self._reload_agents = reload
+
     def _load_agent(self, dir_name: str, agent_py: Path) -> Optional[BaseAgent]:
         """
         Charge un agent depuis son fichier agent.py.
@@ -158,7 +175,12 @@ class AgentEngine:
         Returns:
             Instance de BaseAgent ou None
         """
-        return self._agents.get(slug)
+        agent = self._agents.get(slug)
+        if agent is None and self._reload_agents is not None:
+            reload, self._reload_agents = self._reload_agents, None
+            self._agents = dict(reload())
+            agent = self._agents.get(slug)
+        return agent
 
     def list_agents(self) -> list[AgentManifest]:
         """
@@ -283,8 +305,7 @@ class AgentEngine:
         else:
             # Le frontend peut fournir un session_id custom ;
             # s'il n'existe pas encore en base, on le crée.
-            existing = await self._session_manager.get_session(session_id)
-            if not existing:
+            if not await self._session_manager.session_exists(session_id):
                 await self._session_manager.create_session_with_id(
                     session_id=session_id,
                     agent_slug=agent_slug,
@@ -399,24 +420,35 @@ class AgentEngine:
         """
         from sqlalchemy import text
 
-        # 1. Chercher une config spécifique à l'agent
-        agent_config_result = await self._db.execute(
-            text(
-                """
-                SELECT p.slug as provider_slug, p.base_url, m.slug as model_slug
-                FROM agent_llm_configs alc
-                JOIN llm_providers p ON p.id = alc.provider_id
-                JOIN llm_models m ON m.id = alc.model_id
-                WHERE alc.agent_slug = :agent_slug
-                  AND alc.is_active = true
-                  AND p.is_active = true
-                  AND m.is_active = true
-                LIMIT 1
-                """
-            ),
-            {"agent_slug": agent_slug},
+        from app.services.agent_llm_config_cache import (
+            CachedLLMConfig,
+            get_agent_llm_config_cache,
         )
-        row = agent_config_result.fetchone()
+
+        # 1. Chercher une config spécifique à l'agent (mise en cache, TTL court)
+        async def load_agent_config() -> Optional[CachedLLMConfig]:
+            result = await self._db.execute(
+                text(
+                    """
+                    SELECT p.slug as provider_slug, p.base_url, m.slug as model_slug
+                    FROM agent_llm_configs alc
+                    JOIN llm_providers p ON p.id = alc.provider_id
+                    JOIN llm_models m ON m.id = alc.model_id
+                    WHERE alc.agent_slug = :agent_slug
+                      AND alc.is_active = true
+                      AND p.is_active = true
+                      AND m.is_active = true
+                    LIMIT 1
+                    """
+                ),
+                {"agent_slug": agent_slug},
+            )
+            found = result.fetchone()
+            if not found:
+                return None
+            return CachedLLMConfig(found.provider_slug, found.model_slug, found.base_url)
+
+        row = await get_agent_llm_config_cache().get_or_load(agent_slug, load_agent_config)
 
         # 2. Fallback: premier provider/model actif qui possède une clé API
         if not row:
@@ -7,11 +7,14 @@ Les sessions persistent les messages et l'état de la conversation.
 
 from __future__ import annotations
 
+import json
 import logging
-import uuid
 from datetime import datetime
 from typing import Any, Optional
 
+from sqlalchemy import text
+
+from app.database import uuid7
 from app.framework.schemas import (
     MessageRole,
     SessionInfo,
@@ -20,6 +23,50 @@ from app.framework.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Requêtes de listing construites une fois (text() est mis en cache par SQLAlchemy).
+# La page est sélectionnée d'abord, puis agrégée sur ses seuls messages.
+_LIST_SESSIONS_SQL = text(
+    """
+    WITH page AS (
+        SELECT *, COUNT(*) OVER() AS total_count FROM agent_sessions
+        WHERE agent_slug = :slug AND user_id = :uid
+        ORDER BY updated_at DESC
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT page.*, stats.message_count, stats.last_message_at
+    FROM page
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) AS message_count, MAX(m.timestamp) AS last_message_at
+        FROM agent_session_messages m
+        WHERE m.session_id = page.session_id
+    ) stats ON true
+    ORDER BY page.updated_at DESC
+    """
+)
+_COUNT_SESSIONS_SQL = text(
+    "SELECT COUNT(*) FROM agent_sessions WHERE agent_slug = :slug AND user_id = :uid"
+)
+_SESSION_EXISTS_SQL = text("SELECT 1 FROM agent_sessions WHERE session_id = :sid")
+_SESSION_COLUMNS = "session_id, agent_slug, user_id, title, is_active, created_at, updated_at"
+_LOAD_SESSION_SQL = text(
+    f"SELECT {_SESSION_COLUMNS} FROM agent_sessions WHERE session_id = :sid"
+)
+_LOAD_OWNED_SESSION_SQL = text(
+    f"SELECT {_SESSION_COLUMNS} FROM agent_sessions WHERE session_id = :sid AND user_id = :uid"
+)
+
+
+def _json_column(value: Any, default: Any) -> Any:
+    """Valeur d'une colonne JSONB (déjà décodée par le driver).
+
+    Tolère les anciennes lignes TEXT tant que la migration n'a pas tourné.
+    """
+    if not value:
+        return default
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
 
 class SessionManager:
     """
@@ -48,7 +95,7 @@ class SessionManager:
         Returns:
             SessionInfo avec l'ID de la nouvelle session
         """
-        session_id = str(uuid.uuid4())
+        session_id = str(uuid7())
         session = SessionInfo(
             session_id=session_id,
             agent_slug=agent_slug,
@@ -100,7 +147,9 @@ class SessionManager:
         )
         return session
 
-    async def get_session(self, session_id: str) -> Optional[SessionInfo]:
+    async def get_session(
+        self, session_id: str, user_id: Optional[int] = None
+    ) -> Optional[SessionInfo]:
         """
         Récupère une session par son ID.
 
@@ -108,18 +157,41 @@ class SessionManager:
 
         Args:
             session_id: ID de la session
+            user_id: Si fourni, seule une session de cet utilisateur est
+                retournée (filtre SQL : les messages d'une session d'un
+                autre utilisateur ne sont jamais chargés)
 
         Returns:
-            SessionInfo ou None si introuvable
+            SessionInfo ou None si introuvable (ou non possédée)
         """
         # Essayer le cache d'abord
         if self._redis:
             cached = await self._get_cached_session(session_id)
             if cached:
+                if user_id is not None and str(cached.user_id) != str(user_id):
+                    return None
                 return cached
 
         # Sinon aller en base
-        return await self._load_session(session_id)
+        return await self._load_session(session_id, user_id)
+
+    async def session_exists(self, session_id: str) -> bool:
+        """
+        Vérifie l'existence d'une session sans charger ses messages.
+
+        Args:
+            session_id: ID de la session
+
+        Returns:
+            True si la session existe
+        """
+        if self._redis:
+            cached = await self._get_cached_session(session_id)
+            if cached:
+                return True
+
+        result = await self._db.execute(_SESSION_EXISTS_SQL, {"sid": session_id})
+        return result.first() is not None
 
     async def add_message(
         self,
@@ -195,7 +267,7 @@ class SessionManager:
         user_id: int,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[SessionInfo]:
+    ) -> tuple[list[SessionInfo], int]:
         """
         Liste les sessions d'un utilisateur pour un agent.
 
@@ -206,7 +278,8 @@ class SessionManager:
             offset: Offset pour la pagination
 
         Returns:
-            Liste de SessionInfo ordonnés par date décroissante
+            (page de SessionInfo ordonnés par date décroissante,
+             nombre total de sessions hors pagination)
         """
         return await self._list_sessions_from_db(agent_slug, user_id, limit, offset)
 
@@ -228,8 +301,6 @@ class SessionManager:
 
     async def _persist_session(self, session: SessionInfo) -> None:
         """Persiste une session en base."""
-        from sqlalchemy import text
-
         await self._db.execute(
             text(
                 """
@@ -251,9 +322,8 @@ class SessionManager:
 
     async def _persist_message(self, session_id: str, message: SessionMessage) -> None:
         """Persiste un message en base."""
-        import json
-
-        from sqlalchemy import text
+        from sqlalchemy import bindparam
+        from sqlalchemy.dialects.postgresql import JSONB
 
         await self._db.execute(
             text(
@@ -261,28 +331,31 @@ class SessionManager:
                 INSERT INTO agent_session_messages (session_id, role, content, attachments, metadata, timestamp)
                 VALUES (:session_id, :role, :content, :attachments, :metadata, :timestamp)
                 """
+            ).bindparams(
+                bindparam("attachments", type_=JSONB),
+                bindparam("metadata", type_=JSONB),
             ),
             {
                 "session_id": session_id,
                 "role": message.role.value,
                 "content": message.content,
-                "attachments": json.dumps(
-                    [a.model_dump() for a in message.attachments]
-                ),
-                "metadata": json.dumps(message.metadata),
+                "attachments": [a.model_dump(mode="json") for a in message.attachments],
+                "metadata": message.metadata,
                 "timestamp": message.timestamp,
             },
         )
         await self._db.commit()
 
-    async def _load_session(self, session_id: str) -> Optional[SessionInfo]:
-        """Charge une session depuis la base."""
-        from sqlalchemy import text
-
-        result = await self._db.execute(
-            text("SELECT * FROM agent_sessions WHERE session_id = :sid"),
-            {"sid": session_id},
-        )
+    async def _load_session(
+        self, session_id: str, user_id: Optional[int] = None
+    ) -> Optional[SessionInfo]:
+        """Charge une session depuis la base (restreinte à user_id si fourni)."""
+        if user_id is None:
+            result = await self._db.execute(_LOAD_SESSION_SQL, {"sid": session_id})
+        else:
+            result = await self._db.execute(
+                _LOAD_OWNED_SESSION_SQL, {"sid": session_id, "uid": str(user_id)}
+            )
         row = result.fetchone()
         if not row:
             return None
@@ -303,11 +376,10 @@ class SessionManager:
         self, session_id: str, limit: Optional[int] = None
     ) -> list[SessionMessage]:
         """Charge les messages d'une session depuis la base."""
-        import json
-
-        from sqlalchemy import text
-
-        query = "SELECT * FROM agent_session_messages WHERE session_id = :sid ORDER BY timestamp ASC"
+        query = (
+            "SELECT role, content, attachments, metadata, timestamp FROM agent_session_messages "
+            "WHERE session_id = :sid ORDER BY timestamp ASC"
+        )
         if limit:
             query += f" LIMIT {limit}"
 
@@ -318,8 +390,8 @@ class SessionManager:
             SessionMessage(
                 role=MessageRole(row.role),
                 content=row.content,
-                attachments=json.loads(row.attachments) if row.attachments else [],
-                metadata=json.loads(row.metadata) if row.metadata else {},
+                attachments=_json_column(row.attachments, []),
+                metadata=_json_column(row.metadata, {}),
                 timestamp=row.timestamp,
             )
             for row in rows
@@ -327,8 +399,6 @@ class SessionManager:
 
     async def _delete_messages(self, session_id: str) -> None:
         """Supprime les messages d'une session en base."""
-        from sqlalchemy import text
-
         await self._db.execute(
             text("DELETE FROM agent_session_messages WHERE session_id = :sid"),
             {"sid": session_id},
@@ -337,22 +407,22 @@ class SessionManager:
 
     async def _list_sessions_from_db(
         self, agent_slug: str, user_id: int, limit: int, offset: int
-    ) -> list[SessionInfo]:
-        """Liste les sessions depuis la base."""
-        from sqlalchemy import text
+    ) -> tuple[list[SessionInfo], int]:
+        """Liste les sessions depuis la base, avec le total via COUNT(*) OVER()."""
+        # agent_sessions.user_id est un VARCHAR : asyncpg refuse un int
+        params = {"slug": agent_slug, "uid": str(user_id), "limit": limit, "offset": offset}
+        result = await self._db.execute(_LIST_SESSIONS_SQL, params)
+        rows = result.fetchall()
 
-        result = await self._db.execute(
-            text(
-                """
-                SELECT * FROM agent_sessions
-                WHERE agent_slug = :slug AND user_id = :uid
-                ORDER BY updated_at DESC
-                LIMIT :limit OFFSET :offset
-                """
-            ),
-            {"slug": agent_slug, "uid": user_id, "limit": limit, "offset": offset},
-        )
-        return [
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            # Page au-delà de la fin : la fenêtre n'a rien renvoyé
+            total = await self._db.scalar(_COUNT_SESSIONS_SQL, params)
+        else:
+            total = 0
+
+        sessions = [
             SessionInfo(
                 session_id=row.session_id,
                 agent_slug=row.agent_slug,
@@ -361,14 +431,15 @@ class SessionManager:
                 is_active=row.is_active,
                 created_at=row.created_at,
                 updated_at=row.updated_at,
+                message_count=row.message_count,
+                last_message_at=row.last_message_at,
             )
-            for row in result.fetchall()
+            for row in rows
         ]
+        return sessions, total
 
     async def _update_session_status(self, session_id: str, is_active: bool) -> None:
         """Met à jour le statut d'une session."""
-        from sqlalchemy import text
-
         await self._db.execute(
             text(
                 "UPDATE agent_sessions SET is_active = :active, updated_at = NOW() WHERE session_id = :sid"
@@ -366,6 +366,8 @@ class SessionInfo(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
+    message_count: int = 0
+    last_message_at: Optional[datetime] = None
 
 
 # =============================================================================
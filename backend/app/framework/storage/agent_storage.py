@@ -28,14 +28,72 @@ Le framework traduit automatiquement en:
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
-from typing import Optional
+import mimetypes
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, NamedTuple, Optional
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.deleteobjects import DeleteObject
+from minio.error import S3Error
 
 logger = logging.getLogger(__name__)
 
+# Taille des parts pour les uploads multipart de taille inconnue
+STREAM_PART_SIZE = 8 * 1024 * 1024
+# Taille des blocs lus depuis MinIO pour les téléchargements en flux
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Nombre max de clés par requête DeleteObjects (limite S3)
+DELETE_BATCH_SIZE = 1000
+
+
+def build_http_client(maxsize: int) -> urllib3.PoolManager:
+    """
+    Pool HTTP du client MinIO (mêmes timeouts/retries que le défaut du SDK).
+
+    Le défaut du SDK garde 10 connexions par hôte : au-delà, les appels faits
+    depuis le threadpool ouvrent puis jettent des connexions TCP/TLS.
+    """
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=300, read=300),
+        maxsize=maxsize,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
+class ObjectInfo(NamedTuple):
+    """Entrée de listing : métadonnées renvoyées par ListObjects."""
+
+    key: str
+    size: int
+    content_type: str
+    last_modified: Optional[datetime]
+    etag: Optional[str]
+
+
+class ObjectStream(NamedTuple):
+    """Objet MinIO ouvert en lecture, consommé bloc par bloc."""
+
+    size: Optional[int]
+    content_type: str
+    chunks: AsyncIterator[bytes]
+    # "bytes start-end/total" quand seule une plage a été demandée
+    content_range: Optional[str] = None
+
+
+class InvalidRangeError(ValueError):
+    """Plage d'octets demandée hors de l'objet (HTTP 416)."""
+
 
 class AgentStorageManager:
     """
@@ -52,12 +110,14 @@ class AgentStorageManager:
         secret_key: str,
         bucket: str = "nova2-storage",
         secure: bool = False,
+        http_client: Optional[urllib3.PoolManager] = None,
     ):
         self._client = Minio(
             endpoint=endpoint,
             access_key=access_key,
             secret_key=secret_key,
             secure=secure,
+            http_client=http_client,
         )
         self._bucket = bucket
         self._ensure_bucket()
@@ -175,6 +235,39 @@ class ScopedAgentStorage:
         logger.info(f"Storage put: {full_key} ({len(data)} bytes)")
         return full_key
 
+    async def put_stream(
+        self,
+        key: str,
+        stream: BinaryIO,
+        length: Optional[int] = None,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Stocke un fichier depuis un flux, sans le charger en mémoire.
+
+        Args:
+            key: Chemin relatif (ex: "uploads/data.csv")
+            stream: Objet fichier binaire lisible
+            length: Taille en octets si connue (sinon upload multipart par parts)
+            content_type: Type MIME
+
+        Returns:
+            Chemin complet dans MinIO
+        """
+        full_key = self._resolve_key(key)
+        size = length if length is not None and length >= 0 else -1
+        await asyncio.to_thread(
+            self._client.put_object,
+            self._bucket,
+            full_key,
+            stream,
+            length=size,
+            content_type=content_type,
+            part_size=STREAM_PART_SIZE if size < 0 else 0,
+        )
+        logger.info(f"Storage put (stream): {full_key} ({size if size >= 0 else 'unknown'} bytes)")
+        return full_key
+
     async def get(self, key: str) -> Optional[bytes]:
         """
         Récupère un fichier.
@@ -195,6 +288,62 @@ class ScopedAgentStorage:
         except Exception:
             return None
 
+    async def get_stream(
+        self,
+        key: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        byte_range: Optional[str] = None,
+    ) -> Optional[ObjectStream]:
+        """
+        Ouvre un fichier en lecture par blocs, sans le charger en mémoire.
+
+        L'absence du fichier est détectée à l'ouverture, avant le premier bloc.
+
+        Args:
+            key: Chemin relatif
+            chunk_size: Taille des blocs lus
+            byte_range: En-tête Range à une seule plage ("bytes=0-1023",
+                "bytes=1024-", "bytes=-512"), transmis tel quel à MinIO
+
+        Returns:
+            ObjectStream (taille, type MIME, itérateur async) ou None si introuvable
+
+        Raises:
+            InvalidRangeError: Si la plage est hors de l'objet
+        """
+        full_key = self._resolve_key(key)
+        headers = {"Range": byte_range} if byte_range else None
+        try:
+            response = await asyncio.to_thread(
+                self._client.get_object, self._bucket, full_key, request_headers=headers
+            )
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                return None
+            if e.code == "InvalidRange":
+                raise InvalidRangeError(byte_range) from e
+            raise
+
+        async def chunks() -> AsyncIterator[bytes]:
+            iterator = response.stream(chunk_size)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(next, iterator, None)
+                    if chunk is None:
+                        break
+                    yield chunk
+            finally:
+                response.close()
+                response.release_conn()
+
+        length = response.headers.get("Content-Length")
+        return ObjectStream(
+            size=int(length) if length is not None else None,
+            content_type=response.headers.get("Content-Type") or "application/octet-stream",
+            chunks=chunks(),
+            content_range=response.headers.get("Content-Range") if response.status == 206 else None,
+        )
+
     async def delete(self, key: str) -> bool:
         """
         Supprime un fichier.
@@ -213,6 +362,39 @@ class ScopedAgentStorage:
         except Exception:
             return False
 
+    async def delete_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Supprime plusieurs fichiers via DeleteObjects (1000 clés par requête).
+
+        Args:
+            keys: Chemins relatifs
+
+        Returns:
+            Dict chemin relatif → message d'erreur, pour les seules clés en échec
+            (clés refusées par _resolve_key comprises : elles ne bloquent pas le lot)
+        """
+        rejected: dict[str, str] = {}
+        relative: dict[str, str] = {}
+        for k in keys:
+            try:
+                relative[self._resolve_key(k)] = k
+            except ValueError as e:
+                rejected[k] = str(e)
+        full_keys = list(relative)
+
+        def remove() -> dict[str, str]:
+            errors: dict[str, str] = dict(rejected)
+            for i in range(0, len(full_keys), DELETE_BATCH_SIZE):
+                batch = [DeleteObject(k) for k in full_keys[i:i + DELETE_BATCH_SIZE]]
+                # remove_objects est paresseux : l'itération envoie les requêtes
+                for err in self._client.remove_objects(self._bucket, batch):
+                    errors[relative.get(err.name, err.name)] = err.message or err.code
+            return errors
+
+        errors = await asyncio.to_thread(remove) if full_keys else dict(rejected)
+        logger.info(f"Storage delete_many: {len(keys) - len(errors)}/{len(keys)} deleted")
+        return errors
+
     async def list(self, prefix: str = "") -> list[str]:
         """
         Liste les fichiers avec un préfixe.
@@ -233,6 +415,40 @@ class ScopedAgentStorage:
             if not obj.is_dir
         ]
 
+    async def list_with_meta(self, prefix: str = "") -> list[ObjectInfo]:
+        """
+        Liste les fichiers avec leurs métadonnées, en un seul ListObjects.
+
+        Args:
+            prefix: Sous-chemin (ex: "outputs/")
+
+        Returns:
+            Liste d'ObjectInfo (clés relatives, sans le préfixe user/agent)
+        """
+        full_prefix = self._resolve_key(prefix)
+
+        def walk() -> list[ObjectInfo]:
+            objects = self._client.list_objects(
+                self._bucket, prefix=full_prefix, recursive=True, include_user_meta=True
+            )
+            return [
+                ObjectInfo(
+                    key=obj.object_name[len(self._prefix):],
+                    size=obj.size or 0,
+                    content_type=(
+                        obj.content_type
+                        or mimetypes.guess_type(obj.object_name)[0]
+                        or "application/octet-stream"
+                    ),
+                    last_modified=obj.last_modified,
+                    etag=obj.etag,
+                )
+                for obj in objects
+                if not obj.is_dir
+            ]
+
+        return await asyncio.to_thread(walk)
+
     async def exists(self, key: str) -> bool:
         """
         Vérifie si un fichier existe.
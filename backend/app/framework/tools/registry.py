@@ -38,6 +38,9 @@ logger = logging.getLogger(__name__)
 # Dossier contenant les tools
 TOOLS_ROOT = Path(__file__).parent
 
+# Durée max d'un health check de tool dans health_check_all
+HEALTH_CHECK_TIMEOUT_SECONDS = 3.0
+
 
 class ToolRegistry:
     """
@@ -51,8 +54,17 @@ class ToolRegistry:
         health = await registry.health_check_all()  # Santé de tous les tools
     """
 
-    def __init__(self):
+    def __init__(self, health_check_concurrency: int = 10):
         self._tools: dict[str, BaseTool] = {}
+        # Incrémenté à chaque (dés)enregistrement : invalide les catalogues sérialisés
+        self._version = 0
+        # Borne les sondes simultanées (sockets sortants vers les services des tools)
+        self._health_sem = asyncio.Semaphore(health_check_concurrency)
+
+    @property
+    def version(self) -> int:
+        """Version du catalogue : change dès qu'un tool est ajouté ou retiré."""
+        return self._version
 
     def discover(self, tools_dir: Optional[Path] = None) -> int:
         """
@@ -100,6 +112,7 @@ class ToolRegistry:
         if slug in self._tools:
             logger.warning(f"Tool '{slug}' already registered, replacing")
         self._tools[slug] = tool
+        self._version += 1
         logger.info(
             f"Tool registered: {slug} v{meta.version} "
             f"[{meta.category}] mode={meta.execution_mode.value}"
@@ -117,6 +130,7 @@ class ToolRegistry:
         """
         if slug in self._tools:
             del self._tools[slug]
+            self._version += 1
             logger.info(f"Tool unregistered: {slug}")
             return True
         return False
@@ -245,21 +259,34 @@ class ToolRegistry:
 
     async def health_check_all(self) -> dict[str, HealthCheckResult]:
         """
-        Exécute le health_check de tous les tools.
+        Exécute le health_check de tous les tools, en parallèle.
+
+        Au plus `health_check_concurrency` sondes à la fois, chacune limitée
+        à HEALTH_CHECK_TIMEOUT_SECONDS.
 
         Returns:
             Dict slug → HealthCheckResult
         """
-        results = {}
-        for slug, tool in self._tools.items():
+        probes = [self._probe(slug, tool) for slug, tool in self._tools.items()]
+        return dict(await asyncio.gather(*probes))
+
+    async def _probe(self, slug: str, tool: BaseTool) -> tuple[str, HealthCheckResult]:
+        async with self._health_sem:
             try:
-                results[slug] = await tool.health_check()
+                result = await asyncio.wait_for(
+                    tool.health_check(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                result = HealthCheckResult(
+                    healthy=False,
+                    message=f"Health check timed out after {HEALTH_CHECK_TIMEOUT_SECONDS:g}s",
+                )
             except Exception as e:
-                results[slug] = HealthCheckResult(
+                result = HealthCheckResult(
                     healthy=False,
                     message=f"Health check failed: {str(e)}",
                 )
-        return results
+        return slug, result
 
     async def health_check_tool(self, slug: str) -> Optional[HealthCheckResult]:
         """
@@ -22,13 +22,14 @@ Vérifications:
 from __future__ import annotations
 
 import ast
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from pydantic import ValidationError as PydanticValidationError
+
 from app.framework.schemas import AgentManifest
 
 logger = logging.getLogger(__name__)
@@ -71,7 +72,7 @@ CREDENTIAL_PATTERNS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Erreur de validation."""
 
@@ -82,7 +83,7 @@ class ValidationError:
     severity: str = "error"  # error, warning
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Résultat de la validation d'un agent."""
 
@@ -188,20 +189,16 @@ class AgentValidator:
             result.add_error("NO_MANIFEST", "manifest.json manquant", "manifest.json")
             return None
 
+        # Parsing JSON + validation en une seule passe (pydantic-core)
         try:
-            with open(manifest_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            result.add_error("INVALID_JSON", f"JSON invalide: {e}", "manifest.json")
-            return None
-
-        try:
-            manifest = AgentManifest(**data)
-            return manifest
-        except Exception as e:
-            result.add_error(
-                "INVALID_MANIFEST", f"Manifest invalide: {e}", "manifest.json"
-            )
+            return AgentManifest.model_validate_json(manifest_path.read_bytes())
+        except PydanticValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                result.add_error("INVALID_JSON", f"JSON invalide: {e}", "manifest.json")
+            else:
+                result.add_error(
+                    "INVALID_MANIFEST", f"Manifest invalide: {e}", "manifest.json"
+                )
             return None
 
     def _validate_agent_py(self, agent_dir: Path, result: ValidationResult) -> None:
@@ -247,25 +244,21 @@ class AgentValidator:
 
                         # Vérifier les méthodes
                         for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name == "handle_message":
-                                    has_handle_message = True
-                                    # Vérifier docstring
-                                    if not ast.get_docstring(item):
-                                        result.add_warning(
-                                            "NO_DOCSTRING",
-                                            "handle_message() n'a pas de docstring",
-                                            "agent.py",
-                                            item.lineno,
-                                        )
-                                if item.name == "manifest":
-                                    has_manifest = True
-
-                            if isinstance(item, ast.FunctionDef) and item.name == "manifest":
-                                # C'est un property
-                                for deco in item.decorator_list:
-                                    if isinstance(deco, ast.Name) and deco.id == "property":
-                                        has_manifest = True
+                            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                                continue
+                            if item.name == "handle_message":
+                                has_handle_message = True
+                                # Vérifier docstring
+                                if not ast.get_docstring(item):
+                                    result.add_warning(
+                                        "NO_DOCSTRING",
+                                        "handle_message() n'a pas de docstring",
+                                        "agent.py",
+                                        item.lineno,
+                                    )
+                            elif item.name == "manifest":
+                                # Méthode ou property, le nom suffit
+                                has_manifest = True
 
         if not has_base_agent:
             result.add_error(
@@ -1,94 +1,130 @@
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
+from app.middleware.compression import SelectiveGZipMiddleware
 from app.database import engine, Base, async_session
 from app.models import *
 from app.models.user import User
 from app.models.role import Role, DEFAULT_PERMISSIONS
 from app.services.auth import hash_password
-from app.routers import auth, users, roles, llm_config, consumption, quotas, costs, moderation, agents, system, connectors_api, tools_api, agent_runtime, n8n_workflows, workspaces
+from app.framework.runtime.bootstrap import get_agents, get_storage_manager, invalidate_agents
+from app.services.consumption import start_consumption_batcher, stop_consumption_batcher
+from app.services.n8n_workflows import close_n8n_client
+from app.routers import ROUTERS
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Permissions of the seeded admin role: every action of every resource granted
+_ADMIN_PERMISSIONS = {k: {a: True for a in v} for k, v in DEFAULT_PERMISSIONS.items()}
+
+_CORS_ORIGINS = tuple(o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip())
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_CORS_HEADERS = ("Authorization", "Content-Type", "Range")
+
+
+async def _seed_admin(session: AsyncSession):
+    """Create the admin/user roles and the admin account on first boot."""
+    admin_exists = await session.scalar(
+        select(exists().where(User.email == settings.ADMIN_EMAIL))
+    )
+    if not admin_exists:
+        admin_role = Role(
+            name="admin",
+            description="Full administrator access",
+            permissions=_ADMIN_PERMISSIONS,
+        )
+        session.add(admin_role)
+        await session.flush()
+
+        user_role = Role(
+            name="user",
+            description="Standard user access",
+        )
+        session.add(user_role)
+        await session.flush()
+
+        admin = User(
+            email=settings.ADMIN_EMAIL,
+            username="admin",
+            hashed_password=hash_password(settings.ADMIN_PASSWORD),
+            first_name="Admin",
+            last_name="NOVA2",
+            is_superadmin=True,
+        )
+        session.add(admin)
+        await session.flush()
+
+        from app.models.user import UserRole as UserRoleModel
+        session.add(UserRoleModel(user_id=admin.id, role_id=admin_role.id))
+        await session.commit()
+
 
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with async_session() as session:
-        result = await session.execute(select(User).where(User.email == settings.ADMIN_EMAIL))
-        if not result.scalar_one_or_none():
-            admin_role = Role(
-                name="admin",
-                description="Full administrator access",
-                permissions={k: {a: True for a in v} for k, v in DEFAULT_PERMISSIONS.items()},
-            )
-            session.add(admin_role)
-            await session.flush()
-
-            user_role = Role(
-                name="user",
-                description="Standard user access",
-                permissions=DEFAULT_PERMISSIONS,
-            )
-            session.add(user_role)
-            await session.flush()
-
-            admin = User(
-                email=settings.ADMIN_EMAIL,
-                username="admin",
-                hashed_password=hash_password(settings.ADMIN_PASSWORD),
-                first_name="Admin",
-                last_name="NOVA2",
-                is_superadmin=True,
-            )
-            session.add(admin)
-            await session.flush()
-
-            from app.models.user import UserRole as UserRoleModel
-            session.add(UserRoleModel(user_id=admin.id, role_id=admin_role.id))
-            await session.commit()
-
-    # Auto-sync AI connectors to the DB
+    # One pooled connection for the whole boot sequence: each step commits
+    # its own work, and a failed sync is rolled back so the next one still runs.
     from app.services.connector_sync import sync_connectors_to_db
+    from app.services.agent_sync import sync_agents_to_db
+
     async with async_session() as session:
+        await _seed_admin(session)
+
+        # Auto-sync AI connectors to the DB
         try:
             await sync_connectors_to_db(session)
         except Exception as e:
+            await session.rollback()
             logger.warning(f"Connector sync on startup: {e}")
 
-    # Auto-sync framework agents to the DB
-    from app.services.agent_sync import sync_agents_to_db
-    async with async_session() as session:
+        # Auto-sync framework agents to the DB
         try:
             await sync_agents_to_db(session)
         except Exception as e:
+            await session.rollback()
             logger.warning(f"Agent sync on startup: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    # Le catalogue en cache Redis peut dater du déploiement précédent
+    await run_in_threadpool(invalidate_agents)
+    get_agents()  # découverte tools/connecteurs/agents une fois par process
+    try:
+        get_storage_manager()  # client MinIO partagé, bucket vérifié une fois
+    except Exception as e:
+        logger.warning(f"MinIO unavailable at startup, storage will retry lazily: {e}")
+    start_consumption_batcher(async_session)
     yield
+    await stop_consumption_batcher()
+    await close_n8n_client()
 
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    # Les response_model sont sérialisés par pydantic-core puis encodés par orjson
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip()],
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
 )
 
 
@@ -107,21 +143,8 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(roles.router)
-app.include_router(llm_config.router)
-app.include_router(consumption.router)
-app.include_router(quotas.router)
-app.include_router(costs.router)
-app.include_router(moderation.router)
-app.include_router(agents.router)
-app.include_router(agent_runtime.router)
-app.include_router(system.router)
-app.include_router(connectors_api.router)
-app.include_router(tools_api.router)
-app.include_router(n8n_workflows.router)
-app.include_router(workspaces.router)
+for router in ROUTERS:
+    app.include_router(router)
 
 
 @app.get("/api/health")
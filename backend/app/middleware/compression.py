@@ -0,0 +1,63 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# Payloads that gzip cannot shrink: compressing them only burns CPU
+_PRECOMPRESSED_PREFIXES = ("image/", "video/", "audio/")
+_PRECOMPRESSED_TYPES = frozenset({
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/zstd",
+    "application/pdf",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+})
+
+
+def _skip_compression(message: Message) -> bool:
+    """Whether a response must be sent as is, judged from its start message."""
+    if message["status"] == 206:  # byte ranges refer to the uncompressed body
+        return True
+    headers = Headers(raw=message["headers"])
+    if "content-encoding" in headers:
+        return True
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return (
+        content_type == "text/event-stream"
+        or content_type in _PRECOMPRESSED_TYPES
+        or content_type.startswith(_PRECOMPRESSED_PREFIXES)
+    )
+
+
+class _SelectiveGZipResponder(GZipResponder):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._passthrough = False
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start" and _skip_compression(message):
+            self._passthrough = True
+        if self._passthrough:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip for API responses, skipping range replies, SSE and already-compressed media."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", "") and "range" not in headers:
+                responder = _SelectiveGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
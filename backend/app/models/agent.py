@@ -1,9 +1,8 @@
 import uuid
-from datetime import datetime
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class AgentPermission(Base):
@@ -30,10 +29,11 @@ class Agent(Base):
     system_prompt = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     permissions = relationship("AgentPermission", back_populates="agent", lazy="selectin", cascade="all, delete-orphan")
-    consumptions = relationship("Consumption", back_populates="agent", lazy="selectin")
+    # Unbounded history: never loaded with the agent, query it with filters instead
+    consumptions = relationship("Consumption", back_populates="agent", passive_deletes=True, lazy="raise_on_sql")
     moderation_rules = relationship("ModerationRule", back_populates="agent", lazy="selectin")
     creator = relationship("User", foreign_keys=[created_by])
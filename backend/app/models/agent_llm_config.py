@@ -1,9 +1,8 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class AgentLLMConfig(Base):
@@ -13,14 +12,20 @@ class AgentLLMConfig(Base):
     When set, the agent will use this provider/model instead of the platform default.
     """
     __tablename__ = "agent_llm_configs"
+    __table_args__ = (
+        Index(
+            "ix_agent_llm_configs_active", "agent_slug", "provider_id", "model_id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     agent_slug = Column(String(200), unique=True, nullable=False, index=True)
     provider_id = Column(UUID(as_uuid=True), ForeignKey("llm_providers.id", ondelete="CASCADE"), nullable=False)
     model_id = Column(UUID(as_uuid=True), ForeignKey("llm_models.id", ondelete="CASCADE"), nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     provider = relationship("LLMProvider", lazy="selectin")
     model = relationship("LLMModel", lazy="selectin")
@@ -1,43 +1,56 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class AgentSession(Base):
     __tablename__ = "agent_sessions"
+    # Covers list_sessions (filter user × agent, sort updated_at) as an index-only scan
+    __table_args__ = (
+        Index(
+            "ix_agent_sessions_user_agent_updated", "user_id", "agent_slug", "updated_at",
+            postgresql_include=["session_id", "title", "is_active", "created_at"],
+        ),
+    )
 
     session_id = Column(String(255), primary_key=True)
-    agent_slug = Column(String(200), nullable=False, index=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    agent_slug = Column(String(200), nullable=False)
+    user_id = Column(String(255), nullable=False)
     title = Column(String(500), nullable=True, default="")
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
+    # Message bodies can be large: load them per query (selectinload), never implicitly
     messages = relationship(
         "AgentSessionMessage",
         back_populates="session",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
 class AgentSessionMessage(Base):
     __tablename__ = "agent_session_messages"
+    # Messages are always read per session in chronological order
+    __table_args__ = (
+        Index("ix_agent_session_messages_session_timestamp", "session_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(
         String(255),
         ForeignKey("agent_sessions.session_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     role = Column(String(50), nullable=False)
     content = Column(Text, nullable=False, default="")
-    attachments = Column(Text, nullable=True, default="[]")
-    msg_metadata = Column("metadata", Text, nullable=True, default="{}")
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    attachments = Column(JSONB, nullable=True, default=list)
+    # "metadata" is reserved by the Declarative base, keep it as the column name only
+    message_metadata = Column("metadata", JSONB, nullable=True, default=dict)
+    timestamp = Column(DateTime, server_default=utc_now(), index=True)
 
     session = relationship("AgentSession", back_populates="messages")
@@ -1,26 +1,43 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Column, String, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, uuid7, utc_now
+
+# Costs are stored as integer millionths of the currency unit
+COST_MICROS = 1_000_000
 
 
 class Consumption(Base):
     __tablename__ = "consumptions"
+    # Analytics and quota checks filter on one dimension plus a created_at range
+    __table_args__ = (
+        Index("ix_consumptions_user_created", "user_id", "created_at"),
+        Index("ix_consumptions_agent_created", "agent_id", "created_at"),
+        Index("ix_consumptions_provider_created", "provider_id", "created_at"),
+        Index("ix_consumptions_model_created", "model_id", "created_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.id", ondelete="SET NULL"), nullable=True)
     provider_id = Column(UUID(as_uuid=True), ForeignKey("llm_providers.id", ondelete="SET NULL"), nullable=True)
     model_id = Column(UUID(as_uuid=True), ForeignKey("llm_models.id", ondelete="SET NULL"), nullable=True)
     tokens_in = Column(Integer, nullable=False, default=0)
     tokens_out = Column(Integer, nullable=False, default=0)
-    cost_in = Column(Float, nullable=False, default=0.0)
-    cost_out = Column(Float, nullable=False, default=0.0)
+    cost_in_micros = Column(BigInteger, nullable=False, default=0)
+    cost_out_micros = Column(BigInteger, nullable=False, default=0)
     session_id = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=utc_now(), index=True)
+
+    # Listings read the foreign keys only: a lazy load per row would be an N+1
+    user = relationship("User", back_populates="consumptions", lazy="raise_on_sql")
+    agent = relationship("Agent", back_populates="consumptions", lazy="raise_on_sql")
+    model = relationship("LLMModel", back_populates="consumptions", lazy="raise_on_sql")
+
+    @property
+    def cost_in(self) -> float:
+        return (self.cost_in_micros or 0) / COST_MICROS
 
-    user = relationship("User", back_populates="consumptions")
-    agent = relationship("Agent", back_populates="consumptions")
-    model = relationship("LLMModel", back_populates="consumptions")
+    @property
+    def cost_out(self) -> float:
+        return (self.cost_out_micros or 0) / COST_MICROS
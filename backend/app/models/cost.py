@@ -1,19 +1,17 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, Float, DateTime, ForeignKey, Date
+from sqlalchemy import Column, Numeric, DateTime, ForeignKey, Date
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, uuid7, utc_now
 
 
 class ModelCost(Base):
     __tablename__ = "model_costs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     model_id = Column(UUID(as_uuid=True), ForeignKey("llm_models.id", ondelete="CASCADE"), nullable=False)
-    cost_per_token_in = Column(Float, nullable=False, default=0.0)
-    cost_per_token_out = Column(Float, nullable=False, default=0.0)
+    cost_per_token_in = Column(Numeric(20, 10), nullable=False, default=0)
+    cost_per_token_out = Column(Numeric(20, 10), nullable=False, default=0)
     effective_date = Column(Date, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     model = relationship("LLMModel", back_populates="costs")
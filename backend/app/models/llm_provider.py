@@ -1,35 +1,41 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class LLMProvider(Base):
     __tablename__ = "llm_providers"
+    __table_args__ = (
+        Index("ix_llm_providers_active", "slug", postgresql_where=text("is_active")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), unique=True, nullable=False)
     slug = Column(String(100), unique=True, nullable=False)
     base_url = Column(String(500), nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
-    models = relationship("LLMModel", back_populates="provider", lazy="selectin", cascade="all, delete-orphan")
+    # Collections are loaded per query (selectinload) — never implicitly
+    models = relationship("LLMModel", back_populates="provider", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class LLMModel(Base):
     __tablename__ = "llm_models"
+    __table_args__ = (
+        Index("ix_llm_models_active", "provider_id", "slug", postgresql_where=text("is_active")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     provider_id = Column(UUID(as_uuid=True), ForeignKey("llm_providers.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(200), nullable=False)
     slug = Column(String(200), nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     provider = relationship("LLMProvider", back_populates="models")
-    costs = relationship("ModelCost", back_populates="model", lazy="selectin", cascade="all, delete-orphan")
-    consumptions = relationship("Consumption", back_populates="model", lazy="selectin")
+    costs = relationship("ModelCost", back_populates="model", cascade="all, delete-orphan", passive_deletes=True)
+    consumptions = relationship("Consumption", back_populates="model", passive_deletes=True)
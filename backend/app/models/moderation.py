@@ -1,9 +1,8 @@
 import uuid
-from datetime import datetime
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class ModerationRule(Base):
@@ -18,7 +17,7 @@ class ModerationRule(Base):
     action = Column(String(50), default="redact")  # redact, block, flag, replace
     replacement_template = Column(String(200), nullable=True, default="[REDACTED]")
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     agent = relationship("Agent", back_populates="moderation_rules")
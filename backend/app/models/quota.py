@@ -1,12 +1,17 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Float, Boolean, DateTime
+from sqlalchemy import Column, String, Float, Boolean, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class Quota(Base):
     __tablename__ = "quotas"
+    __table_args__ = (
+        Index(
+            "ix_quotas_active_target", "target_type", "target_id", "quota_type",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     target_type = Column(String(50), nullable=False)  # user, role, agent, provider
@@ -15,5 +20,5 @@ class Quota(Base):
     period = Column(String(50), nullable=False)  # day, week, month, year
     limit_value = Column(Float, nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
@@ -1,9 +1,9 @@
+import copy
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import BigInteger, Column, String, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from app.database import Base
+from sqlalchemy.orm import relationship, validates
+from app.database import Base, utc_now
 
 
 DEFAULT_PERMISSIONS = {
@@ -19,6 +19,44 @@ DEFAULT_PERMISSIONS = {
     "system": {"read": False, "update": False},
 }
 
+# One bit per (resource, action) pair. Append-only: a pair's position is its
+# bit in roles.permissions_mask, so never reorder or remove entries.
+PERMISSION_PAIRS = (
+    ("users", "read"), ("users", "write"), ("users", "delete"),
+    ("roles", "read"), ("roles", "write"), ("roles", "delete"),
+    ("llm_config", "read"), ("llm_config", "write"),
+    ("consumption", "read"),
+    ("quotas", "read"), ("quotas", "write"),
+    ("costs", "read"), ("costs", "write"),
+    ("moderation", "read"), ("moderation", "write"),
+    ("agents", "read"), ("agents", "write"), ("agents", "delete"),
+    ("agents", "export"), ("agents", "import"),
+    ("catalog_management", "read"), ("catalog_management", "write"),
+    ("system", "read"), ("system", "update"),
+)
+PERMISSION_BITS = {pair: 1 << i for i, pair in enumerate(PERMISSION_PAIRS)}
+
+
+def permissions_to_mask(permissions: dict | None) -> int:
+    mask = 0
+    for resource, actions in (permissions or {}).items():
+        if not isinstance(actions, dict):
+            continue
+        for action, allowed in actions.items():
+            if allowed:
+                mask |= PERMISSION_BITS.get((resource, action), 0)
+    return mask
+
+
+def mask_to_permissions(mask: int) -> dict:
+    permissions: dict = {}
+    for (resource, action), bit in PERMISSION_BITS.items():
+        permissions.setdefault(resource, {})[action] = bool(mask & bit)
+    return permissions
+
+
+DEFAULT_PERMISSIONS_MASK = permissions_to_mask(DEFAULT_PERMISSIONS)
+
 
 class Role(Base):
     __tablename__ = "roles"
@@ -26,9 +64,16 @@ class Role(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), unique=True, nullable=False)
     description = Column(String(500), nullable=True)
-    permissions = Column(JSONB, default=DEFAULT_PERMISSIONS)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    permissions = Column(JSONB, default=lambda: copy.deepcopy(DEFAULT_PERMISSIONS))
+    # Packed view of `permissions` (see PERMISSION_PAIRS), kept in sync on assignment
+    permissions_mask = Column(BigInteger, nullable=False, default=DEFAULT_PERMISSIONS_MASK, server_default="0")
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     users = relationship("User", secondary="user_roles", back_populates="roles", lazy="selectin")
     agent_permissions = relationship("AgentPermission", back_populates="role", lazy="selectin")
+
+    @validates("permissions")
+    def _sync_permissions_mask(self, key, value):
+        self.permissions_mask = permissions_to_mask(value)
+        return value
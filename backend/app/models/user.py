@@ -1,17 +1,18 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Table
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class UserRole(Base):
     __tablename__ = "user_roles"
+    # The (user_id, role_id) primary key already serves lookups by user
+    __table_args__ = (Index("ix_user_roles_role", "role_id"),)
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    assigned_at = Column(DateTime, default=datetime.utcnow)
+    assigned_at = Column(DateTime, server_default=utc_now())
 
 
 class User(Base):
@@ -26,8 +27,8 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superadmin = Column(Boolean, default=False)
     preferred_language = Column(String(5), default="en")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     roles = relationship("Role", secondary="user_roles", back_populates="users", lazy="selectin")
-    consumptions = relationship("Consumption", back_populates="user", lazy="selectin")
+    consumptions = relationship("Consumption", back_populates="user", passive_deletes=True)
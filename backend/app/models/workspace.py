@@ -7,13 +7,12 @@ tandis que les sessions de chat restent individuelles.
 """
 
 import uuid
-from datetime import datetime
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.database import Base
+from app.database import Base, uuid7, utc_now
 
 
 class Workspace(Base):
@@ -24,8 +23,8 @@ class Workspace(Base):
     description = Column(Text, nullable=True)
     agent_slug = Column(String(200), nullable=False, index=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     is_active = Column(Boolean, default=True)
 
     members = relationship("WorkspaceMember", back_populates="workspace", cascade="all, delete-orphan", lazy="selectin")
@@ -34,12 +33,16 @@ class Workspace(Base):
 
 class WorkspaceMember(Base):
     __tablename__ = "workspace_members"
+    __table_args__ = (
+        Index("ix_workspace_members_workspace_user", "workspace_id", "user_id", unique=True),
+        Index("ix_workspace_members_user", "user_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     role = Column(String(50), default="member")  # 'owner' | 'member'
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    joined_at = Column(DateTime, server_default=utc_now())
 
     workspace = relationship("Workspace", back_populates="members")
     user = relationship("User")
@@ -0,0 +1,23 @@
+from app.routers import (
+    auth, users, roles, llm_config, consumption, quotas, costs, moderation,
+    agents, agent_runtime, system, connectors_api, tools_api, n8n_workflows, workspaces,
+)
+
+# API routers mounted by app.main, in registration order
+ROUTERS = (
+    auth.router,
+    users.router,
+    roles.router,
+    llm_config.router,
+    consumption.router,
+    quotas.router,
+    costs.router,
+    moderation.router,
+    agents.router,
+    agent_runtime.router,
+    system.router,
+    connectors_api.router,
+    tools_api.router,
+    n8n_workflows.router,
+    workspaces.router,
+)
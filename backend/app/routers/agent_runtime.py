@@ -4,6 +4,7 @@ Agent Runtime API — Endpoints d'exécution des agents.
 Endpoints:
     GET  /api/agent-runtime/catalog           — Catalogue des agents chargés
     GET  /api/agent-runtime/jobs/{job_id}     — Statut d'un job
+    GET  /api/agent-runtime/jobs/{job_id}/wait — Attend la fin d'un job (long-poll)
     GET  /api/agent-runtime/sessions/{sid}    — Détail d'une session
     GET  /api/agent-runtime/config/llm        — Liste configs LLM par agent
     GET  /api/agent-runtime/config/llm/{slug} — Config LLM d'un agent
@@ -20,19 +21,56 @@ doivent être déclarées AVANT les routes paramétriques (/{slug}/*) pour
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import re
 import uuid
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File as FastAPIFile
-from pydantic import BaseModel, Field
-
+from celery import states as celery_states
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, UploadFile, File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+import redis.asyncio as aioredis
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import get_db, utc_now, uuid7
+from app.framework.runtime.bootstrap import (
+    AGENTS_GENERATION_KEY,
+    CATALOG_CACHE_KEY,
+    CATALOG_CACHE_TTL_SECONDS,
+    build_engine,
+    get_agents,
+    get_storage_manager,
+)
+from app.framework.runtime.engine import AgentEngine
+from app.framework.runtime.session import SessionManager
+from app.framework.schemas import SessionInfo, UserMessage
+from app.framework.storage.agent_storage import InvalidRangeError
 from app.middleware.auth import get_current_user
+from app.models.agent_llm_config import AgentLLMConfig
+from app.models.llm_provider import LLMModel, LLMProvider
+from app.services.consumption import ConsumptionService
+from app.services.vault import get_vault_service
+from app.services.agent_llm_config_cache import get_agent_llm_config_cache
+from app.tasks.agent_tasks import execute_agent_stream_task, execute_agent_task
+from app.worker import celery_app
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/agent-runtime", tags=["Agent Runtime"])
 
+# Admission control : un pic de requêtes attend ici au lieu d'épuiser les
+# pools broker/DB et de finir en 5xx
+_settings = get_settings()
+_TASK_SUBMIT_SEM = asyncio.Semaphore(_settings.MAX_INFLIGHT_SUBMITS)
+_SYNC_CHAT_SEM = asyncio.Semaphore(_settings.MAX_SYNC_CHATS)
+
 
 # =============================================================================
 # Request / Response schemas
@@ -117,75 +155,130 @@ class AgentLLMConfigResponse(BaseModel):
 class SessionListResponse(BaseModel):
     """Liste des sessions."""
 
-    sessions: list[dict[str, Any]]
+    sessions: list[SessionInfo]
     total: int
 
 
 # =============================================================================
-# Static routes — MUST come before parametric /{slug}/* routes
+# Dependencies
 # =============================================================================
 
 
-@router.get("/catalog", response_model=list[AgentInfo])
-async def get_agent_catalog(
-    current_user=Depends(get_current_user),
-):
+def get_engine(db: AsyncSession = Depends(get_db)) -> AgentEngine:
     """
-    Retourne le catalogue des agents chargés.
+    AgentEngine de la requête, construit sur les registres et agents partagés.
 
-    Liste tous les agents disponibles avec leurs métadonnées.
+    Seuls les services liés à la session DB de la requête sont recréés ;
+    aucune découverte tools/connecteurs/agents n'a lieu ici.
     """
-    from app.framework.runtime.engine import AgentEngine
-    from app.framework.connectors.registry import ConnectorRegistry
-    from app.framework.runtime.session import SessionManager
-    from app.framework.tools.registry import ToolRegistry
-    from app.database import async_session
-
-    async with async_session() as db:
-        tool_registry = ToolRegistry()
-        connector_registry = ConnectorRegistry()
-        session_manager = SessionManager(db)
-
-        engine = AgentEngine(
-            db_session=db,
-            tool_registry=tool_registry,
-            connector_registry=connector_registry,
-            session_manager=session_manager,
+    # VaultService partagé pour la récupération des clés API
+    vault_service = None
+    try:
+        vault_service = get_vault_service()
+    except Exception as e:
+        logger.warning(f"VaultService unavailable, API keys won't be resolved: {e}")
+
+    storage_service = None
+    try:
+        storage_service = get_storage_manager()
+    except Exception as e:
+        logger.warning(f"MinIO unavailable, agent storage disabled for this request: {e}")
+
+    return build_engine(
+        db,
+        consumption_service=ConsumptionService(db),
+        vault_service=vault_service,
+        storage_service=storage_service,
+    )
+
+
+_async_redis = None
+
+
+def _get_async_redis():
+    """Client Redis async partagé (pool de connexions du process)."""
+    global _async_redis
+    if _async_redis is None:
+        _async_redis = aioredis.Redis(
+            host=_settings.REDIS_HOST,
+            port=_settings.REDIS_PORT,
+            db=_settings.REDIS_DB,
         )
-        engine.discover_agents()
-
-        return [
-            AgentInfo(
-                slug=m.slug,
-                name=m.name,
-                description=m.description,
-                version=m.version,
-                icon=m.icon,
-                category=m.category,
-                tags=m.tags,
-                capabilities=m.capabilities,
-                triggers=[tr.model_dump() for tr in m.triggers],
-            )
-            for m in engine.list_agents()
-        ]
+    return _async_redis
 
 
-@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(
-    job_id: str,
+# =============================================================================
+# Static routes — MUST come before parametric /{slug}/* routes
+# =============================================================================
+
+
+_AGENT_CATALOG_ADAPTER = TypeAdapter(list[AgentInfo])
+# (dict d'agents source, JSON) — reconstruit seulement après invalidate_agents()
+_agent_catalog: Optional[tuple[dict, bytes]] = None
+
+
+def _build_agent_catalog(generation: Optional[int]) -> bytes:
+    """Sérialise le catalogue des agents chargés dans le process (mémoïsé)."""
+    global _agent_catalog
+    agents = get_agents(generation)
+    if _agent_catalog is not None and _agent_catalog[0] is agents:
+        return _agent_catalog[1]
+
+    catalog = _AGENT_CATALOG_ADAPTER.dump_json([
+        AgentInfo(
+            slug=m.slug,
+            name=m.name,
+            description=m.description,
+            version=m.version,
+            icon=m.icon,
+            category=m.category,
+            tags=m.tags,
+            capabilities=m.capabilities,
+            triggers=[tr.model_dump() for tr in m.triggers],
+        )
+        for m in (agent.manifest for agent in agents.values())
+    ])
+    _agent_catalog = (agents, catalog)
+    return catalog
+
+
+@router.get("/catalog", response_model=list[AgentInfo])
+async def get_agent_catalog(
     current_user=Depends(get_current_user),
 ):
     """
-    Récupère le statut d'un job.
+    Retourne le catalogue des agents chargés.
 
-    Utile quand l'utilisateur revient sur un agent et veut voir
-    où en est l'exécution.
+    Liste tous les agents disponibles avec leurs métadonnées. Le JSON est
+    mis en cache dans Redis (invalidé par invalidate_agents()).
     """
-    from app.worker import celery_app
+    redis_client = _get_async_redis()
+    try:
+        generation, cached = await redis_client.mget(AGENTS_GENERATION_KEY, CATALOG_CACHE_KEY)
+        generation = int(generation or 0)
+    except Exception as e:
+        logger.warning(f"Agent catalog cache unavailable: {e}")
+        generation, cached = None, None
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Agents rechargés si la génération a changé : un process en retard ne
+    # republie pas un catalogue périmé après invalidate_agents()
+    catalog = _build_agent_catalog(generation)
+    try:
+        await redis_client.set(CATALOG_CACHE_KEY, catalog, ex=CATALOG_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Could not cache agent catalog: {e}")
+    return Response(content=catalog, media_type="application/json")
+
 
+def _job_status_sync(job_id: str) -> JobStatusResponse:
+    """Construit le statut d'un job depuis le backend de résultats Celery (I/O bloquante)."""
     task_result = celery_app.AsyncResult(job_id)
+    # Un seul GET Redis : state met en cache le résultat d'un job terminé
+    state = task_result.state
 
-    if task_result.ready():
+    if state in celery_states.READY_STATES:
         result = task_result.result
         if isinstance(result, dict) and result.get("success"):
             return JobStatusResponse(
@@ -203,11 +296,87 @@ async def get_job_status(
 
     return JobStatusResponse(
         job_id=job_id,
-        status="running" if task_result.state == "STARTED" else "pending",
+        status="running" if state == celery_states.STARTED else "pending",
         progress=0,
     )
 
 
+async def _job_status(job_id: str) -> JobStatusResponse:
+    return await run_in_threadpool(_job_status_sync, job_id)
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(
+    job_id: str,
+    current_user=Depends(get_current_user),
+):
+    """
+    Récupère le statut d'un job.
+
+    Utile quand l'utilisateur revient sur un agent et veut voir
+    où en est l'exécution. Pour suivre un job jusqu'à sa fin, préférer
+    /jobs/{job_id}/wait plutôt qu'un polling de cette route.
+    """
+    return await _job_status(job_id)
+
+
+def _message_state(data: bytes) -> Optional[str]:
+    """État Celery porté par un message du channel de résultat (None si illisible)."""
+    try:
+        return celery_app.backend.decode_result(data).get("status")
+    except Exception:
+        return None
+
+
+@router.get("/jobs/{job_id}/wait", response_model=JobStatusResponse)
+async def wait_job_status(
+    job_id: str,
+    timeout: float = Query(25, gt=0, le=60, description="Attente max en secondes"),
+    current_user=Depends(get_current_user),
+):
+    """
+    Attend la fin d'un job (long-poll) et retourne son statut.
+
+    Le backend Redis de Celery publie chaque résultat sur le channel de sa
+    clé : on s'y abonne au lieu de sonder la clé. Retourne le statut courant
+    (pending/running) si le job n'est pas terminé avant `timeout`.
+    """
+    channel = celery_app.backend.get_key_for_task(job_id)
+    pubsub = _get_async_redis().pubsub()
+    try:
+        # Abonnement AVANT la vérification : un résultat publié entre les deux
+        # n'est pas perdu
+        await pubsub.subscribe(channel)
+        status = await _job_status(job_id)
+        if status.status in ("completed", "failed"):
+            return status
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message is None:
+                continue
+            # Le channel reçoit aussi les états intermédiaires (RETRY, STARTED...) :
+            # on n'arrête d'attendre que sur un état final
+            state = _message_state(message["data"])
+            if state is None:
+                status = await _job_status(job_id)
+                if status.status in ("completed", "failed"):
+                    return status
+            elif state in celery_states.READY_STATES:
+                break
+    except Exception as e:
+        logger.warning(f"Job wait via Redis pub/sub failed, falling back to polling: {e}")
+    finally:
+        try:
+            await pubsub.reset()
+        except Exception:
+            pass
+
+    return await _job_status(job_id)
+
+
 @router.get("/progress/{session_id}")
 async def get_progress(session_id: str):
     """
@@ -216,18 +385,8 @@ async def get_progress(session_id: str):
     Pas d'authentification requise : les données (pourcentage + message)
     ne sont pas sensibles et le session_id est aléatoire.
     """
-    import json
     try:
-        import redis as _redis
-        from app.config import get_settings
-        settings = get_settings()
-        r = _redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            decode_responses=True,
-        )
-        data = r.get(f"agent_progress:{session_id}")
+        data = await _get_async_redis().get(f"agent_progress:{session_id}")
         if data:
             return json.loads(data)
     except Exception:
@@ -235,26 +394,25 @@ async def get_progress(session_id: str):
     return {"progress": 0, "message": ""}
 
 
-@router.get("/sessions/{session_id}")
+@router.get("/sessions/{session_id}", response_model=SessionInfo)
 async def get_session(
     session_id: str,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Récupère le détail d'une session avec ses messages."""
-    from app.database import async_session
-    from app.framework.runtime.session import SessionManager
-
-    async with async_session() as db:
-        session_manager = SessionManager(db)
-        session = await session_manager.get_session(session_id)
+    """
+    Récupère le détail d'une session avec ses messages.
 
-        if not session:
-            raise HTTPException(status_code=404, detail="Session non trouvée")
+    La propriété est vérifiée dans la requête SQL : la session d'un autre
+    utilisateur répond 404, sans charger ses messages ni révéler qu'elle existe.
+    """
+    session_manager = SessionManager(db)
+    session = await session_manager.get_session(session_id, user_id=current_user.id)
 
-        if str(session.user_id) != str(current_user.id):
-            raise HTTPException(status_code=403, detail="Accès interdit")
+    if not session:
+        raise HTTPException(status_code=404, detail="Session non trouvée")
 
-        return session.model_dump()
+    return session
 
 
 # =============================================================================
@@ -262,122 +420,137 @@ async def get_session(
 # =============================================================================
 
 
+def _llm_config_rows_stmt():
+    """
+    SELECT des seules colonnes de la réponse, noms provider/model joints.
+
+    Une seule requête quel que soit le nombre de configs (pas de chargement
+    de relations ni d'entités complètes).
+    """
+    return (
+        select(
+            AgentLLMConfig.id,
+            AgentLLMConfig.agent_slug,
+            AgentLLMConfig.provider_id,
+            AgentLLMConfig.model_id,
+            AgentLLMConfig.is_active,
+            LLMProvider.name.label("provider_name"),
+            LLMModel.name.label("model_name"),
+        )
+        .outerjoin(LLMProvider, LLMProvider.id == AgentLLMConfig.provider_id)
+        .outerjoin(LLMModel, LLMModel.id == AgentLLMConfig.model_id)
+    )
+
+
+def _llm_config_response(row) -> AgentLLMConfigResponse:
+    return AgentLLMConfigResponse(
+        id=str(row.id),
+        agent_slug=row.agent_slug,
+        provider_id=str(row.provider_id),
+        model_id=str(row.model_id),
+        provider_name=row.provider_name,
+        model_name=row.model_name,
+        is_active=row.is_active,
+    )
+
+
 @router.get("/config/llm", response_model=list[AgentLLMConfigResponse])
 async def list_agent_llm_configs(
+    limit: int = Query(500, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Liste toutes les configurations LLM par agent."""
-    from sqlalchemy import select
-    from app.database import async_session
-    from app.models.agent_llm_config import AgentLLMConfig
-
-    async with async_session() as db:
-        result = await db.execute(select(AgentLLMConfig).where(AgentLLMConfig.is_active == True))
-        configs = result.scalars().all()
-        return [
-            AgentLLMConfigResponse(
-                id=str(c.id),
-                agent_slug=c.agent_slug,
-                provider_id=str(c.provider_id),
-                model_id=str(c.model_id),
-                provider_name=c.provider.name if c.provider else None,
-                model_name=c.model.name if c.model else None,
-                is_active=c.is_active,
-            )
-            for c in configs
-        ]
+    """Liste les configurations LLM actives par agent (triées par slug)."""
+    stmt = (
+        _llm_config_rows_stmt()
+        .where(AgentLLMConfig.is_active.is_(True))
+        .order_by(AgentLLMConfig.agent_slug)
+        .limit(limit)
+        .offset(offset)
+    )
+    result = await db.execute(stmt)
+    return [_llm_config_response(row) for row in result]
 
 
 @router.get("/config/llm/{agent_slug}", response_model=Optional[AgentLLMConfigResponse])
 async def get_agent_llm_config(
     agent_slug: str,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Récupère la config LLM pour un agent spécifique."""
-    from sqlalchemy import select
-    from app.database import async_session
-    from app.models.agent_llm_config import AgentLLMConfig
-
-    async with async_session() as db:
-        result = await db.execute(
-            select(AgentLLMConfig).where(AgentLLMConfig.agent_slug == agent_slug)
-        )
-        config = result.scalar_one_or_none()
-        if not config:
-            return None
-        return AgentLLMConfigResponse(
-            id=str(config.id),
-            agent_slug=config.agent_slug,
-            provider_id=str(config.provider_id),
-            model_id=str(config.model_id),
-            provider_name=config.provider.name if config.provider else None,
-            model_name=config.model.name if config.model else None,
-            is_active=config.is_active,
-        )
+    result = await db.execute(
+        _llm_config_rows_stmt().where(AgentLLMConfig.agent_slug == agent_slug)
+    )
+    row = result.first()
+    return _llm_config_response(row) if row else None
 
 
 @router.put("/config/llm/{agent_slug}", response_model=AgentLLMConfigResponse)
 async def set_agent_llm_config(
     agent_slug: str,
     request: AgentLLMConfigRequest,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Définit ou met à jour la config LLM pour un agent."""
-    from sqlalchemy import select
-    from app.database import async_session
-    from app.models.agent_llm_config import AgentLLMConfig
-
-    async with async_session() as db:
-        result = await db.execute(
-            select(AgentLLMConfig).where(AgentLLMConfig.agent_slug == agent_slug)
+    """Définit ou met à jour la config LLM pour un agent (upsert atomique)."""
+    insert_stmt = pg_insert(AgentLLMConfig).values(
+        agent_slug=agent_slug,
+        provider_id=request.provider_id,
+        model_id=request.model_id,
+        is_active=True,
+    )
+    # ON CONFLICT sur l'index unique agent_slug : pas de fenêtre SELECT → INSERT
+    # où deux PUT concurrents pourraient se croiser
+    upsert = (
+        insert_stmt
+        .on_conflict_do_update(
+            index_elements=[AgentLLMConfig.agent_slug],
+            set_={
+                "provider_id": insert_stmt.excluded.provider_id,
+                "model_id": insert_stmt.excluded.model_id,
+                "is_active": True,
+                "updated_at": utc_now(),
+            },
+        )
+        .returning(
+            AgentLLMConfig.id,
+            AgentLLMConfig.agent_slug,
+            AgentLLMConfig.provider_id,
+            AgentLLMConfig.model_id,
+            AgentLLMConfig.is_active,
         )
-        config = result.scalar_one_or_none()
+        .cte("upserted")
+    )
+    # Un seul aller-retour : upsert + noms provider/model
+    stmt = (
+        select(upsert, LLMProvider.name.label("provider_name"), LLMModel.name.label("model_name"))
+        .outerjoin(LLMProvider, LLMProvider.id == upsert.c.provider_id)
+        .outerjoin(LLMModel, LLMModel.id == upsert.c.model_id)
+    )
 
-        if config:
-            config.provider_id = request.provider_id
-            config.model_id = request.model_id
-            config.is_active = True
-        else:
-            config = AgentLLMConfig(
-                agent_slug=agent_slug,
-                provider_id=request.provider_id,
-                model_id=request.model_id,
-            )
-            db.add(config)
+    row = (await db.execute(stmt)).one()
+    await db.commit()
+    get_agent_llm_config_cache().invalidate(agent_slug)
 
-        await db.commit()
-        await db.refresh(config)
-
-        return AgentLLMConfigResponse(
-            id=str(config.id),
-            agent_slug=config.agent_slug,
-            provider_id=str(config.provider_id),
-            model_id=str(config.model_id),
-            provider_name=config.provider.name if config.provider else None,
-            model_name=config.model.name if config.model else None,
-            is_active=config.is_active,
-        )
+    return _llm_config_response(row)
 
 
 @router.delete("/config/llm/{agent_slug}")
 async def delete_agent_llm_config(
     agent_slug: str,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Supprime la config LLM spécifique d'un agent (revient au défaut plateforme)."""
-    from sqlalchemy import select
-    from app.database import async_session
-    from app.models.agent_llm_config import AgentLLMConfig
-
-    async with async_session() as db:
-        result = await db.execute(
-            select(AgentLLMConfig).where(AgentLLMConfig.agent_slug == agent_slug)
-        )
-        config = result.scalar_one_or_none()
-        if config:
-            await db.delete(config)
-            await db.commit()
-        return {"ok": True}
+    result = await db.execute(
+        delete(AgentLLMConfig).where(AgentLLMConfig.agent_slug == agent_slug)
+    )
+    if result.rowcount:
+        await db.commit()
+        get_agent_llm_config_cache().invalidate(agent_slug)
+    return {"ok": True}
 
 
 # =============================================================================
@@ -401,25 +574,27 @@ async def chat_async(
         ChatResponse avec job_id et session_id
     """
     job_id = str(uuid.uuid4())
-    session_id = request.session_id or str(uuid.uuid4())
+    session_id = request.session_id or str(uuid7())
 
     try:
-        from app.tasks.agent_tasks import (
-            execute_agent_stream_task,
-            execute_agent_task,
-        )
-
         task_fn = execute_agent_stream_task if request.stream else execute_agent_task
 
-        task_fn.delay(
-            job_id=job_id,
-            agent_slug=slug,
-            user_id=current_user.id,
-            session_id=session_id,
-            message_content=request.message,
-            message_metadata=request.metadata,
-            workspace_id=request.workspace_id,
-        )
+        # apply_async() fait l'I/O broker de façon synchrone : hors de l'event
+        # loop. task_id=job_id pour que /jobs/{job_id} lise bien ce résultat.
+        async with _TASK_SUBMIT_SEM:
+            await run_in_threadpool(
+                task_fn.apply_async,
+                kwargs=dict(
+                    job_id=job_id,
+                    agent_slug=slug,
+                    user_id=current_user.id,
+                    session_id=session_id,
+                    message_content=request.message,
+                    message_metadata=request.metadata,
+                    workspace_id=request.workspace_id,
+                ),
+                task_id=job_id,
+            )
 
         return ChatResponse(
             job_id=job_id,
@@ -435,6 +610,7 @@ async def chat_async(
 async def chat_sync(
     slug: str,
     request: ChatRequest,
+    engine: AgentEngine = Depends(get_engine),
     current_user=Depends(get_current_user),
 ):
     """
@@ -446,59 +622,12 @@ async def chat_sync(
     Returns:
         ChatSyncResponse avec le contenu de la réponse
     """
-    from app.database import async_session
-    from app.framework.connectors.registry import ConnectorRegistry
-    from app.framework.runtime.engine import AgentEngine
-    from app.framework.runtime.session import SessionManager
-    from app.framework.schemas import UserMessage
-    from app.framework.tools.registry import ToolRegistry
-
-    session_id = request.session_id or str(uuid.uuid4())
-
-    # Initialise le VaultService pour la récupération des clés API
-    vault_service = None
-    try:
-        from app.services.vault import VaultService
-        vault_service = VaultService()
-    except Exception as e:
-        logger.warning(f"VaultService unavailable, API keys won't be resolved: {e}")
+    session_id = request.session_id or str(uuid7())
 
     try:
-        async with async_session() as db:
-            tool_registry = ToolRegistry()
-            tool_registry.discover()
-            connector_registry = ConnectorRegistry()
-            connector_registry.discover()
-            session_manager = SessionManager(db)
-
-            from app.services.consumption import ConsumptionService
-            consumption_service = ConsumptionService(db)
-
-            # Create storage manager so tools have access to MinIO
-            from app.config import get_settings
-            from app.framework.storage.agent_storage import AgentStorageManager
-            settings = get_settings()
-            storage_manager = AgentStorageManager(
-                endpoint=settings.MINIO_ENDPOINT,
-                access_key=settings.MINIO_ACCESS_KEY,
-                secret_key=settings.MINIO_SECRET_KEY,
-                bucket=settings.MINIO_STORAGE_BUCKET,
-                secure=settings.MINIO_SECURE,
-            )
-
-            engine = AgentEngine(
-                db_session=db,
-                tool_registry=tool_registry,
-                connector_registry=connector_registry,
-                session_manager=session_manager,
-                consumption_service=consumption_service,
-                vault_service=vault_service,
-                storage_service=storage_manager,
-            )
-            engine.discover_agents()
-
-            message = UserMessage(content=request.message, metadata=request.metadata)
+        message = UserMessage(content=request.message, metadata=request.metadata)
 
+        async with _SYNC_CHAT_SEM:
             result = await engine.execute(
                 agent_slug=slug,
                 message=message,
@@ -507,19 +636,19 @@ async def chat_sync(
                 workspace_id=request.workspace_id,
             )
 
-            if not result.success:
-                raise HTTPException(
-                    status_code=400,
-                    detail={"error": result.error, "code": result.error_code},
-                )
-
-            return ChatSyncResponse(
-                session_id=session_id,
-                content=result.response.content if result.response else "",
-                attachments=[a.model_dump() for a in result.response.attachments] if result.response else [],
-                metadata=result.response.metadata if result.response else {},
-                execution_time_ms=result.execution_time_ms,
+        if not result.success:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": result.error, "code": result.error_code},
             )
+
+        return ChatSyncResponse(
+            session_id=session_id,
+            content=result.response.content if result.response else "",
+            attachments=[a.model_dump() for a in result.response.attachments] if result.response else [],
+            metadata=result.response.metadata if result.response else {},
+            execution_time_ms=result.execution_time_ms,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -533,27 +662,21 @@ async def chat_sync(
 @router.get("/{slug}/sessions", response_model=SessionListResponse)
 async def list_sessions(
     slug: str,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Liste les sessions d'un utilisateur pour un agent."""
-    from app.database import async_session
-    from app.framework.runtime.session import SessionManager
-
-    async with async_session() as db:
-        session_manager = SessionManager(db)
-        sessions = await session_manager.list_sessions(
-            agent_slug=slug,
-            user_id=current_user.id,
-            limit=limit,
-            offset=offset,
-        )
+    session_manager = SessionManager(db)
+    sessions, total = await session_manager.list_sessions(
+        agent_slug=slug,
+        user_id=current_user.id,
+        limit=limit,
+        offset=offset,
+    )
 
-        return SessionListResponse(
-            sessions=[s.model_dump() for s in sessions],
-            total=len(sessions),
-        )
+    return SessionListResponse(sessions=sessions, total=total)
 
 
 # =============================================================================
@@ -562,19 +685,8 @@ async def list_sessions(
 
 
 def _get_scoped_storage(slug: str, user_id: int, workspace_id: Optional[str] = None):
-    """Create a ScopedAgentStorage for user × agent or workspace × agent."""
-    from app.config import get_settings
-    from app.framework.storage.agent_storage import AgentStorageManager
-
-    settings = get_settings()
-    manager = AgentStorageManager(
-        endpoint=settings.MINIO_ENDPOINT,
-        access_key=settings.MINIO_ACCESS_KEY,
-        secret_key=settings.MINIO_SECRET_KEY,
-        bucket=settings.MINIO_STORAGE_BUCKET,
-        secure=settings.MINIO_SECURE,
-    )
-    return manager.scoped(user_id=user_id, agent_slug=slug, workspace_id=workspace_id)
+    """Scope the shared storage manager to user × agent or workspace × agent."""
+    return get_storage_manager().scoped(user_id=user_id, agent_slug=slug, workspace_id=workspace_id)
 
 
 @router.post("/{slug}/storage/upload")
@@ -588,13 +700,16 @@ async def storage_upload(
     """Upload un fichier dans le stockage de l'agent."""
     storage = _get_scoped_storage(slug, current_user.id, workspace_id)
 
-    content = await file.read()
     prefix = path.rstrip("/") + "/" if path else "uploads/"
     key = f"{prefix}{file.filename}"
     content_type = file.content_type or "application/octet-stream"
 
-    await storage.put(key, content, content_type)
-    return {"key": key, "filename": file.filename, "size_bytes": len(content)}
+    # Le fichier spoolé est transmis tel quel à MinIO, sans copie en mémoire
+    await storage.put_stream(key, file.file, length=file.size, content_type=content_type)
+    return {"key": key, "filename": file.filename, "size_bytes": file.size}
+
+
+_BYTE_RANGE_RE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
 
 
 @router.get("/{slug}/storage/download")
@@ -602,22 +717,43 @@ async def storage_download(
     slug: str,
     key: str,
     workspace_id: Optional[str] = None,
+    range_header: Optional[str] = Header(None, alias="Range"),
     current_user=Depends(get_current_user),
 ):
-    """Télécharge un fichier depuis le stockage de l'agent."""
-    from fastapi.responses import Response
+    """
+    Télécharge un fichier depuis le stockage de l'agent (flux par blocs de 1 Mio).
+
+    Une en-tête Range à plage unique est relayée à MinIO et renvoie un 206,
+    ce qui permet de reprendre un téléchargement interrompu. Les en-têtes
+    Range multi-plages ou invalides sont ignorés (réponse complète).
+    """
+    byte_range = None
+    if range_header and _BYTE_RANGE_RE.match(range_header.strip()):
+        byte_range = range_header.strip()
 
     storage = _get_scoped_storage(slug, current_user.id, workspace_id)
-    data = await storage.get(key)
+    try:
+        obj = await storage.get_stream(key, byte_range=byte_range)
+    except InvalidRangeError:
+        raise HTTPException(status_code=416, detail="Plage demandée invalide")
 
-    if data is None:
+    if obj is None:
         raise HTTPException(status_code=404, detail="Fichier introuvable")
 
     filename = key.split("/")[-1]
-    return Response(
-        content=data,
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Accept-Ranges": "bytes",
+    }
+    if obj.size is not None:
+        headers["Content-Length"] = str(obj.size)
+    if obj.content_range:
+        headers["Content-Range"] = obj.content_range
+    return StreamingResponse(
+        obj.chunks,
+        status_code=206 if obj.content_range else 200,
+        media_type=obj.content_type,
+        headers=headers,
     )
 
 
@@ -630,17 +766,19 @@ async def storage_list(
 ):
     """Liste les fichiers dans le stockage de l'agent."""
     storage = _get_scoped_storage(slug, current_user.id, workspace_id)
-    keys = await storage.list(prefix or "")
+    objects = await storage.list_with_meta(prefix or "")
 
-    files = []
-    for k in keys:
-        files.append({
-            "key": k,
-            "filename": k.split("/")[-1],
-            "size_bytes": 0,
-            "content_type": "application/octet-stream",
-        })
-    return files
+    return [
+        {
+            "key": obj.key,
+            "filename": obj.key.split("/")[-1],
+            "size_bytes": obj.size,
+            "content_type": obj.content_type,
+            "last_modified": obj.last_modified,
+            "etag": obj.etag,
+        }
+        for obj in objects
+    ]
 
 
 @router.delete("/{slug}/storage/delete")
@@ -649,12 +787,33 @@ async def storage_delete(
     body: dict,
     current_user=Depends(get_current_user),
 ):
-    """Supprime un fichier du stockage de l'agent."""
+    """
+    Supprime un ou plusieurs fichiers du stockage de l'agent.
+
+    Body: {"key": "..."} ou {"keys": ["...", ...]} (+ workspace_id optionnel).
+    En mode multi-clés, une seule requête DeleteObjects par lot de 1000 clés.
+    """
+    workspace_id = body.get("workspace_id")
+    keys = body.get("keys")
+    if keys is not None:
+        if not isinstance(keys, list) or not keys:
+            raise HTTPException(status_code=400, detail="Clés manquantes")
+        if not all(isinstance(k, str) for k in keys):
+            raise HTTPException(status_code=400, detail="Les clés doivent être des chaînes")
+        storage = _get_scoped_storage(slug, current_user.id, workspace_id)
+        errors = await storage.delete_many(keys)
+        return {
+            "ok": not errors,
+            "results": [
+                {"key": k, "ok": k not in errors, "error": errors.get(k)}
+                for k in keys
+            ],
+        }
+
     key = body.get("key", "")
     if not key:
         raise HTTPException(status_code=400, detail="Clé manquante")
 
-    workspace_id = body.get("workspace_id")
     storage = _get_scoped_storage(slug, current_user.id, workspace_id)
     deleted = await storage.delete(key)
 
@@ -1,18 +1,19 @@
 import logging
+import os
 import zipfile
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.orm import selectinload
 from app.database import get_db
 from app.models.agent import Agent, AgentPermission
 from app.models.user import User
 from app.schemas.agent import AgentCreate, AgentUpdate, AgentResponse
 from app.middleware.auth import get_current_user, require_permission
-from app.services.rbac import get_accessible_agent_ids
+from app.services.rbac import get_accessible_agent_ids, grant_agent_roles
 from app.services.agent_manager import get_agent_manager
 
 _BACKEND_AGENTS_ROOT = Path(__file__).parent.parent / "agents"
@@ -32,16 +33,7 @@ async def list_agents(
         query = query.where(Agent.id.in_(accessible_ids))
     result = await db.execute(query.order_by(Agent.name))
     agents = result.scalars().all()
-    return [
-        AgentResponse(
-            id=a.id, name=a.name, slug=a.slug, description=a.description,
-            version=a.version, agent_type=a.agent_type, config=a.config,
-            system_prompt=a.system_prompt, is_active=a.is_active,
-            created_by=a.created_by, created_at=a.created_at, updated_at=a.updated_at,
-            permissions=[{"id": str(p.id), "role_id": str(p.role_id)} for p in a.permissions],
-        )
-        for a in agents
-    ]
+    return [AgentResponse.model_validate(a) for a in agents]
 
 
 @router.get("/{agent_id}", response_model=AgentResponse)
@@ -56,13 +48,7 @@ async def get_agent(
     agent = result.scalar_one_or_none()
     if not agent:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Agent not found")
-    return AgentResponse(
-        id=agent.id, name=agent.name, slug=agent.slug, description=agent.description,
-        version=agent.version, agent_type=agent.agent_type, config=agent.config,
-        system_prompt=agent.system_prompt, is_active=agent.is_active,
-        created_by=agent.created_by, created_at=agent.created_at, updated_at=agent.updated_at,
-        permissions=[{"id": str(p.id), "role_id": str(p.role_id)} for p in agent.permissions],
-    )
+    return AgentResponse.model_validate(agent)
 
 
 @router.post("", response_model=AgentResponse, status_code=status.HTTP_201_CREATED)
@@ -71,8 +57,7 @@ async def create_agent(
     current_user: User = Depends(require_permission("agents", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    existing = await db.execute(select(Agent).where(Agent.slug == agent_data.slug))
-    if existing.scalar_one_or_none():
+    if await db.scalar(select(exists().where(Agent.slug == agent_data.slug))):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Agent slug already exists")
     agent = Agent(
         name=agent_data.name, slug=agent_data.slug, description=agent_data.description,
@@ -82,17 +67,10 @@ async def create_agent(
     )
     db.add(agent)
     await db.flush()
-    for role_id in (agent_data.role_ids or []):
-        db.add(AgentPermission(agent_id=agent.id, role_id=role_id))
+    await grant_agent_roles(db, agent.id, agent_data.role_ids or [])
     await db.commit()
     await db.refresh(agent)
-    return AgentResponse(
-        id=agent.id, name=agent.name, slug=agent.slug, description=agent.description,
-        version=agent.version, agent_type=agent.agent_type, config=agent.config,
-        system_prompt=agent.system_prompt, is_active=agent.is_active,
-        created_by=agent.created_by, created_at=agent.created_at, updated_at=agent.updated_at,
-        permissions=[],
-    )
+    return AgentResponse.model_validate(agent)
 
 
 @router.put("/{agent_id}", response_model=AgentResponse)
@@ -111,17 +89,10 @@ async def update_agent(
         setattr(agent, key, value)
     if role_ids is not None:
         await db.execute(AgentPermission.__table__.delete().where(AgentPermission.agent_id == agent_id))
-        for role_id in role_ids:
-            db.add(AgentPermission(agent_id=agent.id, role_id=role_id))
+        await grant_agent_roles(db, agent.id, role_ids)
     await db.commit()
     await db.refresh(agent)
-    return AgentResponse(
-        id=agent.id, name=agent.name, slug=agent.slug, description=agent.description,
-        version=agent.version, agent_type=agent.agent_type, config=agent.config,
-        system_prompt=agent.system_prompt, is_active=agent.is_active,
-        created_by=agent.created_by, created_at=agent.created_at, updated_at=agent.updated_at,
-        permissions=[],
-    )
+    return AgentResponse.model_validate(agent)
 
 
 @router.delete("/{agent_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -146,13 +117,7 @@ async def duplicate_agent(
 ):
     manager = get_agent_manager()
     agent = await manager.duplicate_agent(db, agent_id, new_name, new_slug, current_user.id)
-    return AgentResponse(
-        id=agent.id, name=agent.name, slug=agent.slug, description=agent.description,
-        version=agent.version, agent_type=agent.agent_type, config=agent.config,
-        system_prompt=agent.system_prompt, is_active=agent.is_active,
-        created_by=agent.created_by, created_at=agent.created_at, updated_at=agent.updated_at,
-        permissions=[],
-    )
+    return AgentResponse.model_validate(agent)
 
 
 @router.post("/{agent_id}/export")
@@ -227,15 +192,17 @@ async def import_agent(
     db: AsyncSession = Depends(get_db),
 ):
     logger = logging.getLogger(__name__)
-    content = await file.read()
-
-    if not content:
+    # The upload is already spooled to a temp file by Starlette: read the
+    # archive from there instead of copying it into memory
+    archive = file.file
+    archive.seek(0, os.SEEK_END)
+    if not archive.tell():
         raise HTTPException(status_code=400, detail="Empty file")
+    archive.seek(0)
 
     # Validate ZIP structure before passing to manager
-    import io
     try:
-        with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
+        with zipfile.ZipFile(archive, "r") as zf:
             names = zf.namelist()
             has_standard = "agent.json" in names
             has_framework = "backend/manifest.json" in names
@@ -252,17 +219,12 @@ async def import_agent(
 
     try:
         manager = get_agent_manager()
+        archive.seek(0)
         agent = await manager.import_agent(
-            db, content, created_by=current_user.id, overwrite_slug=overwrite,
+            db, archive, created_by=current_user.id, overwrite_slug=overwrite,
         )
     except Exception as e:
         logger.exception("Failed to import agent")
         raise HTTPException(status_code=500, detail=f"Import failed: {e}")
 
-    return AgentResponse(
-        id=agent.id, name=agent.name, slug=agent.slug, description=agent.description,
-        version=agent.version, agent_type=agent.agent_type, config=agent.config,
-        system_prompt=agent.system_prompt, is_active=agent.is_active,
-        created_by=agent.created_by, created_at=agent.created_at, updated_at=agent.updated_at,
-        permissions=[],
-    )
+    return AgentResponse.model_validate(agent)
@@ -0,0 +1,39 @@
+"""Corps de requête JSON validés en une passe, partagés par les routers."""
+
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def json_body(model: type[M]) -> Callable[[Request], Awaitable[M]]:
+    """
+    Dépendance : valide le corps brut avec `model.model_validate_json`.
+
+    Un seul passage pydantic-core (jiter), au lieu de `request.json()` (json
+    stdlib) suivi d'une validation du dict. Les erreurs restent des 422 au
+    format FastAPI. Déclarer le schéma avec `openapi_extra=json_body_openapi(model)`.
+    """
+
+    async def parse(request: Request) -> M:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            )
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """Section requestBody OpenAPI d'une route utilisant `json_body(model)`."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
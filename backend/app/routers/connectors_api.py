@@ -15,27 +15,31 @@ Endpoints:
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
+import orjson
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from app.framework.runtime.bootstrap import get_connector_registry  # singleton partagé avec le runtime
 from app.middleware.auth import get_current_user
+from app.routers.responses import model_response
+from app.services.swr_cache import SWRCache
 
 router = APIRouter(prefix="/api/connectors", tags=["Connectors"])
 
-_connector_registry = None
-
-
-def get_connector_registry():
-    """Retourne le registre de connecteurs (singleton)."""
-    global _connector_registry
-    if _connector_registry is None:
-        from app.framework.connectors.registry import ConnectorRegistry
+# Catalogue sérialisé par catégorie (None = complet) : (version registre, expiration, JSON).
+# La version invalide immédiatement sur (dé)connexion ; le TTL borne le délai
+# de prise en compte d'une config Vault ajoutée (is_configured).
+_CATALOG_TTL_SECONDS = 30.0
+_catalog_cache: dict[str | None, tuple[int, float, bytes]] = {}
 
-        _connector_registry = ConnectorRegistry()
-        _connector_registry.discover()
-    return _connector_registry
+# Agrégats lus en boucle (dashboards, listes déroulantes) : servis depuis le
+# cache, rafraîchis en arrière-plan au-delà de 5 s
+_swr_cache = SWRCache(fresh=5.0, stale=30.0)
 
 
 # =============================================================================
@@ -46,15 +50,19 @@ def get_connector_registry():
 class ConnectorExecuteRequest(BaseModel):
     """Requête d'exécution d'une action connecteur."""
 
+    model_config = {"extra": "forbid"}
+
     action: str = Field(..., description="Nom de l'action à exécuter")
-    params: dict[str, Any] = Field(default_factory=dict)
+    params: dict[str, Any] = {}
 
 
 class ConnectorExecuteResponse(BaseModel):
     """Réponse d'exécution d'une action connecteur."""
 
+    model_config = {"frozen": True}
+
     success: bool
-    data: dict[str, Any] = Field(default_factory=dict)
+    data: dict[str, Any] = {}
     error: str | None = None
     error_code: str | None = None
 
@@ -62,6 +70,8 @@ class ConnectorExecuteResponse(BaseModel):
 class ConnectorConnectResponse(BaseModel):
     """Réponse de connexion."""
 
+    model_config = {"frozen": True}
+
     connected: bool
     slug: str
     message: str = ""
@@ -70,6 +80,8 @@ class ConnectorConnectResponse(BaseModel):
 class ConnectorHealthResponse(BaseModel):
     """Réponse de health check."""
 
+    model_config = {"frozen": True}
+
     healthy: bool
     message: str = ""
 
@@ -91,10 +103,18 @@ async def list_connectors(
     Filtrage optionnel par catégorie.
     """
     registry = get_connector_registry()
+    cached = _catalog_cache.get(category)
+    if cached and cached[0] == registry.version and time.monotonic() < cached[1]:
+        return Response(content=cached[2], media_type="application/json")
+
+    version = registry.version
     if category:
-        connectors = registry.list_by_category(category)
-        return [c.model_dump() for c in connectors]
-    return registry.get_catalog()
+        payload = [c.model_dump() for c in registry.list_by_category(category)]
+    else:
+        payload = registry.get_catalog()
+    content = orjson.dumps(payload)
+    _catalog_cache[category] = (version, time.monotonic() + _CATALOG_TTL_SECONDS, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/categories")
@@ -106,7 +126,12 @@ async def list_categories(current_user=Depends(get_current_user)):
         Liste des catégories ayant au moins 1 connecteur
     """
     registry = get_connector_registry()
-    return registry.get_categories()
+
+    async def load() -> bytes:
+        return orjson.dumps(registry.get_categories())
+
+    content = await _swr_cache.get("categories", load)
+    return Response(content=content, media_type="application/json")
 
 
 # =============================================================================
@@ -123,10 +148,15 @@ async def connectors_health(current_user=Depends(get_current_user)):
         Dict slug → is_healthy
     """
     registry = get_connector_registry()
-    return await registry.health_check_all()
+
+    async def load() -> bytes:
+        return orjson.dumps(await registry.health_check_all())
+
+    content = await _swr_cache.get("health", load)
+    return Response(content=content, media_type="application/json")
 
 
-@router.get("/{slug}/health", response_model=ConnectorHealthResponse)
+@router.get("/{slug}/health", responses={200: {"model": ConnectorHealthResponse}})
 async def connector_health(slug: str, current_user=Depends(get_current_user)):
     """
     Vérifie la santé d'un connecteur spécifique.
@@ -139,7 +169,7 @@ async def connector_health(slug: str, current_user=Depends(get_current_user)):
         raise HTTPException(status_code=404, detail=f"Connecteur '{slug}' non trouvé")
 
     result = await registry.health_check(slug)
-    return ConnectorHealthResponse(healthy=result["healthy"], message=result["message"])
+    return model_response(ConnectorHealthResponse(healthy=result["healthy"], message=result["message"]))
 
 
 # =============================================================================
@@ -156,13 +186,11 @@ async def get_connector_detail(slug: str, current_user=Depends(get_current_user)
         slug: Slug du connecteur
     """
     registry = get_connector_registry()
-    connector = registry.get_connector(slug)
-    if not connector:
+    detail = registry.get_detail_json(slug)
+    if detail is None:
         raise HTTPException(status_code=404, detail=f"Connecteur '{slug}' non trouvé")
 
-    detail = connector.metadata.model_dump()
-    detail["is_connected"] = registry.is_connected(slug)
-    return detail
+    return Response(content=detail, media_type="application/json")
 
 
 @router.get("/{slug}/actions")
@@ -174,11 +202,11 @@ async def get_connector_actions(slug: str, current_user=Depends(get_current_user
         slug: Slug du connecteur
     """
     registry = get_connector_registry()
-    connector = registry.get_connector(slug)
-    if not connector:
+    actions = registry.get_actions_json(slug)
+    if actions is None:
         raise HTTPException(status_code=404, detail=f"Connecteur '{slug}' non trouvé")
 
-    return [action.model_dump() for action in connector.metadata.actions]
+    return Response(content=actions, media_type="application/json")
 
 
 # =============================================================================
@@ -186,7 +214,7 @@ async def get_connector_actions(slug: str, current_user=Depends(get_current_user
 # =============================================================================
 
 
-@router.post("/{slug}/connect", response_model=ConnectorConnectResponse)
+@router.post("/{slug}/connect", responses={200: {"model": ConnectorConnectResponse}})
 async def connect_connector(slug: str, current_user=Depends(get_current_user)):
     """
     Initialise la connexion d'un connecteur via les credentials Vault.
@@ -202,23 +230,23 @@ async def connect_connector(slug: str, current_user=Depends(get_current_user)):
         raise HTTPException(status_code=404, detail=f"Connecteur '{slug}' non trouvé")
 
     if registry.is_connected(slug):
-        return ConnectorConnectResponse(
+        return model_response(ConnectorConnectResponse(
             connected=True, slug=slug, message="Déjà connecté"
-        )
+        ))
 
     success = await registry.connect_from_vault(slug)
     if not success:
-        return ConnectorConnectResponse(
+        return model_response(ConnectorConnectResponse(
             connected=False, slug=slug,
             message="Connexion échouée — vérifier la configuration Vault",
-        )
+        ))
 
-    return ConnectorConnectResponse(
+    return model_response(ConnectorConnectResponse(
         connected=True, slug=slug, message="Connecté avec succès"
-    )
+    ))
 
 
-@router.post("/{slug}/disconnect", response_model=ConnectorConnectResponse)
+@router.post("/{slug}/disconnect", responses={200: {"model": ConnectorConnectResponse}})
 async def disconnect_connector(slug: str, current_user=Depends(get_current_user)):
     """
     Ferme la connexion d'un connecteur.
@@ -231,9 +259,9 @@ async def disconnect_connector(slug: str, current_user=Depends(get_current_user)
         raise HTTPException(status_code=404, detail=f"Connecteur '{slug}' non trouvé")
 
     await registry.disconnect(slug)
-    return ConnectorConnectResponse(
+    return model_response(ConnectorConnectResponse(
         connected=False, slug=slug, message="Déconnecté"
-    )
+    ))
 
 
 # =============================================================================
@@ -241,7 +269,7 @@ async def disconnect_connector(slug: str, current_user=Depends(get_current_user)
 # =============================================================================
 
 
-@router.post("/{slug}/execute", response_model=ConnectorExecuteResponse)
+@router.post("/{slug}/execute", responses={200: {"model": ConnectorExecuteResponse}})
 async def execute_connector(
     slug: str,
     request: ConnectorExecuteRequest,
@@ -259,9 +287,9 @@ async def execute_connector(
     registry = get_connector_registry()
     result = await registry.execute_connector(slug, request.action, request.params)
 
-    return ConnectorExecuteResponse(
+    return model_response(ConnectorExecuteResponse(
         success=result.success,
         data=result.data,
         error=result.error,
         error_code=result.error_code.value if result.error_code else None,
-    )
+    ))
@@ -1,18 +1,42 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 from datetime import datetime
+import orjson
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from app.database import get_db, async_session
 from app.schemas.consumption import ConsumptionResponse
 from app.middleware.auth import require_permission
-from app.services.consumption import get_consumption_data, get_consumption_summary
+from app.services.consumption import stream_consumption_data, get_consumption_summary
+from app.models.consumption import COST_MICROS
 from app.models.user import User
+from app.services.swr_cache import SWRCache
 
 router = APIRouter(prefix="/api/consumption", tags=["Consumption"])
 
+# Pages non filtrées (vue d'ensemble de l'admin) : servies depuis le cache,
+# rafraîchies en arrière-plan au-delà de 5 s
+_unfiltered_cache = SWRCache(fresh=5.0, stale=30.0)
 
-@router.get("", response_model=list[ConsumptionResponse])
+
+async def _consumption_json(**params) -> AsyncIterator[bytes]:
+    """Tableau JSON produit ligne à ligne : la page n'est jamais matérialisée."""
+    # Session dédiée : celle de get_db est fermée avant l'envoi du corps
+    async with async_session() as db:
+        yield b"["
+        separator = b""
+        async for row in stream_consumption_data(db, **params):
+            yield separator + orjson.dumps(row)
+            separator = b","
+        yield b"]"
+
+
+async def _load_unfiltered_page(skip: int, limit: int) -> bytes:
+    return b"".join([chunk async for chunk in _consumption_json(skip=skip, limit=limit)])
+
+
+@router.get("", responses={200: {"model": list[ConsumptionResponse]}})
 async def list_consumption(
     user_id: Optional[UUID] = Query(None),
     agent_id: Optional[UUID] = Query(None),
@@ -23,13 +47,20 @@ async def list_consumption(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(require_permission("consumption", "read")),
-    db: AsyncSession = Depends(get_db),
 ):
-    data = await get_consumption_data(
-        db, user_id=user_id, agent_id=agent_id, provider_id=provider_id,
-        model_id=model_id, date_from=date_from, date_to=date_to, skip=skip, limit=limit,
+    if not any((user_id, agent_id, provider_id, model_id, date_from, date_to)):
+        content = await _unfiltered_cache.get(
+            (skip, limit), lambda: _load_unfiltered_page(skip, limit)
+        )
+        return Response(content=content, media_type="application/json")
+
+    return StreamingResponse(
+        _consumption_json(
+            user_id=user_id, agent_id=agent_id, provider_id=provider_id,
+            model_id=model_id, date_from=date_from, date_to=date_to, skip=skip, limit=limit,
+        ),
+        media_type="application/json",
     )
-    return data
 
 
 @router.get("/summary")
@@ -48,15 +79,16 @@ async def consumption_summary(
         db, group_by=group_by, user_id=user_id, agent_id=agent_id,
         provider_id=provider_id, model_id=model_id, date_from=date_from, date_to=date_to,
     )
-    return [
+    return ORJSONResponse([
         {
             "group_key": group_by,
             "group_value": str(row.group_value),
             "total_tokens_in": row.total_tokens_in or 0,
             "total_tokens_out": row.total_tokens_out or 0,
-            "total_cost_in": float(row.total_cost_in or 0),
-            "total_cost_out": float(row.total_cost_out or 0),
+            # SUM(bigint) is numeric in PostgreSQL (Decimal): orjson needs an int
+            "total_cost_in": int(row.total_cost_in_micros or 0) / COST_MICROS,
+            "total_cost_out": int(row.total_cost_out_micros or 0) / COST_MICROS,
             "count": row.count,
         }
         for row in data
-    ]
+    ])
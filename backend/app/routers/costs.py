@@ -6,12 +6,13 @@ from app.database import get_db
 from app.models.cost import ModelCost
 from app.schemas.cost import ModelCostCreate, ModelCostUpdate, ModelCostResponse
 from app.middleware.auth import require_permission
+from app.routers.responses import model_response
 from app.models.user import User
 
 router = APIRouter(prefix="/api/costs", tags=["Costs"])
 
 
-@router.get("", response_model=list[ModelCostResponse])
+@router.get("", response_model=list[ModelCostResponse], response_model_exclude_none=True)
 async def list_costs(
     model_id: UUID = Query(None),
     current_user: User = Depends(require_permission("costs", "read")),
@@ -24,7 +25,12 @@ async def list_costs(
     return result.scalars().all()
 
 
-@router.post("", response_model=ModelCostResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=ModelCostResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_cost(
     cost_data: ModelCostCreate,
     current_user: User = Depends(require_permission("costs", "write")),
@@ -37,21 +43,19 @@ async def create_cost(
     return cost
 
 
-@router.put("/{cost_id}", response_model=ModelCostResponse)
+@router.put("/{cost_id}", responses={200: {"model": ModelCostResponse}})
 async def update_cost(
     cost_id: UUID, cost_data: ModelCostUpdate,
     current_user: User = Depends(require_permission("costs", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(ModelCost).where(ModelCost.id == cost_id))
-    cost = result.scalar_one_or_none()
+    cost = await db.get(ModelCost, cost_id)
     if not cost:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cost entry not found")
     for key, value in cost_data.model_dump(exclude_unset=True).items():
         setattr(cost, key, value)
     await db.commit()
-    await db.refresh(cost)
-    return cost
+    return model_response(ModelCostResponse.model_validate(cost))
 
 
 @router.delete("/{cost_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -60,8 +64,7 @@ async def delete_cost(
     current_user: User = Depends(require_permission("costs", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(ModelCost).where(ModelCost.id == cost_id))
-    cost = result.scalar_one_or_none()
+    cost = await db.get(ModelCost, cost_id)
     if not cost:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cost entry not found")
     await db.delete(cost)
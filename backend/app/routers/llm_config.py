@@ -10,7 +10,8 @@ from app.schemas.llm_provider import (
     LLMModelCreate, LLMModelUpdate, LLMModelResponse, APIKeyRequest,
 )
 from app.middleware.auth import require_permission
-from app.services.vault import get_vault_service
+from app.routers.responses import model_response
+from app.services.agent_llm_config_cache import get_agent_llm_config_cache
 from app.models.user import User
 
 router = APIRouter(prefix="/api/llm", tags=["LLM Configuration"])
@@ -27,53 +28,60 @@ async def sync_from_connectors(
     return summary
 
 
-@router.get("/providers", response_model=list[LLMProviderResponse])
+@router.get("/providers", response_model=list[LLMProviderResponse], response_model_exclude_none=True)
 async def list_providers(
     current_user: User = Depends(require_permission("llm_config", "read")),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(select(LLMProvider).options(selectinload(LLMProvider.models)).order_by(LLMProvider.name))
     providers = result.scalars().all()
+    from app.services.vault import get_vault_service
     vault = get_vault_service()
+    have_key = vault.has_api_keys([p.slug for p in providers])
     response = []
     for p in providers:
         resp = LLMProviderResponse.model_validate(p)
-        resp.has_api_key = vault.has_api_key(p.slug)
+        resp.has_api_key = have_key[p.slug]
         response.append(resp)
     return response
 
 
-@router.post("/providers", response_model=LLMProviderResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/providers",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": LLMProviderResponse}},
+)
 async def create_provider(
     provider_data: LLMProviderCreate,
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    provider = LLMProvider(name=provider_data.name, slug=provider_data.slug, base_url=provider_data.base_url, is_active=provider_data.is_active)
+    # Models attached in Python: one flush inserts the provider, then all models
+    # in a single multi-row INSERT, and the collection needs no reload
+    provider = LLMProvider(
+        name=provider_data.name, slug=provider_data.slug,
+        base_url=provider_data.base_url, is_active=provider_data.is_active,
+        models=[LLMModel(**model_data.model_dump()) for model_data in (provider_data.models or [])],
+    )
     db.add(provider)
-    await db.flush()
-    for model_data in (provider_data.models or []):
-        db.add(LLMModel(provider_id=provider.id, name=model_data.name, slug=model_data.slug, is_active=model_data.is_active))
     await db.commit()
-    result = await db.execute(select(LLMProvider).options(selectinload(LLMProvider.models)).where(LLMProvider.id == provider.id))
-    return result.scalar_one()
+    return model_response(LLMProviderResponse.model_validate(provider), status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/providers/{provider_id}", response_model=LLMProviderResponse)
+@router.put("/providers/{provider_id}", responses={200: {"model": LLMProviderResponse}})
 async def update_provider(
     provider_id: UUID, provider_data: LLMProviderUpdate,
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMProvider).options(selectinload(LLMProvider.models)).where(LLMProvider.id == provider_id))
-    provider = result.scalar_one_or_none()
+    provider = await db.get(LLMProvider, provider_id, options=[selectinload(LLMProvider.models)])
     if not provider:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Provider not found")
     for key, value in provider_data.model_dump(exclude_unset=True).items():
         setattr(provider, key, value)
     await db.commit()
-    await db.refresh(provider)
-    return provider
+    get_agent_llm_config_cache().invalidate()
+    return model_response(LLMProviderResponse.model_validate(provider))
 
 
 @router.post("/providers/{provider_id}/api-key")
@@ -82,10 +90,10 @@ async def set_api_key(
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMProvider).where(LLMProvider.id == provider_id))
-    provider = result.scalar_one_or_none()
+    provider = await db.get(LLMProvider, provider_id)
     if not provider:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Provider not found")
+    from app.services.vault import get_vault_service
     vault = get_vault_service()
     success = vault.store_api_key(provider.slug, request.api_key)
     if not success:
@@ -99,10 +107,10 @@ async def check_api_key(
     current_user: User = Depends(require_permission("llm_config", "read")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMProvider).where(LLMProvider.id == provider_id))
-    provider = result.scalar_one_or_none()
+    provider = await db.get(LLMProvider, provider_id)
     if not provider:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Provider not found")
+    from app.services.vault import get_vault_service
     vault = get_vault_service()
     return {"has_api_key": vault.has_api_key(provider.slug)}
 
@@ -113,16 +121,21 @@ async def delete_api_key(
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMProvider).where(LLMProvider.id == provider_id))
-    provider = result.scalar_one_or_none()
+    provider = await db.get(LLMProvider, provider_id)
     if not provider:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Provider not found")
+    from app.services.vault import get_vault_service
     vault = get_vault_service()
     vault.delete_api_key(provider.slug)
     return {"status": "ok"}
 
 
-@router.post("/providers/{provider_id}/models", response_model=LLMModelResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/providers/{provider_id}/models",
+    response_model=LLMModelResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
 async def add_model(
     provider_id: UUID, model_data: LLMModelCreate,
     current_user: User = Depends(require_permission("llm_config", "write")),
@@ -135,21 +148,20 @@ async def add_model(
     return model
 
 
-@router.put("/models/{model_id}", response_model=LLMModelResponse)
+@router.put("/models/{model_id}", responses={200: {"model": LLMModelResponse}})
 async def update_model(
     model_id: UUID, model_data: LLMModelUpdate,
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMModel).where(LLMModel.id == model_id))
-    model = result.scalar_one_or_none()
+    model = await db.get(LLMModel, model_id)
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
     for key, value in model_data.model_dump(exclude_unset=True).items():
         setattr(model, key, value)
     await db.commit()
-    await db.refresh(model)
-    return model
+    get_agent_llm_config_cache().invalidate()
+    return model_response(LLMModelResponse.model_validate(model))
 
 
 @router.delete("/models/{model_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -158,9 +170,9 @@ async def delete_model(
     current_user: User = Depends(require_permission("llm_config", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(LLMModel).where(LLMModel.id == model_id))
-    model = result.scalar_one_or_none()
+    model = await db.get(LLMModel, model_id)
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
     await db.delete(model)
     await db.commit()
+    get_agent_llm_config_cache().invalidate()
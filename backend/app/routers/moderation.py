@@ -7,13 +7,13 @@ from app.database import get_db
 from app.models.moderation import ModerationRule
 from app.schemas.moderation import ModerationRuleCreate, ModerationRuleUpdate, ModerationRuleResponse
 from app.middleware.auth import require_permission
-from app.services.moderation import get_moderation_service
+from app.routers.responses import model_response
 from app.models.user import User
 
 router = APIRouter(prefix="/api/moderation", tags=["Moderation"])
 
 
-@router.get("/rules", response_model=list[ModerationRuleResponse])
+@router.get("/rules", response_model=list[ModerationRuleResponse], response_model_exclude_none=True)
 async def list_rules(
     agent_id: Optional[UUID] = Query(None),
     current_user: User = Depends(require_permission("moderation", "read")),
@@ -26,7 +26,12 @@ async def list_rules(
     return result.scalars().all()
 
 
-@router.post("/rules", response_model=ModerationRuleResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/rules",
+    response_model=ModerationRuleResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_rule(
     rule_data: ModerationRuleCreate,
     current_user: User = Depends(require_permission("moderation", "write")),
@@ -39,21 +44,19 @@ async def create_rule(
     return rule
 
 
-@router.put("/rules/{rule_id}", response_model=ModerationRuleResponse)
+@router.put("/rules/{rule_id}", responses={200: {"model": ModerationRuleResponse}})
 async def update_rule(
     rule_id: UUID, rule_data: ModerationRuleUpdate,
     current_user: User = Depends(require_permission("moderation", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(ModerationRule).where(ModerationRule.id == rule_id))
-    rule = result.scalar_one_or_none()
+    rule = await db.get(ModerationRule, rule_id)
     if not rule:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rule not found")
     for key, value in rule_data.model_dump(exclude_unset=True).items():
         setattr(rule, key, value)
     await db.commit()
-    await db.refresh(rule)
-    return rule
+    return model_response(ModerationRuleResponse.model_validate(rule))
 
 
 @router.delete("/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -62,8 +65,7 @@ async def delete_rule(
     current_user: User = Depends(require_permission("moderation", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(ModerationRule).where(ModerationRule.id == rule_id))
-    rule = result.scalar_one_or_none()
+    rule = await db.get(ModerationRule, rule_id)
     if not rule:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rule not found")
     await db.delete(rule)
@@ -76,7 +78,8 @@ async def test_moderation(
     entity_types: list[str] = Body(default=["person", "email", "phone", "address"]),
     current_user: User = Depends(require_permission("moderation", "read")),
 ):
+    from app.services.moderation import get_moderation_service
     service = get_moderation_service()
     entities = service.detect_entities(text, entity_types)
-    redacted = service.redact_text(text, entity_types)
+    redacted = service.redact_from_spans(text, entities)
     return {"original": text, "redacted": redacted, "entities": entities}
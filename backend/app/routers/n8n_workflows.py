@@ -13,36 +13,66 @@ Endpoints:
 - POST /api/n8n/workflows/{id}/publish  — Publish workflow as NOVA2 agent
 """
 
-import json
 import logging
 import re
-from typing import Optional
+import time
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.middleware.auth import get_current_user, require_permission
-from app.models.agent import Agent, AgentPermission
+from app.routers.bodies import json_body, json_body_openapi
+from app.models.agent import Agent
 from app.models.user import User
+from app.services.rbac import grant_agent_roles
 from app.services.n8n_workflows import (
-    analyze_workflow,
     check_n8n_health,
     create_n8n_workflow,
     execute_n8n_workflow,
     generate_agent_config_from_analysis,
     get_n8n_execution,
     get_n8n_workflow,
-    list_n8n_workflows,
+    get_workflow_analysis,
+    iter_n8n_workflows,
     setup_n8n_with_credentials,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/n8n", tags=["N8N Workflows"])
 
+_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
+
+# Workflow definitions change at human pace: the list is cached for a few
+# seconds in-process and by the browser / reverse proxy. It is the same for
+# every user, so one entry (expiry, serialized body) is enough.
+WORKFLOW_LIST_TTL_SECONDS = 15
+_READ_CACHE_HEADERS = {
+    "Cache-Control": f"private, max-age={WORKFLOW_LIST_TTL_SECONDS}",
+    "Vary": "Authorization",
+}
+_workflow_list: Optional[tuple[float, bytes]] = None
+# Bumped on invalidation so a listing started earlier is not stored afterwards
+_workflow_list_generation = 0
+
+
+def _invalidate_workflow_list() -> None:
+    global _workflow_list, _workflow_list_generation
+    _workflow_list = None
+    _workflow_list_generation += 1
+
+
+def _store_workflow_list(generation: int, content: bytes) -> None:
+    global _workflow_list
+    if generation == _workflow_list_generation:
+        _workflow_list = (time.monotonic() + WORKFLOW_LIST_TTL_SECONDS, content)
+
 
 # ---------------------------------------------------------------------------
 # Request / Response schemas
@@ -50,12 +80,12 @@ router = APIRouter(prefix="/api/n8n", tags=["N8N Workflows"])
 
 class WorkflowCreateRequest(BaseModel):
     """Create a workflow in N8N from raw JSON."""
-    workflow_json: dict
+    workflow_json: dict[str, Any]
 
 
 class WorkflowExecuteRequest(BaseModel):
     """Execute a workflow with optional input data."""
-    input_data: dict = {}
+    input_data: dict[str, Any] = Field(default_factory=dict)
 
 
 class WorkflowPublishRequest(BaseModel):
@@ -115,34 +145,66 @@ async def n8n_health(
     return {"healthy": healthy, "service": "n8n"}
 
 
+def _workflow_summary(wf: dict) -> bytes:
+    """Simplified workflow entry for the UI, serialized."""
+    return orjson.dumps({
+        "id": str(wf.get("id", "")),
+        "name": wf.get("name", "Unnamed"),
+        "active": wf.get("active", False),
+        "created_at": wf.get("createdAt", ""),
+        "updated_at": wf.get("updatedAt", ""),
+        "node_count": len(wf.get("nodes", [])),
+        "tags": [t.get("name", "") for t in wf.get("tags", [])],
+    })
+
+
+async def _workflows_json(
+    first: dict, workflows: AsyncIterator[dict], generation: int
+) -> AsyncIterator[bytes]:
+    """`{"workflows": [...]}` written entry by entry as N8N pages arrive, then cached."""
+    chunks: list[bytes] = []
+    try:
+        chunks.append(b'{"workflows":[' + _workflow_summary(first))
+        yield chunks[-1]
+        async for wf in workflows:
+            chunks.append(b"," + _workflow_summary(wf))
+            yield chunks[-1]
+        chunks.append(b"]}")
+        yield chunks[-1]
+        _store_workflow_list(generation, b"".join(chunks))
+    finally:
+        await workflows.aclose()
+
+
 @router.get("/workflows")
 async def list_workflows(
     current_user: User = Depends(get_current_user),
 ):
     """List all workflows available in the N8N instance."""
+    cached = _workflow_list
+    if cached is not None and cached[0] > time.monotonic():
+        return Response(content=cached[1], media_type="application/json", headers=_READ_CACHE_HEADERS)
+
+    generation = _workflow_list_generation
+    workflows = iter_n8n_workflows()
     try:
-        workflows = await list_n8n_workflows()
-        # Return simplified list for the UI
-        return {
-            "workflows": [
-                {
-                    "id": str(wf.get("id", "")),
-                    "name": wf.get("name", "Unnamed"),
-                    "active": wf.get("active", False),
-                    "created_at": wf.get("createdAt", ""),
-                    "updated_at": wf.get("updatedAt", ""),
-                    "node_count": len(wf.get("nodes", [])),
-                    "tags": [t.get("name", "") for t in wf.get("tags", [])],
-                }
-                for wf in workflows
-            ]
-        }
+        # First page fetched before answering: N8N errors still map to a 502
+        first = await anext(workflows, None)
     except Exception as e:
         logger.error(f"Failed to list N8N workflows: {e}")
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Cannot reach N8N: {e}",
         )
+    if first is None:
+        content = b'{"workflows":[]}'
+        _store_workflow_list(generation, content)
+        return Response(content=content, media_type="application/json", headers=_READ_CACHE_HEADERS)
+    return StreamingResponse(
+        _workflows_json(first, workflows, generation),
+        media_type="application/json",
+        headers=_READ_CACHE_HEADERS,
+    )
 
 
 @router.get("/workflows/{workflow_id}")
@@ -153,11 +215,11 @@ async def get_workflow(
     """Get full workflow details including node analysis."""
     try:
         workflow = await get_n8n_workflow(workflow_id)
-        analysis = analyze_workflow(workflow)
-        return {
-            "workflow": workflow,
-            "analysis": analysis.to_dict(),
-        }
+        analysis = get_workflow_analysis(workflow)
+        return ORJSONResponse(
+            {"workflow": workflow, "analysis": analysis.as_dict},
+            headers=_READ_CACHE_HEADERS,
+        )
     except Exception as e:
         logger.error(f"Failed to get N8N workflow {workflow_id}: {e}")
         raise HTTPException(
@@ -166,19 +228,20 @@ async def get_workflow(
         )
 
 
-@router.post("/workflows")
+@router.post("/workflows", openapi_extra=json_body_openapi(WorkflowCreateRequest))
 async def create_workflow(
-    request: WorkflowCreateRequest,
+    request: WorkflowCreateRequest = Depends(json_body(WorkflowCreateRequest)),
     current_user: User = Depends(require_permission("agents", "write")),
 ):
     """Create a new workflow in N8N from raw JSON."""
     try:
         result = await create_n8n_workflow(request.workflow_json)
-        analysis = analyze_workflow(result)
-        return {
+        _invalidate_workflow_list()
+        analysis = get_workflow_analysis(result)
+        return ORJSONResponse({
             "workflow": result,
-            "analysis": analysis.to_dict(),
-        }
+            "analysis": analysis.as_dict,
+        })
     except Exception as e:
         logger.error(f"Failed to create N8N workflow: {e}")
         raise HTTPException(
@@ -195,8 +258,8 @@ async def import_workflow(
     """Import a workflow JSON file into N8N."""
     content = await file.read()
     try:
-        workflow_json = json.loads(content)
-    except json.JSONDecodeError:
+        workflow_json = orjson.loads(content)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Invalid JSON file",
@@ -204,11 +267,12 @@ async def import_workflow(
 
     try:
         result = await create_n8n_workflow(workflow_json)
-        analysis = analyze_workflow(result)
-        return {
+        _invalidate_workflow_list()
+        analysis = get_workflow_analysis(result)
+        return ORJSONResponse({
             "workflow": result,
-            "analysis": analysis.to_dict(),
-        }
+            "analysis": analysis.as_dict,
+        })
     except Exception as e:
         logger.error(f"Failed to import N8N workflow: {e}")
         raise HTTPException(
@@ -225,11 +289,11 @@ async def analyze_workflow_endpoint(
     """Analyze a workflow and return UI metadata."""
     try:
         workflow = await get_n8n_workflow(workflow_id)
-        analysis = analyze_workflow(workflow)
+        analysis = get_workflow_analysis(workflow)
         return WorkflowAnalysisResponse(
             workflow_id=workflow_id,
             workflow_name=workflow.get("name", "Unnamed"),
-            analysis=analysis.to_dict(),
+            analysis=analysis.as_dict,
         )
     except Exception as e:
         logger.error(f"Failed to analyze workflow {workflow_id}: {e}")
@@ -239,16 +303,16 @@ async def analyze_workflow_endpoint(
         )
 
 
-@router.post("/workflows/{workflow_id}/execute")
+@router.post("/workflows/{workflow_id}/execute", openapi_extra=json_body_openapi(WorkflowExecuteRequest))
 async def execute_workflow(
     workflow_id: str,
-    request: WorkflowExecuteRequest,
+    request: WorkflowExecuteRequest = Depends(json_body(WorkflowExecuteRequest)),
     current_user: User = Depends(get_current_user),
 ):
     """Execute a workflow with input data and return results."""
     try:
         result = await execute_n8n_workflow(workflow_id, request.input_data)
-        return {"execution": result}
+        return ORJSONResponse({"execution": result})
     except Exception as e:
         logger.error(f"Failed to execute workflow {workflow_id}: {e}")
         raise HTTPException(
@@ -265,7 +329,7 @@ async def get_execution(
     """Get execution details and status."""
     try:
         result = await get_n8n_execution(execution_id)
-        return {"execution": result}
+        return ORJSONResponse({"execution": result})
     except Exception as e:
         logger.error(f"Failed to get execution {execution_id}: {e}")
         raise HTTPException(
@@ -289,15 +353,14 @@ async def publish_workflow_as_agent(
     frontend dynamic renderer uses to build the appropriate UI.
     """
     # Validate slug format
-    if not re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$", request.slug):
+    if not _SLUG_RE.match(request.slug):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid slug format. Must be kebab-case (e.g., my-workflow-agent)",
         )
 
     # Check slug uniqueness
-    existing = await db.execute(select(Agent).where(Agent.slug == request.slug))
-    if existing.scalar_one_or_none():
+    if await db.scalar(select(exists().where(Agent.slug == request.slug))):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Agent slug '{request.slug}' already exists",
@@ -312,7 +375,7 @@ async def publish_workflow_as_agent(
             detail=f"Cannot fetch workflow from N8N: {e}",
         )
 
-    analysis = analyze_workflow(workflow)
+    analysis = get_workflow_analysis(workflow)
     agent_config = generate_agent_config_from_analysis(
         analysis, workflow_id, workflow.get("name", request.name),
     )
@@ -334,12 +397,9 @@ async def publish_workflow_as_agent(
     db.add(agent)
     await db.flush()
 
-    # Set role permissions
-    for role_id in request.role_ids:
-        db.add(AgentPermission(agent_id=agent.id, role_id=role_id))
+    await grant_agent_roles(db, agent.id, request.role_ids)
 
     await db.commit()
-    await db.refresh(agent)
 
     return {
         "id": str(agent.id),
@@ -348,5 +408,5 @@ async def publish_workflow_as_agent(
         "description": agent.description,
         "agent_type": agent.agent_type,
         "config": agent.config,
-        "analysis": analysis.to_dict(),
+        "analysis": analysis.as_dict,
     }
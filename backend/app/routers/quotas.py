@@ -1,5 +1,6 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
@@ -12,20 +13,21 @@ from app.models.user import User
 router = APIRouter(prefix="/api/quotas", tags=["Quotas"])
 
 
-@router.get("", response_model=list[QuotaResponse])
+@router.get("", responses={200: {"model": list[QuotaResponse]}})
 async def list_quotas(
     target_type: str = Query(None),
     target_id: UUID = Query(None),
     current_user: User = Depends(require_permission("quotas", "read")),
     db: AsyncSession = Depends(get_db),
 ):
-    query = select(Quota)
+    # Only the response columns: rows go straight to orjson, no ORM or pydantic pass
+    query = select(*(getattr(Quota, name) for name in QuotaResponse.model_fields))
     if target_type:
         query = query.where(Quota.target_type == target_type)
     if target_id:
         query = query.where(Quota.target_id == target_id)
     result = await db.execute(query.order_by(Quota.created_at.desc()))
-    return result.scalars().all()
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("", response_model=QuotaResponse, status_code=status.HTTP_201_CREATED)
@@ -37,7 +39,6 @@ async def create_quota(
     quota = Quota(**quota_data.model_dump())
     db.add(quota)
     await db.commit()
-    await db.refresh(quota)
     return quota
 
 
@@ -47,14 +48,12 @@ async def update_quota(
     current_user: User = Depends(require_permission("quotas", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Quota).where(Quota.id == quota_id))
-    quota = result.scalar_one_or_none()
+    quota = await db.get(Quota, quota_id)
     if not quota:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quota not found")
     for key, value in quota_data.model_dump(exclude_unset=True).items():
         setattr(quota, key, value)
     await db.commit()
-    await db.refresh(quota)
     return quota
 
 
@@ -64,8 +63,7 @@ async def delete_quota(
     current_user: User = Depends(require_permission("quotas", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Quota).where(Quota.id == quota_id))
-    quota = result.scalar_one_or_none()
+    quota = await db.get(Quota, quota_id)
     if not quota:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quota not found")
     await db.delete(quota)
@@ -82,8 +80,11 @@ async def get_quota_usage(
         select(Quota).where(Quota.target_type == target_type, Quota.target_id == target_id)
     )
     quotas = result.scalars().all()
-    usage_list = []
-    for quota in quotas:
-        check = await check_quota(db, target_type, target_id)
-        usage_list.append({"quota": QuotaResponse.model_validate(quota), "allowed": check["allowed"]})
-    return usage_list
+    if not quotas:
+        return []
+    # The check covers every active quota of the target: run it once, not per quota
+    check = await check_quota(db, target_type, target_id)
+    return [
+        {"quota": QuotaResponse.model_validate(quota), "allowed": check["allowed"]}
+        for quota in quotas
+    ]
@@ -0,0 +1,18 @@
+"""Réponses JSON pré-sérialisées, partagées par les routers."""
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = 200, exclude_none: bool = True) -> Response:
+    """
+    Sérialise un modèle une seule fois (pydantic-core), sans revalidation FastAPI.
+
+    Les champs à None sont omis (sauf exclude_none=False). La route déclare le modèle via
+    `responses={200: {"model": ...}}` pour garder le schéma OpenAPI.
+    """
+    return Response(
+        content=model.model_dump_json(exclude_none=exclude_none),
+        status_code=status_code,
+        media_type="application/json",
+    )
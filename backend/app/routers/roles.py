@@ -1,23 +1,28 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from app.database import get_db
 from app.models.role import Role
 from app.schemas.role import RoleCreate, RoleUpdate, RoleResponse
 from app.middleware.auth import require_permission
 from app.models.user import User
+from app.services.auth import invalidate_user_cache
 
 router = APIRouter(prefix="/api/roles", tags=["Roles"])
 
 
-@router.get("", response_model=list[RoleResponse])
+@router.get("", responses={200: {"model": list[RoleResponse]}})
 async def list_roles(
     current_user: User = Depends(require_permission("roles", "read")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Role).order_by(Role.name))
-    return result.scalars().all()
+    # Only the response columns: skips the selectin loads of users/agent_permissions
+    # and the ORM -> pydantic pass, rows go straight to orjson
+    columns = (getattr(Role, name) for name in RoleResponse.model_fields)
+    result = await db.execute(select(*columns).order_by(Role.name))
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
@@ -26,13 +31,11 @@ async def create_role(
     current_user: User = Depends(require_permission("roles", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    existing = await db.execute(select(Role).where(Role.name == role_data.name))
-    if existing.scalar_one_or_none():
+    if await db.scalar(select(exists().where(Role.name == role_data.name))):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Role name already exists")
     role = Role(name=role_data.name, description=role_data.description, permissions=role_data.permissions or {})
     db.add(role)
     await db.commit()
-    await db.refresh(role)
     return role
 
 
@@ -42,8 +45,7 @@ async def get_role(
     current_user: User = Depends(require_permission("roles", "read")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
     if not role:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
     return role
@@ -55,15 +57,14 @@ async def update_role(
     current_user: User = Depends(require_permission("roles", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
     if not role:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
     update_data = role_data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(role, key, value)
     await db.commit()
-    await db.refresh(role)
+    invalidate_user_cache()
     return role
 
 
@@ -73,9 +74,9 @@ async def delete_role(
     current_user: User = Depends(require_permission("roles", "delete")),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
     if not role:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
     await db.delete(role)
     await db.commit()
+    invalidate_user_cache()
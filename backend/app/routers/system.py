@@ -1,17 +1,50 @@
-import os
+import asyncio
 import shutil
+from pathlib import Path
+from typing import BinaryIO, Optional
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from app.middleware.auth import require_permission, get_current_user
 from app.services.updater import get_update_service
 from app.models.user import User
 
 router = APIRouter(prefix="/api/system", tags=["System"])
 
-UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "uploads")
+UPLOAD_DIR = Path(__file__).resolve().parents[2] / "uploads"
 LOGO_FILENAME = "platform_logo"
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".svg", ".webp"}
 
+# Budget of each subsystem probe in /status: a slow one is reported, not awaited
+STATUS_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Resolved logo path, set on upload/first lookup and cleared on delete. Another
+# worker may replace the file, so a cached path is re-checked with a stat.
+_logo_path: Optional[Path] = None
+
+
+def _logo_files() -> list[Path]:
+    if not UPLOAD_DIR.is_dir():
+        return []
+    return [p for p in UPLOAD_DIR.iterdir() if p.stem == LOGO_FILENAME]
+
+
+def _find_logo() -> Optional[Path]:
+    return next(iter(_logo_files()), None)
+
+
+def _save_logo(src: BinaryIO, ext: str) -> Path:
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Remove any existing logo
+    for p in _logo_files():
+        p.unlink()
+
+    dest = UPLOAD_DIR / f"{LOGO_FILENAME}{ext}"
+    with open(dest, "wb") as buf:
+        shutil.copyfileobj(src, buf)
+    return dest
+
 
 @router.get("/version")
 async def get_version(current_user: User = Depends(get_current_user)):
@@ -19,6 +52,27 @@ async def get_version(current_user: User = Depends(get_current_user)):
     return {"version": service.get_current_version()}
 
 
+@router.get("/status")
+async def get_status(current_user: User = Depends(get_current_user)):
+    """Version, N8N and tools health in one call, the probes running concurrently."""
+    from app.framework.runtime.bootstrap import get_tool_registry
+    from app.services.n8n_workflows import check_n8n_health
+
+    n8n, tools = await asyncio.gather(
+        asyncio.wait_for(check_n8n_health(), timeout=STATUS_CHECK_TIMEOUT_SECONDS),
+        asyncio.wait_for(get_tool_registry().health_check_all(), timeout=STATUS_CHECK_TIMEOUT_SECONDS),
+        return_exceptions=True,
+    )
+    return ORJSONResponse({
+        "version": get_update_service().get_current_version(),
+        "n8n": {"healthy": n8n is True},
+        "tools": (
+            {slug: result.model_dump() for slug, result in tools.items()}
+            if isinstance(tools, dict) else None
+        ),
+    })
+
+
 @router.get("/check-update")
 async def check_updates(current_user: User = Depends(require_permission("system", "read"))):
     service = get_update_service()
@@ -36,41 +90,37 @@ async def upload_logo(
     file: UploadFile = File(...),
     current_user: User = Depends(require_permission("system", "update")),
 ):
-    ext = os.path.splitext(file.filename or "")[1].lower()
+    ext = Path(file.filename or "").suffix.lower()
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"File type not allowed. Use: {', '.join(ALLOWED_EXTENSIONS)}")
 
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-    # Remove any existing logo
-    for f in os.listdir(UPLOAD_DIR):
-        if f.startswith(LOGO_FILENAME):
-            os.remove(os.path.join(UPLOAD_DIR, f))
-
-    dest = os.path.join(UPLOAD_DIR, f"{LOGO_FILENAME}{ext}")
-    with open(dest, "wb") as buf:
-        shutil.copyfileobj(file.file, buf)
+    # Disk I/O (and reading the spooled upload) off the event loop
+    dest = await run_in_threadpool(_save_logo, file.file, ext)
 
+    global _logo_path
+    _logo_path = dest
     return {"success": True, "filename": f"{LOGO_FILENAME}{ext}"}
 
 
 @router.get("/logo")
 async def get_logo():
-    if not os.path.isdir(UPLOAD_DIR):
+    global _logo_path
+    if _logo_path is None or not _logo_path.is_file():
+        _logo_path = _find_logo()
+    if _logo_path is None:
         raise HTTPException(status_code=404, detail="No logo uploaded")
-    for f in os.listdir(UPLOAD_DIR):
-        if f.startswith(LOGO_FILENAME):
-            return FileResponse(os.path.join(UPLOAD_DIR, f))
-    raise HTTPException(status_code=404, detail="No logo uploaded")
+    return FileResponse(_logo_path)
 
 
 @router.delete("/logo")
 async def delete_logo(
     current_user: User = Depends(require_permission("system", "update")),
 ):
-    if os.path.isdir(UPLOAD_DIR):
-        for f in os.listdir(UPLOAD_DIR):
-            if f.startswith(LOGO_FILENAME):
-                os.remove(os.path.join(UPLOAD_DIR, f))
-                return {"success": True}
+    global _logo_path
+    _logo_path = None
+    logos = _logo_files()
+    if logos:
+        for p in logos:
+            p.unlink()
+        return {"success": True}
     raise HTTPException(status_code=404, detail="No logo to delete")
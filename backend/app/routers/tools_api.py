@@ -12,28 +12,56 @@ Endpoints:
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
+from app.framework.runtime.bootstrap import get_tool_registry
+from app.framework.tools.registry import ToolRegistry
 from app.middleware.auth import get_current_user
+from app.routers.bodies import json_body, json_body_openapi
+from app.routers.responses import model_response
 
 router = APIRouter(prefix="/api/tools", tags=["Tools"])
 
-# Instance globale du registre (initialisée au démarrage)
-_tool_registry = None
+# Catalogue et catégories sérialisés une fois par version du registre :
+# clé → (version, JSON, ETag). Le catalogue ne dépend pas de l'utilisateur.
+_CATALOG_CACHE_CONTROL = "private, max-age=60"
+_serialized: dict[tuple[str, Optional[str]], tuple[int, bytes, str]] = {}
 
 
-def get_tool_registry():
-    """Retourne le registre de tools (initialisé au démarrage de l'app)."""
-    global _tool_registry
-    if _tool_registry is None:
-        from app.framework.tools.registry import ToolRegistry
+async def tool_registry() -> ToolRegistry:
+    """
+    Dépendance : registre de tools partagé avec le runtime des agents.
+
+    Construit au démarrage (lifespan) ; async pour que FastAPI l'appelle dans
+    la boucle plutôt que via le threadpool. Surchargeable dans les tests
+    (app.dependency_overrides).
+    """
+    return get_tool_registry()
+
 
-        _tool_registry = ToolRegistry()
-        _tool_registry.discover()
-    return _tool_registry
+def _cached_json(
+    request: Request, registry: ToolRegistry, key: tuple[str, Optional[str]], build
+) -> Response:
+    """Réponse JSON servie depuis le cache, ou 304 si le client a déjà cette version."""
+    entry = _serialized.get(key)
+    if entry is None or entry[0] != registry.version:
+        content = orjson.dumps(build())
+        # ETag faible : le corps peut être recompressé (gzip) en transit
+        etag = f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        entry = (registry.version, content, etag)
+        _serialized[key] = entry
+
+    headers = {"ETag": entry[2], "Cache-Control": _CATALOG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or entry[2] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry[1], media_type="application/json", headers=headers)
 
 
 class ToolExecuteRequest(BaseModel):
@@ -61,8 +89,10 @@ class ToolHealthResponse(BaseModel):
 
 @router.get("")
 async def list_tools(
+    request: Request,
     category: Optional[str] = Query(None, description="Filtrer par catégorie"),
     current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
 ):
     """
     Catalogue complet des tools disponibles.
@@ -72,71 +102,91 @@ async def list_tools(
 
     Filtrage optionnel par catégorie.
     """
-    registry = get_tool_registry()
     if category:
-        return [m.model_dump() for m in registry.list_by_category(category)]
-    return registry.get_catalog()
+        if category not in registry.get_categories():
+            return ORJSONResponse([])  # pas de cache pour des catégories arbitraires
+        return _cached_json(
+            request, registry, ("catalog", category),
+            lambda: [m.model_dump() for m in registry.list_by_category(category)],
+        )
+    return _cached_json(request, registry, ("catalog", None), registry.get_catalog)
 
 
 @router.get("/health")
-async def health_check_all(current_user=Depends(get_current_user)):
+async def health_check_all(
+    current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
+):
     """
     Health check de tous les tools.
 
     Retourne l'état de santé de chaque tool enregistré.
     """
-    registry = get_tool_registry()
     results = await registry.health_check_all()
-    return {
+    return ORJSONResponse({
         slug: result.model_dump()
         for slug, result in results.items()
-    }
+    })
 
 
 @router.get("/categories")
-async def list_categories(current_user=Depends(get_current_user)):
+async def list_categories(
+    request: Request,
+    current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
+):
     """
     Liste des catégories de tools disponibles.
     """
-    registry = get_tool_registry()
-    return registry.get_categories()
+    return _cached_json(request, registry, ("categories", None), registry.get_categories)
 
 
 @router.get("/{slug}")
-async def get_tool_detail(slug: str, current_user=Depends(get_current_user)):
+async def get_tool_detail(
+    slug: str,
+    current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
+):
     """
     Détail d'un tool avec son schema complet.
 
     Args:
         slug: Slug du tool
     """
-    registry = get_tool_registry()
     tool = registry.get_tool(slug)
     if not tool:
         raise HTTPException(status_code=404, detail=f"Tool '{slug}' non trouvé")
-    return tool.metadata.model_dump()
+    return ORJSONResponse(tool.metadata.model_dump())
 
 
 @router.get("/{slug}/health")
-async def health_check_tool(slug: str, current_user=Depends(get_current_user)):
+async def health_check_tool(
+    slug: str,
+    current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
+):
     """
     Health check d'un tool spécifique.
 
     Args:
         slug: Slug du tool
     """
-    registry = get_tool_registry()
     result = await registry.health_check_tool(slug)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Tool '{slug}' non trouvé")
-    return result.model_dump()
+    return ORJSONResponse(result.model_dump())
 
 
-@router.post("/{slug}/execute", response_model=ToolExecuteResponse)
+@router.post(
+    "/{slug}/execute",
+    responses={200: {"model": ToolExecuteResponse}},
+    openapi_extra=json_body_openapi(ToolExecuteRequest),
+)
 async def execute_tool(
     slug: str,
-    request: ToolExecuteRequest,
+    request: ToolExecuteRequest = Depends(json_body(ToolExecuteRequest)),
     current_user=Depends(get_current_user),
+    registry: ToolRegistry = Depends(tool_registry),
 ):
     """
     Exécute un tool.
@@ -152,7 +202,6 @@ async def execute_tool(
     """
     from app.framework.runtime.context import ToolContext
 
-    registry = get_tool_registry()
 
     context = ToolContext(user_id=current_user.id)
     result = await registry.execute_tool(slug, request.params, context)
@@ -166,9 +215,9 @@ async def execute_tool(
             },
         )
 
-    return ToolExecuteResponse(
+    return model_response(ToolExecuteResponse(
         success=result.success,
         data=result.data,
         error=result.error,
         error_code=result.error_code.value if result.error_code else None,
-    )
+    ), exclude_none=False)
@@ -1,14 +1,14 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, exists
 from sqlalchemy.orm import selectinload
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.role import Role
 from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse
 from app.middleware.auth import get_current_user, require_permission
-from app.services.auth import hash_password
+from app.services.auth import hash_password, invalidate_user_cache
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
@@ -42,8 +42,8 @@ async def create_user(
     current_user: User = Depends(require_permission("users", "write")),
     db: AsyncSession = Depends(get_db),
 ):
-    existing = await db.execute(select(User).where((User.email == user_data.email) | (User.username == user_data.username)))
-    if existing.scalar_one_or_none():
+    taken = select(exists().where((User.email == user_data.email) | (User.username == user_data.username)))
+    if await db.scalar(taken):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email or username already exists")
     user = User(
         email=user_data.email, username=user_data.username,
@@ -108,6 +108,7 @@ async def update_user(
         for role_id in role_ids:
             db.add(UserRole(user_id=user.id, role_id=role_id))
     await db.commit()
+    invalidate_user_cache(user_id)
     result = await db.execute(select(User).options(selectinload(User.roles)).where(User.id == user_id))
     user = result.scalar_one()
     return UserResponse(
@@ -132,3 +133,4 @@ async def delete_user(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Cannot delete superadmin")
     await db.delete(user)
     await db.commit()
+    invalidate_user_cache(user_id)
@@ -11,6 +11,6 @@ from app.schemas.quota import QuotaCreate, QuotaUpdate, QuotaResponse, QuotaUsag
 from app.schemas.cost import ModelCostCreate, ModelCostUpdate, ModelCostResponse
 from app.schemas.agent import (
     AgentCreate, AgentUpdate, AgentResponse, AgentExport,
-    AgentImport, AgentPermissionUpdate
+    AgentImport, AgentPermissionUpdate, AgentPermissionResponse
 )
 from app.schemas.moderation import ModerationRuleCreate, ModerationRuleUpdate, ModerationRuleResponse
@@ -27,6 +27,14 @@ class AgentUpdate(BaseModel):
     role_ids: Optional[List[UUID]] = None
 
 
+class AgentPermissionResponse(BaseModel):
+    id: UUID
+    role_id: UUID
+
+    class Config:
+        from_attributes = True
+
+
 class AgentResponse(BaseModel):
     id: UUID
     name: str
@@ -40,7 +48,7 @@ class AgentResponse(BaseModel):
     created_by: Optional[UUID]
     created_at: datetime
     updated_at: datetime
-    permissions: List[dict] = []
+    permissions: List[AgentPermissionResponse] = []
 
     class Config:
         from_attributes = True
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+# Per-agent LLM configs change on the order of days; a short TTL bounds how
+# long other processes (Celery workers) keep serving a stale provider/model.
+AGENT_LLM_CONFIG_TTL_SECONDS = 45.0
+
+
+class CachedLLMConfig(NamedTuple):
+    provider_slug: str
+    model_slug: str
+    base_url: Optional[str]
+
+
+class AgentLLMConfigCache:
+    """
+    In-process cache of agent_slug -> resolved provider/model slugs.
+
+    A missing agent-specific config is cached too (as None) so agents running
+    on the platform default skip the lookup as well. API keys are never cached.
+    """
+
+    def __init__(self, ttl: float = AGENT_LLM_CONFIG_TTL_SECONDS):
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, Optional[CachedLLMConfig]]] = {}
+        self._lock = asyncio.Lock()
+
+    def _get_fresh(self, agent_slug: str) -> tuple[bool, Optional[CachedLLMConfig]]:
+        entry = self._entries.get(agent_slug)
+        if entry is None or time.monotonic() >= entry[0]:
+            return False, None
+        return True, entry[1]
+
+    async def get_or_load(
+        self,
+        agent_slug: str,
+        loader: Callable[[], Awaitable[Optional[CachedLLMConfig]]],
+    ) -> Optional[CachedLLMConfig]:
+        hit, value = self._get_fresh(agent_slug)
+        if hit:
+            return value
+        async with self._lock:
+            # Another coroutine may have loaded it while we waited
+            hit, value = self._get_fresh(agent_slug)
+            if hit:
+                return value
+            value = await loader()
+            self._entries[agent_slug] = (time.monotonic() + self._ttl, value)
+            return value
+
+    def invalidate(self, agent_slug: Optional[str] = None) -> None:
+        """Drop one agent's entry, or every entry when agent_slug is None."""
+        if agent_slug is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(agent_slug, None)
+
+
+_cache: Optional[AgentLLMConfigCache] = None
+
+
+def get_agent_llm_config_cache() -> AgentLLMConfigCache:
+    global _cache
+    if _cache is None:
+        _cache = AgentLLMConfigCache()
+    return _cache
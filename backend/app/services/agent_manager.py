@@ -1,3 +1,4 @@
+import asyncio
 import json
 import io
 import logging
@@ -5,10 +6,10 @@ import re
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, insert, select
 from sqlalchemy.orm import selectinload
 from minio import Minio
 from app.config import get_settings
@@ -77,22 +78,24 @@ class AgentManager:
         buffer = io.BytesIO()
         with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
             zf.writestr("agent.json", json.dumps(export_data, indent=2, default=str))
-        buffer.seek(0)
+        data = buffer.getvalue()
 
+        # Archive copy in MinIO: blocking SDK call, kept off the event loop
         object_name = f"exports/{agent.slug}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.zip"
-        self.minio_client.put_object(
-            settings.MINIO_BUCKET, object_name, buffer, buffer.getbuffer().nbytes,
+        await asyncio.to_thread(
+            self.minio_client.put_object,
+            settings.MINIO_BUCKET, object_name, io.BytesIO(data), len(data),
             content_type="application/zip",
         )
-        buffer.seek(0)
-        return buffer.read()
+        return data
 
     async def import_agent(
-        self, db: AsyncSession, data: bytes, created_by: Optional[UUID] = None,
+        self, db: AsyncSession, data: Union[bytes, BinaryIO], created_by: Optional[UUID] = None,
         name_override: Optional[str] = None, slug_override: Optional[str] = None,
         overwrite_slug: Optional[str] = None,
     ) -> Agent:
-        buffer = io.BytesIO(data)
+        # A seekable file object is read in place (members are inflated one at a time)
+        buffer = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
         with zipfile.ZipFile(buffer, "r") as zf:
             names = zf.namelist()
             is_framework = "backend/manifest.json" in names or "backend/agent.py" in names
@@ -131,6 +134,10 @@ class AgentManager:
             if is_framework:
                 deploy_slug = overwrite_slug or slug_override or agent_json.get("slug", "unknown-agent")
                 self._deploy_framework_files(zf, names, deploy_slug)
+                # Runtime agents are cached per process: bump the shared generation
+                # so API processes and Celery workers rediscover them
+                from app.framework.runtime.bootstrap import invalidate_agents
+                await asyncio.to_thread(invalidate_agents)
 
         # ── Overwrite mode: update existing agent ──
         if overwrite_slug:
@@ -149,8 +156,7 @@ class AgentManager:
                 return existing_agent
 
         slug = slug_override or agent_json["slug"]
-        existing = await db.execute(select(Agent).where(Agent.slug == slug))
-        if existing.scalar_one_or_none():
+        if await db.scalar(select(exists().where(Agent.slug == slug))):
             slug = f"{slug}-{uuid4().hex[:8]}"
 
         agent = Agent(
@@ -263,8 +269,11 @@ class AgentManager:
         db.add(new_agent)
         await db.flush()
 
-        for perm in original.permissions:
-            db.add(AgentPermission(agent_id=new_agent.id, role_id=perm.role_id))
+        if original.permissions:
+            await db.execute(
+                insert(AgentPermission),
+                [{"agent_id": new_agent.id, "role_id": perm.role_id} for perm in original.permissions],
+            )
 
         for rule in original.moderation_rules:
             db.add(ModerationRule(
@@ -283,5 +292,12 @@ class AgentManager:
         return new_agent
 
 
+_agent_manager: Optional[AgentManager] = None
+
+
 def get_agent_manager() -> AgentManager:
-    return AgentManager()
+    """Shared manager: one MinIO client (and bucket check) per process."""
+    global _agent_manager
+    if _agent_manager is None:
+        _agent_manager = AgentManager()
+    return _agent_manager
@@ -1,3 +1,5 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
@@ -12,6 +14,12 @@ from app.models.user import User
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Short-lived in-process cache of verified access tokens -> User, so chatty
+# clients skip the JWT verify + user SELECT on every request.
+TOKEN_CACHE_TTL_SECONDS = 30.0
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: dict[bytes, tuple[float, float, User]] = {}
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password[:72])
@@ -58,3 +66,43 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
         select(User).options(selectinload(User.roles)).where(User.id == user_id)
     )
     return result.scalar_one_or_none()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_cached_user(token: str) -> Optional[User]:
+    key = _token_key(token)
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    cached_until, expires_at, user = entry
+    if time.monotonic() >= cached_until or time.time() >= expires_at:
+        _token_cache.pop(key, None)
+        return None
+    return user
+
+
+def cache_user(token: str, payload: dict, user: User) -> None:
+    if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        now = time.monotonic()
+        for key in [k for k, (until, _, _) in _token_cache.items() if until <= now]:
+            del _token_cache[key]
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+    expires_at = float(payload.get("exp", 0))
+    _token_cache[_token_key(token)] = (time.monotonic() + TOKEN_CACHE_TTL_SECONDS, expires_at, user)
+
+
+def invalidate_token(token: str) -> None:
+    _token_cache.pop(_token_key(token), None)
+
+
+def invalidate_user_cache(user_id: Optional[UUID] = None) -> None:
+    """Drop cached tokens of one user, or of every user when user_id is None."""
+    if user_id is None:
+        _token_cache.clear()
+        return
+    for key in [k for k, (_, _, u) in _token_cache.items() if u.id == user_id]:
+        del _token_cache[key]
@@ -1,14 +1,234 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from decimal import Decimal, ROUND_HALF_UP
+from typing import AsyncIterator, Optional
 from uuid import UUID
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, cast, Date, text
-from app.models.consumption import Consumption
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, insert, func, and_, cast, Date, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DataError, IntegrityError
+from app.database import uuid7
+from app.models.consumption import Consumption, COST_MICROS
 from app.models.quota import Quota
 
 logger = logging.getLogger(__name__)
 
+_CONSUMPTION_COLUMNS = (
+    "id", "user_id", "agent_id", "provider_id", "model_id",
+    "tokens_in", "tokens_out", "cost_in_micros", "cost_out_micros", "session_id", "created_at",
+)
+
+
+def _cost_micros(tokens: int, cost_per_token) -> int:
+    """Coût en millionièmes d'unité, calculé en décimal exact puis arrondi."""
+    if not tokens or not cost_per_token:
+        return 0
+    exact = tokens * Decimal(str(cost_per_token)) * COST_MICROS
+    return int(exact.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+class ConsumptionBatcher:
+    """
+    Regroupe les enregistrements de consommation et les écrit par lots.
+
+    Les lignes sont flushées toutes les `flush_interval` secondes ou dès que
+    `max_batch` lignes sont en attente : COPY asyncpg sur PostgreSQL,
+    INSERT multi-lignes (insertmanyvalues) sinon.
+
+    Ce sont des données de facturation : un lot en échec est réessayé par
+    INSERT, puis ligne par ligne. Seules les lignes que la base rejette
+    (IntegrityError, DataError) sont abandonnées, journalisées avec leur
+    contenu ; sur erreur de connexion les lignes sont remises en file. Les
+    lignes non encore écrites restent visibles via `pending_rows()` (quotas).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_batch: int = 100,
+        flush_interval: float = 2.0,
+        drain_timeout: float = 10.0,
+    ):
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._drain_timeout = drain_timeout
+        # None : signal d'arrêt posé par stop()
+        self._queue: asyncio.Queue[Optional[dict]] = asyncio.Queue()
+        # Lignes soumises et pas encore commitées (en file ou en cours d'écriture)
+        self._pending: dict[UUID, dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Vide la file puis arrête le flusher, en `drain_timeout` secondes au plus.
+
+        Les lignes encore non écrites à l'échéance sont journalisées en erreur,
+        avec leur contenu, pour pouvoir être rejouées.
+        """
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(self._task, self._drain_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Consumption flusher did not drain within {self._drain_timeout:g}s")
+            except Exception as e:
+                logger.error(f"Consumption flusher failed: {e}")
+            self._task = None
+        if self._pending:
+            logger.error(
+                f"{len(self._pending)} consumption record(s) not written at shutdown: "
+                + orjson.dumps(list(self._pending.values())).decode()
+            )
+
+    def submit(self, row: dict) -> None:
+        self._pending[row["id"]] = row
+        self._queue.put_nowait(row)
+
+    def pending_rows(self) -> list[dict]:
+        """Lignes acceptées mais pas encore commitées en base."""
+        return list(self._pending.values())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                await self._drain()
+                return
+            rows = [row]
+            closing = False
+            deadline = loop.time() + self._flush_interval
+            while len(rows) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    closing = True
+                    break
+                rows.append(row)
+            if closing:
+                self._requeue(rows)
+                await self._drain()
+                return
+            if not await self._flush(rows):
+                # Base indisponible : on laisse passer un intervalle avant de réessayer
+                await asyncio.sleep(self._flush_interval)
+
+    async def _drain(self) -> None:
+        """Écrit tout ce qui reste en file (arrêt), en réessayant les lots en échec."""
+        while not self._queue.empty():
+            rows = []
+            while len(rows) < self._max_batch and not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is not None:
+                    rows.append(row)
+            if rows and not await self._flush(rows):
+                await asyncio.sleep(self._flush_interval)
+
+    def _requeue(self, rows: list[dict]) -> None:
+        for row in rows:
+            self._queue.put_nowait(row)
+
+    async def _flush(self, rows: list[dict]) -> bool:
+        """
+        Écrit un lot : COPY (ou INSERT multi-lignes), puis un second essai en
+        INSERT ... VALUES, puis ligne par ligne si le lot contient une ligne
+        impossible à écrire.
+
+        Returns:
+            False si des lignes ont été remises en file (base indisponible)
+        """
+        try:
+            await self._write_rows(rows)
+        except Exception as e:
+            logger.warning(f"Failed to flush {len(rows)} consumption record(s), retrying with INSERT: {e}")
+            try:
+                await self._insert_rows(rows)
+            except Exception as e:
+                logger.warning(f"Failed to insert {len(rows)} consumption record(s), retrying row by row: {e}")
+                return await self._insert_one_by_one(rows)
+        for row in rows:
+            self._pending.pop(row["id"], None)
+        return True
+
+    async def _insert_one_by_one(self, rows: list[dict]) -> bool:
+        """
+        Isole les lignes en échec : une ligne rejetée par la base (clé étrangère
+        supprimée entre submit() et le flush, valeur invalide...) est journalisée
+        avec son contenu puis abandonnée, pour ne pas bloquer les autres. Une
+        erreur de connexion remet le reste du lot en file.
+        """
+        for index, row in enumerate(rows):
+            try:
+                await self._insert_rows([row])
+            except (IntegrityError, DataError) as e:
+                logger.error(
+                    f"Dropping consumption record rejected by the database: {e}: "
+                    + orjson.dumps(row).decode()
+                )
+            except Exception as e:
+                logger.error(f"Failed to insert consumption records, {len(rows) - index} requeued: {e}")
+                self._requeue(rows[index:])
+                return False
+            self._pending.pop(row["id"], None)
+        return True
+
+    async def _write_rows(self, rows: list[dict]) -> None:
+        async with self._session_factory() as session:
+            conn = await session.connection()
+            if conn.dialect.driver == "asyncpg":
+                raw = await conn.get_raw_connection()
+                await raw.driver_connection.copy_records_to_table(
+                    Consumption.__tablename__,
+                    records=[tuple(r[c] for c in _CONSUMPTION_COLUMNS) for r in rows],
+                    columns=list(_CONSUMPTION_COLUMNS),
+                )
+            else:
+                await session.execute(insert(Consumption), rows)
+            await session.commit()
+
+    async def _insert_rows(self, rows: list[dict]) -> None:
+        async with self._session_factory() as session:
+            if session.bind.dialect.name == "postgresql":
+                # Idempotent : le premier essai a pu être commité sans accusé de réception
+                stmt = pg_insert(Consumption).values(rows).on_conflict_do_nothing(index_elements=["id"])
+            else:
+                stmt = insert(Consumption).values(rows)
+            await session.execute(stmt)
+            await session.commit()
+
+
+_batcher: Optional[ConsumptionBatcher] = None
+
+
+def start_consumption_batcher(session_factory: async_sessionmaker) -> ConsumptionBatcher:
+    """Démarre le batcher du process API (appelé depuis le lifespan)."""
+    global _batcher
+    if _batcher is None:
+        _batcher = ConsumptionBatcher(session_factory)
+    _batcher.start()
+    return _batcher
+
+
+async def stop_consumption_batcher() -> None:
+    if _batcher is not None:
+        await _batcher.stop()
+
 
 class ConsumptionService:
     """Service de logging de consommation utilisé par le pipeline d'exécution."""
@@ -48,8 +268,8 @@ class ConsumptionService:
         # Resolve active provider/model (with per-agent config fallback)
         provider_id = None
         model_id = None
-        cost_in = 0.0
-        cost_out = 0.0
+        cost_in_micros = 0
+        cost_out_micros = 0
 
         try:
             # Try agent-specific config first
@@ -95,22 +315,32 @@ class ConsumptionService:
                 )
                 cost_row = cost_result.fetchone()
                 if cost_row:
-                    cost_in = tokens_in * (cost_row[0] or 0.0)
-                    cost_out = tokens_out * (cost_row[1] or 0.0)
+                    cost_in_micros = _cost_micros(tokens_in, cost_row[0])
+                    cost_out_micros = _cost_micros(tokens_out, cost_row[1])
         except Exception as e:
             logger.warning(f"Failed to resolve provider/model for consumption: {e}")
 
-        record = Consumption(
-            user_id=user_id,
-            agent_id=agent_id,
-            provider_id=provider_id,
-            model_id=model_id,
-            tokens_in=tokens_in,
-            tokens_out=tokens_out,
-            cost_in=cost_in,
-            cost_out=cost_out,
-        )
-        self._db.add(record)
+        row = {
+            "id": uuid7(),
+            "user_id": user_id,
+            "agent_id": agent_id,
+            "provider_id": provider_id,
+            "model_id": model_id,
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "cost_in_micros": cost_in_micros,
+            "cost_out_micros": cost_out_micros,
+            "session_id": None,
+            "created_at": datetime.utcnow(),
+        }
+
+        # Process API : écriture groupée en arrière-plan.
+        # Workers Celery (pas de batcher démarré) : insertion directe.
+        if _batcher is not None and _batcher.running:
+            _batcher.submit(row)
+            return
+
+        self._db.add(Consumption(**row))
         try:
             await self._db.commit()
         except Exception as e:
@@ -118,7 +348,7 @@ class ConsumptionService:
             await self._db.rollback()
 
 
-async def get_consumption_data(
+async def stream_consumption_data(
     db: AsyncSession,
     user_id: Optional[UUID] = None,
     agent_id: Optional[UUID] = None,
@@ -128,8 +358,15 @@ async def get_consumption_data(
     date_to: Optional[datetime] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[Consumption]:
-    query = select(Consumption)
+) -> AsyncIterator[dict]:
+    """
+    Lignes de consommation (plus récentes d'abord) au format ConsumptionResponse.
+
+    Les lignes sont lues par curseur serveur et produites une à une, sans
+    instancier d'objets ORM ; les champs à None sont omis.
+    """
+    columns = [getattr(Consumption, c) for c in _CONSUMPTION_COLUMNS]
+    query = select(*columns)
     if user_id:
         query = query.where(Consumption.user_id == user_id)
     if agent_id:
@@ -143,8 +380,12 @@ async def get_consumption_data(
     if date_to:
         query = query.where(Consumption.created_at <= date_to)
     query = query.order_by(Consumption.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+    result = await db.stream(query)
+    async for row in result.mappings():
+        item = {k: v for k, v in row.items() if v is not None}
+        item["cost_in"] = (item.pop("cost_in_micros", 0) or 0) / COST_MICROS
+        item["cost_out"] = (item.pop("cost_out_micros", 0) or 0) / COST_MICROS
+        yield item
 
 
 async def get_consumption_summary(
@@ -169,8 +410,8 @@ async def get_consumption_summary(
         group_col.label("group_value"),
         func.sum(Consumption.tokens_in).label("total_tokens_in"),
         func.sum(Consumption.tokens_out).label("total_tokens_out"),
-        func.sum(Consumption.cost_in).label("total_cost_in"),
-        func.sum(Consumption.cost_out).label("total_cost_out"),
+        func.sum(Consumption.cost_in_micros).label("total_cost_in_micros"),
+        func.sum(Consumption.cost_out_micros).label("total_cost_out_micros"),
         func.count().label("count"),
     )
     if user_id:
@@ -190,6 +431,58 @@ async def get_consumption_summary(
     return result.all()
 
 
+_QUOTA_TARGET_COLUMNS = {"user": "user_id", "agent": "agent_id", "provider": "provider_id"}
+
+
+async def _usage_by_period(
+    db: AsyncSession, target_type: str, target_id: UUID, periods: set[str]
+) -> dict[str, tuple[int, int]]:
+    """
+    Consommation (tokens, coût en micros) de la cible depuis le début de chaque période.
+
+    Une seule requête d'agrégation : une paire de SUM ... FILTER par période,
+    sur la plage de la période la plus longue.
+    """
+    starts = {period: _get_period_start(period) for period in periods}
+    columns = []
+    for index, start in enumerate(starts.values()):
+        in_period = Consumption.created_at >= start
+        columns.append(func.sum(Consumption.tokens_in + Consumption.tokens_out).filter(in_period).label(f"tokens_{index}"))
+        columns.append(
+            func.sum(Consumption.cost_in_micros + Consumption.cost_out_micros).filter(in_period).label(f"cost_{index}")
+        )
+    usage_query = select(*columns).where(Consumption.created_at >= min(starts.values()))
+
+    if target_type == "user":
+        usage_query = usage_query.where(Consumption.user_id == target_id)
+    elif target_type == "agent":
+        usage_query = usage_query.where(Consumption.agent_id == target_id)
+    elif target_type == "provider":
+        usage_query = usage_query.where(Consumption.provider_id == target_id)
+
+    row = (await db.execute(usage_query)).one()
+    # SUM(bigint) is numeric in PostgreSQL: back to int before mixing with floats
+    usage = {
+        period: (int(row[2 * index] or 0), int(row[2 * index + 1] or 0))
+        for index, period in enumerate(starts)
+    }
+
+    # Lignes encore dans le batcher : comptées sans attendre le prochain flush
+    column = _QUOTA_TARGET_COLUMNS.get(target_type)
+    if _batcher is not None and column is not None:
+        for pending in _batcher.pending_rows():
+            if pending[column] != target_id:
+                continue
+            for period, start in starts.items():
+                if pending["created_at"] >= start:
+                    tokens, cost_micros = usage[period]
+                    usage[period] = (
+                        tokens + pending["tokens_in"] + pending["tokens_out"],
+                        cost_micros + pending["cost_in_micros"] + pending["cost_out_micros"],
+                    )
+    return usage
+
+
 async def check_quota(
     db: AsyncSession,
     target_type: str,
@@ -204,28 +497,18 @@ async def check_quota(
         )
     )
     quotas = result.scalars().all()
+    if not quotas:
+        return {"allowed": True}
+
+    usage = await _usage_by_period(db, target_type, target_id, {quota.period for quota in quotas})
     for quota in quotas:
-        period_start = _get_period_start(quota.period)
-        usage_query = select(
-            func.sum(Consumption.tokens_in + Consumption.tokens_out).label("total_tokens"),
-            func.sum(Consumption.cost_in + Consumption.cost_out).label("total_cost"),
-        ).where(Consumption.created_at >= period_start)
-
-        if target_type == "user":
-            usage_query = usage_query.where(Consumption.user_id == target_id)
-        elif target_type == "agent":
-            usage_query = usage_query.where(Consumption.agent_id == target_id)
-        elif target_type == "provider":
-            usage_query = usage_query.where(Consumption.provider_id == target_id)
-
-        usage_result = await db.execute(usage_query)
-        row = usage_result.one()
+        total_tokens, total_cost_micros = usage[quota.period]
 
         current_value = 0
         if quota.quota_type == "token":
-            current_value = (row.total_tokens or 0) + tokens_in + tokens_out
+            current_value = total_tokens + tokens_in + tokens_out
         elif quota.quota_type == "financial":
-            current_value = (row.total_cost or 0) + cost
+            current_value = total_cost_micros / COST_MICROS + cost
 
         if current_value > quota.limit_value:
             return {"allowed": False, "quota_id": str(quota.id), "current": current_value, "limit": quota.limit_value}
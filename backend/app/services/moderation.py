@@ -1,5 +1,12 @@
 from typing import List, Optional, Dict, Any
-import re
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a failed model load (hub/disk errors are often transient)
+MODEL_LOAD_RETRY_SECONDS = 60.0
 
 
 class ModerationService:
@@ -7,34 +14,61 @@ class ModerationService:
 
     def __init__(self):
         self._model = None
+        # The model is loaded once per process. A failed load is retried after
+        # MODEL_LOAD_RETRY_SECONDS, not on every call (from_pretrained would hit
+        # the hub/disk each time) and not never (rules would silently stop applying)
+        self._load_failed_at: Optional[float] = None
+        self._model_lock = threading.Lock()
+
+    def _load_due(self) -> bool:
+        return self._model is None and (
+            self._load_failed_at is None
+            or time.monotonic() - self._load_failed_at >= MODEL_LOAD_RETRY_SECONDS
+        )
 
     def _get_model(self):
-        if self._model is None:
-            try:
-                from gliner import GLiNER
-                self._model = GLiNER.from_pretrained("urchade/gliner_multi_pii-v1")
-            except Exception:
-                self._model = None
+        if self._load_due():
+            with self._model_lock:
+                if self._load_due():
+                    try:
+                        from gliner import GLiNER
+                        self._model = GLiNER.from_pretrained("urchade/gliner_multi_pii-v1")
+                        self._load_failed_at = None
+                    except Exception:
+                        logger.exception(
+                            f"Failed to load moderation model, retrying in {MODEL_LOAD_RETRY_SECONDS:g}s"
+                        )
+                        self._load_failed_at = time.monotonic()
         return self._model
 
     def detect_entities(self, text: str, entity_types: List[str]) -> List[Dict[str, Any]]:
         model = self._get_model()
-        if model is None:
+        if model is None or not text or not entity_types:
             return []
-        entities = model.predict_entities(text, entity_types, threshold=0.5)
+        # Duplicate labels only add work to the prediction
+        labels = list(dict.fromkeys(entity_types))
+        entities = model.predict_entities(text, labels, threshold=0.5)
         return [
             {"text": e["text"], "label": e["label"], "start": e["start"], "end": e["end"], "score": e["score"]}
             for e in entities
         ]
 
     def redact_text(self, text: str, entity_types: List[str], replacement: str = "[REDACTED]") -> str:
-        entities = self.detect_entities(text, entity_types)
-        entities.sort(key=lambda x: x["start"], reverse=True)
-        result = text
-        for entity in entities:
-            label_replacement = replacement.replace("{label}", entity["label"])
-            result = result[:entity["start"]] + label_replacement + result[entity["end"]:]
-        return result
+        return self.redact_from_spans(text, self.detect_entities(text, entity_types), replacement)
+
+    @staticmethod
+    def redact_from_spans(text: str, entities: List[Dict[str, Any]], replacement: str = "[REDACTED]") -> str:
+        """Redact entities already detected in `text`, in a single pass over it."""
+        parts = []
+        cursor = 0
+        for entity in sorted(entities, key=lambda e: e["start"]):
+            if entity["start"] < cursor:  # overlaps a span already redacted
+                continue
+            parts.append(text[cursor:entity["start"]])
+            parts.append(replacement.replace("{label}", entity["label"]))
+            cursor = entity["end"]
+        parts.append(text[cursor:])
+        return "".join(parts)
 
     def moderate_content(self, text: str, rules: list) -> Dict[str, Any]:
         results = {"original": text, "moderated": text, "entities_found": [], "blocked": False}
@@ -51,9 +85,13 @@ class ModerationService:
                 return results
             elif rule.action == "redact":
                 replacement = rule.replacement_template or "[REDACTED]"
-                results["moderated"] = self.redact_text(
-                    results["moderated"], entity_types, replacement
-                )
+                if results["moderated"] is text:
+                    # Spans were detected on this exact text: no second pass
+                    results["moderated"] = self.redact_from_spans(text, entities, replacement)
+                else:
+                    results["moderated"] = self.redact_text(
+                        results["moderated"], entity_types, replacement
+                    )
             elif rule.action == "flag":
                 pass  # just flag, entities are already recorded
         return results
@@ -10,12 +10,17 @@ Core responsibilities:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import re
-from typing import Any
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator
 
 import httpx
+import orjson
 
 from app.config import get_settings
 
@@ -190,6 +195,22 @@ class WorkflowAnalysis:
             "output_type": self.output_type,
         }
 
+    @functools.cached_property
+    def as_json(self) -> bytes:
+        """to_dict() serialized once, for a finished analysis."""
+        return orjson.dumps(self.to_dict())
+
+    @property
+    def as_dict(self) -> dict:
+        """
+        Private copy of to_dict(), decoded from the memoized as_json.
+
+        Analyses from get_workflow_analysis() are shared between requests, so
+        every caller gets its own dict: embedding it in Agent.config or a
+        response body and editing it later cannot corrupt the cached analysis.
+        """
+        return orjson.loads(self.as_json)
+
 
 # ---------------------------------------------------------------------------
 # Core service functions
@@ -347,6 +368,39 @@ def analyze_workflow(workflow_json: dict) -> WorkflowAnalysis:
     return analysis
 
 
+# Analyses of unchanged workflows, keyed by (id, updatedAt): LRU with a TTL
+ANALYSIS_CACHE_MAXSIZE = 512
+ANALYSIS_CACHE_TTL_SECONDS = 300.0
+_analysis_cache: OrderedDict[tuple[str, str], tuple[float, WorkflowAnalysis]] = OrderedDict()
+
+
+def get_workflow_analysis(workflow_json: dict) -> WorkflowAnalysis:
+    """
+    analyze_workflow() memoized for workflows fetched from N8N.
+
+    N8N bumps updatedAt on every save, so (id, updatedAt) identifies a workflow
+    version. JSON without both (drafts not yet saved) is analyzed every time.
+    The returned analysis is shared: callers must not mutate it.
+    """
+    workflow_id, updated_at = workflow_json.get("id"), workflow_json.get("updatedAt")
+    if not workflow_id or not updated_at:
+        return analyze_workflow(workflow_json)
+
+    key = (str(workflow_id), str(updated_at))
+    entry = _analysis_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and entry[0] > now:
+        _analysis_cache.move_to_end(key)
+        return entry[1]
+
+    analysis = analyze_workflow(workflow_json)
+    _analysis_cache[key] = (now + ANALYSIS_CACHE_TTL_SECONDS, analysis)
+    _analysis_cache.move_to_end(key)
+    while len(_analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+        _analysis_cache.popitem(last=False)
+    return analysis
+
+
 def _extract_webhook_inputs(node: dict, params: dict, analysis: WorkflowAnalysis):
     """Extract expected inputs from a webhook node's configuration."""
     http_method = params.get("httpMethod", "POST")
@@ -681,72 +735,138 @@ async def _ensure_n8n_api_key() -> str:
     )
 
 
+# One pooled client for every N8N API call: connections (and TLS sessions)
+# are reused across requests instead of being set up per call
+_n8n_client: httpx.AsyncClient | None = None
+
+
 async def get_n8n_client() -> httpx.AsyncClient:
-    """Create an authenticated httpx client for N8N API."""
+    """Shared authenticated httpx client for the N8N API (do not close it)."""
+    global _n8n_client
     api_key = await _ensure_n8n_api_key()
-    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if _n8n_client is None or _n8n_client.is_closed:
+        _n8n_client = httpx.AsyncClient(
+            base_url=settings.N8N_BASE_URL.rstrip("/"),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            http2=True,
+            headers={"Content-Type": "application/json"},
+        )
+    # The key can change at runtime (POST /api/n8n/setup)
     if api_key:
-        headers["X-N8N-API-KEY"] = api_key
-    return httpx.AsyncClient(
-        base_url=settings.N8N_BASE_URL.rstrip("/"),
-        timeout=httpx.Timeout(30.0, connect=10.0),
-        headers=headers,
-    )
+        _n8n_client.headers["X-N8N-API-KEY"] = api_key
+    return _n8n_client
 
 
-async def list_n8n_workflows() -> list[dict]:
-    """List all workflows from N8N."""
-    async with await get_n8n_client() as client:
-        resp = await client.get("/api/v1/workflows")
+async def close_n8n_client() -> None:
+    """Close the shared N8N client (application shutdown)."""
+    global _n8n_client
+    if _n8n_client is not None:
+        await _n8n_client.aclose()
+        _n8n_client = None
+
+
+# Page size requested from the N8N public API (its maximum is 250)
+WORKFLOW_PAGE_SIZE = 100
+
+
+async def iter_n8n_workflows() -> AsyncIterator[dict]:
+    """Yield every N8N workflow, one API page at a time (follows nextCursor)."""
+    client = await get_n8n_client()
+    params: dict[str, Any] = {"limit": WORKFLOW_PAGE_SIZE}
+    while True:
+        resp = await client.get("/api/v1/workflows", params=params)
         resp.raise_for_status()
         data = resp.json()
-        return data.get("data", data) if isinstance(data, dict) else data
+        if not isinstance(data, dict):
+            for workflow in data:
+                yield workflow
+            return
+        for workflow in data.get("data", []):
+            yield workflow
+        cursor = data.get("nextCursor")
+        if not cursor:
+            return
+        params["cursor"] = cursor
+
+
+async def list_n8n_workflows() -> list[dict]:
+    """List all workflows from N8N."""
+    return [workflow async for workflow in iter_n8n_workflows()]
+
+
+# Workflow fetches: concurrent requests for one id share a single N8N call,
+# and the result is reused for a few seconds to absorb bursts
+WORKFLOW_FETCH_TTL_SECONDS = 5.0
+# Raw response bodies are shared; each caller decodes its own copy
+_workflow_cache: dict[str, tuple[float, bytes]] = {}
+_workflow_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _fetch_n8n_workflow(workflow_id: str) -> bytes:
+    client = await get_n8n_client()
+    resp = await client.get(f"/api/v1/workflows/{workflow_id}")
+    resp.raise_for_status()
+    workflow = resp.content
+
+    now = time.monotonic()
+    for key in [k for k, (expires, _) in _workflow_cache.items() if expires <= now]:
+        del _workflow_cache[key]
+    _workflow_cache[workflow_id] = (now + WORKFLOW_FETCH_TTL_SECONDS, workflow)
+    return workflow
 
 
 async def get_n8n_workflow(workflow_id: str) -> dict:
-    """Get a specific workflow from N8N."""
-    async with await get_n8n_client() as client:
-        resp = await client.get(f"/api/v1/workflows/{workflow_id}")
-        resp.raise_for_status()
-        return resp.json()
+    """Get a specific workflow from N8N (the caller owns the returned dict)."""
+    cached = _workflow_cache.get(workflow_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return orjson.loads(cached[1])
+
+    task = _workflow_inflight.get(workflow_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_n8n_workflow(workflow_id))
+        _workflow_inflight[workflow_id] = task
+        task.add_done_callback(lambda _: _workflow_inflight.pop(workflow_id, None))
+    # A cancelled caller must not cancel the fetch the others are waiting on
+    return orjson.loads(await asyncio.shield(task))
 
 
 async def create_n8n_workflow(workflow_json: dict) -> dict:
     """Create a new workflow in N8N."""
-    async with await get_n8n_client() as client:
-        resp = await client.post("/api/v1/workflows", json=workflow_json)
-        resp.raise_for_status()
-        return resp.json()
+    client = await get_n8n_client()
+    resp = await client.post("/api/v1/workflows", json=workflow_json)
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def execute_n8n_workflow(workflow_id: str, input_data: dict | None = None) -> dict:
     """Execute a workflow in N8N and return results."""
-    async with await get_n8n_client() as client:
-        payload = {}
-        if input_data:
-            payload["data"] = input_data
-        resp = await client.post(
-            f"/api/v1/workflows/{workflow_id}/execute",
-            json=payload,
-        )
-        resp.raise_for_status()
-        return resp.json()
+    client = await get_n8n_client()
+    payload = {}
+    if input_data:
+        payload["data"] = input_data
+    resp = await client.post(
+        f"/api/v1/workflows/{workflow_id}/execute",
+        json=payload,
+    )
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def get_n8n_execution(execution_id: str) -> dict:
     """Get execution status and results."""
-    async with await get_n8n_client() as client:
-        resp = await client.get(f"/api/v1/executions/{execution_id}")
-        resp.raise_for_status()
-        return resp.json()
+    client = await get_n8n_client()
+    resp = await client.get(f"/api/v1/executions/{execution_id}")
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def check_n8n_health() -> bool:
     """Check if N8N is reachable."""
     try:
-        async with await get_n8n_client() as client:
-            resp = await client.get("/healthz")
-            return resp.status_code == 200
+        client = await get_n8n_client()
+        resp = await client.get("/healthz")
+        return resp.status_code == 200
     except Exception:
         return False
 
@@ -765,7 +885,7 @@ def generate_agent_config_from_analysis(
     return {
         "n8n_workflow_id": workflow_id,
         "n8n_workflow_name": workflow_name,
-        "workflow_analysis": analysis.to_dict(),
+        "workflow_analysis": analysis.as_dict,
         "ui_mode": analysis.ui_mode,
         "icon": _agent_icon_from_analysis(analysis),
         "category": _agent_category_from_analysis(analysis),
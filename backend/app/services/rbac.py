@@ -1,21 +1,24 @@
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import selectinload
 from app.models.user import User
-from app.models.role import Role
+from app.models.role import Role, PERMISSION_BITS
+
+
+def has_perm(role: Role, resource: str, action: str) -> bool:
+    bit = PERMISSION_BITS.get((resource, action))
+    if bit is not None:
+        return (role.permissions_mask or 0) & bit != 0
+    # Pairs outside PERMISSION_PAIRS only live in the JSONB document
+    return bool((role.permissions or {}).get(resource, {}).get(action, False))
 
 
 def check_permission(user: User, resource: str, action: str) -> bool:
     if user.is_superadmin:
         return True
-    for role in user.roles:
-        perms = role.permissions or {}
-        resource_perms = perms.get(resource, {})
-        if resource_perms.get(action, False):
-            return True
-    return False
+    return any(has_perm(role, resource, action) for role in user.roles)
 
 
 def get_user_permissions(user: User) -> dict:
@@ -54,3 +57,11 @@ async def get_accessible_agent_ids(db: AsyncSession, user: User) -> Optional[Lis
         select(AgentPermission.agent_id).where(AgentPermission.role_id.in_(role_ids))
     )
     return list(set(row[0] for row in result.all()))
+
+
+async def grant_agent_roles(db: AsyncSession, agent_id: UUID, role_ids: List[UUID]) -> None:
+    """Grant roles on an agent with a single multi-row INSERT (duplicates dropped)."""
+    from app.models.agent import AgentPermission
+    rows = [{"agent_id": agent_id, "role_id": role_id} for role_id in dict.fromkeys(role_ids)]
+    if rows:
+        await db.execute(insert(AgentPermission), rows)
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SWRCache:
+    """
+    In-process stale-while-revalidate cache of serialized responses.
+
+    An entry younger than `fresh` seconds is served as is. Up to `stale`
+    seconds it is still served, while a single background task reloads it.
+    Older entries (and misses) are loaded inline; concurrent callers for the
+    same key await the same load.
+
+    Loaders may run after the triggering request has completed, so they must
+    not capture request-scoped resources such as the `get_db` session.
+    """
+
+    def __init__(self, fresh: float = 5.0, stale: float = 30.0, max_entries: int = 256):
+        self._fresh = fresh
+        self._stale = stale
+        self._max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, bytes]] = {}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self._fresh:
+                return entry[1]
+            if age < self._stale:
+                self._load(key, loader)
+                return entry[1]
+        return await asyncio.shield(self._load(key, loader))
+
+    def _load(self, key: Hashable, loader: Callable[[], Awaitable[bytes]]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, loader))
+            # Background refreshes nobody awaits: the failure is already logged
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return task
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            content = await loader()
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                # Dicts keep insertion order: the first entry is the oldest refresh
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), content)
+            return content
+        except Exception:
+            logger.warning("SWR refresh failed for %r", key, exc_info=True)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
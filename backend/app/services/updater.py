@@ -1,9 +1,12 @@
 import subprocess
-import os
+from pathlib import Path
 from app.config import get_settings
 
 settings = get_settings()
 
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+UPDATE_SCRIPT = BACKEND_DIR.parent / "scripts" / "update.sh"
+
 
 class UpdateService:
     def get_current_version(self) -> str:
@@ -13,11 +16,11 @@ class UpdateService:
         try:
             result = subprocess.run(
                 ["git", "fetch", "origin", "--dry-run"],
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+                capture_output=True, text=True, cwd=BACKEND_DIR
             )
             result2 = subprocess.run(
                 ["git", "log", "HEAD..origin/main", "--oneline"],
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+                capture_output=True, text=True, cwd=BACKEND_DIR
             )
             commits = result2.stdout.strip().split("\n") if result2.stdout.strip() else []
             return {
@@ -35,12 +38,8 @@ class UpdateService:
 
     def apply_update(self) -> dict:
         try:
-            script_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-                "scripts", "update.sh"
-            )
             result = subprocess.run(
-                ["bash", script_path],
+                ["bash", str(UPDATE_SCRIPT)],
                 capture_output=True, text=True, timeout=300
             )
             return {"success": result.returncode == 0, "output": result.stdout, "errors": result.stderr}
@@ -1,13 +1,19 @@
+import time
+
 import hvac
 from typing import Optional
 from app.config import get_settings
 
 settings = get_settings()
 
+# Liste des providers ayant une clé : relue au plus toutes les 5 s
+LLM_KEY_LIST_TTL_SECONDS = 5.0
+
 
 class VaultService:
     def __init__(self):
         self.client = hvac.Client(url=settings.VAULT_ADDR, token=settings.VAULT_TOKEN)
+        self._llm_key_slugs: Optional[tuple[float, frozenset[str]]] = None
         self._ensure_secrets_engine()
 
     def _ensure_secrets_engine(self):
@@ -30,6 +36,7 @@ class VaultService:
                 secret={"api_key": api_key},
                 mount_point=settings.VAULT_MOUNT_POINT,
             )
+            self._llm_key_slugs = None
             return True
         except Exception:
             return False
@@ -50,6 +57,7 @@ class VaultService:
                 path=f"llm-providers/{provider_slug}",
                 mount_point=settings.VAULT_MOUNT_POINT,
             )
+            self._llm_key_slugs = None
             return True
         except Exception:
             return False
@@ -57,6 +65,23 @@ class VaultService:
     def has_api_key(self, provider_slug: str) -> bool:
         return self.get_api_key(provider_slug) is not None
 
+    def has_api_keys(self, provider_slugs: list[str]) -> dict[str, bool]:
+        """Indique pour chaque provider s'il a une clé, en un seul LIST Vault."""
+        cached = self._llm_key_slugs
+        if cached is None or time.monotonic() >= cached[0]:
+            try:
+                listing = self.client.secrets.kv.v2.list_secrets(
+                    path="llm-providers",
+                    mount_point=settings.VAULT_MOUNT_POINT,
+                )
+                slugs = frozenset(listing["data"]["keys"])
+            except Exception:
+                # Chemin absent (aucune clé stockée) ou Vault indisponible
+                slugs = frozenset()
+            cached = (time.monotonic() + LLM_KEY_LIST_TTL_SECONDS, slugs)
+            self._llm_key_slugs = cached
+        return {slug: slug in cached[1] for slug in provider_slugs}
+
     # --- Connector credentials ---
 
     def store_connector_config(self, connector_slug: str, config: dict) -> bool:
@@ -98,5 +123,12 @@ class VaultService:
         return self.get_connector_config(connector_slug) is not None
 
 
+_vault_service: Optional[VaultService] = None
+
+
 def get_vault_service() -> VaultService:
-    return VaultService()
+    """Shared client: the hvac session and mount check are set up once per process."""
+    global _vault_service
+    if _vault_service is None:
+        _vault_service = VaultService()
+    return _vault_service
@@ -197,57 +197,34 @@ async def _run_agent(
 ) -> dict:
     """Exécute l'agent via le moteur framework."""
     from app.database import async_session
-    from app.framework.runtime.engine import AgentEngine
+    from app.framework.runtime.bootstrap import build_engine, get_storage_manager
+    from app.services.vault import get_vault_service
     from app.framework.schemas import UserMessage
 
     async with async_session() as db:
-        # Construire le moteur (simplifié — sera enrichi avec DI)
-        from app.framework.connectors.registry import ConnectorRegistry
-        from app.framework.runtime.session import SessionManager
-        from app.framework.tools.registry import ToolRegistry
-
-        tool_registry = ToolRegistry()
-        tool_registry.discover()
-        connector_registry = ConnectorRegistry()
-        connector_registry.discover()
-        session_manager = SessionManager(db)
-
+        # Registres et agents partagés par le worker, services par job
         from app.services.consumption import ConsumptionService
         consumption_service = ConsumptionService(db)
 
         vault_service = None
         try:
-            from app.services.vault import VaultService
-            vault_service = VaultService()
+            vault_service = get_vault_service()
         except Exception:
             logger.warning("VaultService unavailable in worker")
 
-        # Create storage manager so agents have access to MinIO
+        # Shared storage manager so agents have access to MinIO
         storage_manager = None
         try:
-            from app.config import get_settings
-            from app.framework.storage.agent_storage import AgentStorageManager
-            settings = get_settings()
-            storage_manager = AgentStorageManager(
-                endpoint=settings.MINIO_ENDPOINT,
-                access_key=settings.MINIO_ACCESS_KEY,
-                secret_key=settings.MINIO_SECRET_KEY,
-                bucket=settings.MINIO_STORAGE_BUCKET,
-                secure=settings.MINIO_SECURE,
-            )
+            storage_manager = get_storage_manager()
         except Exception as e:
             logger.warning(f"Storage unavailable in worker: {e}")
 
-        engine = AgentEngine(
-            db_session=db,
-            tool_registry=tool_registry,
-            connector_registry=connector_registry,
-            session_manager=session_manager,
+        engine = build_engine(
+            db,
             consumption_service=consumption_service,
             vault_service=vault_service,
             storage_service=storage_manager,
         )
-        engine.discover_agents()
 
         publish_progress(job_id, 20, "Agent chargé, exécution en cours...")
 
@@ -299,18 +276,12 @@ async def _run_agent_stream(
 ) -> dict:
     """Exécute l'agent en mode streaming via le moteur framework."""
     from app.database import async_session
-    from app.framework.runtime.engine import AgentEngine
+    from app.framework.runtime.bootstrap import build_engine, get_storage_manager
+    from app.services.vault import get_vault_service
+    from app.framework.runtime.session import SessionManager
     from app.framework.schemas import UserMessage
 
     async with async_session() as db:
-        from app.framework.connectors.registry import ConnectorRegistry
-        from app.framework.runtime.session import SessionManager
-        from app.framework.tools.registry import ToolRegistry
-
-        tool_registry = ToolRegistry()
-        tool_registry.discover()
-        connector_registry = ConnectorRegistry()
-        connector_registry.discover()
         session_manager = SessionManager(db)
 
         from app.services.consumption import ConsumptionService
@@ -318,45 +289,31 @@ async def _run_agent_stream(
 
         vault_service = None
         try:
-            from app.services.vault import VaultService
-            vault_service = VaultService()
+            vault_service = get_vault_service()
         except Exception:
             logger.warning("VaultService unavailable in worker")
 
-        # Create storage manager so agents have access to MinIO
+        # Shared storage manager so agents have access to MinIO
         storage_manager = None
         try:
-            from app.config import get_settings
-            from app.framework.storage.agent_storage import AgentStorageManager
-            settings = get_settings()
-            storage_manager = AgentStorageManager(
-                endpoint=settings.MINIO_ENDPOINT,
-                access_key=settings.MINIO_ACCESS_KEY,
-                secret_key=settings.MINIO_SECRET_KEY,
-                bucket=settings.MINIO_STORAGE_BUCKET,
-                secure=settings.MINIO_SECURE,
-            )
+            storage_manager = get_storage_manager()
         except Exception as e:
             logger.warning(f"Storage unavailable in worker: {e}")
 
-        engine = AgentEngine(
-            db_session=db,
-            tool_registry=tool_registry,
-            connector_registry=connector_registry,
+        engine = build_engine(
+            db,
             session_manager=session_manager,
             consumption_service=consumption_service,
             vault_service=vault_service,
             storage_service=storage_manager,
         )
-        engine.discover_agents()
 
         agent = engine.get_agent(agent_slug)
         if not agent:
             return {"success": False, "error": f"Agent '{agent_slug}' not found"}
 
         # Ensure session exists (like engine.execute does)
-        existing = await session_manager.get_session(session_id)
-        if not existing:
+        if not await session_manager.session_exists(session_id):
             await session_manager.create_session_with_id(
                 session_id=session_id,
                 agent_slug=agent_slug,
@@ -36,6 +36,7 @@ celery_app.conf.update(
     enable_utc=True,
     # Résultats
     result_expires=3600,  # 1h
+    result_backend_always_retry=True,  # une coupure Redis ne perd pas le résultat
     # Concurrence
     worker_concurrency=4,
     worker_prefetch_multiplier=1,
@@ -44,6 +45,8 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
     # Broker connection retry (required for Celery 6.0+)
     broker_connection_retry_on_startup=True,
+    # Une connexion broker par envoi simultané côté API (cf. MAX_INFLIGHT_SUBMITS)
+    broker_pool_limit=settings.MAX_INFLIGHT_SUBMITS,
     # Queues
     task_default_queue="agents",
     task_routes={
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from app.database import uuid7
+from app.services.consumption import ConsumptionBatcher
+
+
+def _row() -> dict:
+    return {
+        "id": uuid7(),
+        "user_id": uuid7(),
+        "agent_id": None,
+        "provider_id": None,
+        "model_id": None,
+        "tokens_in": 10,
+        "tokens_out": 5,
+        "cost_in_micros": 100,
+        "cost_out_micros": 50,
+        "session_id": None,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def _batcher(**kwargs) -> ConsumptionBatcher:
+    return ConsumptionBatcher(session_factory=None, max_batch=10, flush_interval=0.01, **kwargs)
+
+
+def test_failed_flush_loses_no_rows():
+    written: list[dict] = []
+    insert_calls = 0
+
+    async def failing_copy(rows):
+        raise RuntimeError("COPY failed")
+
+    async def flaky_insert(rows):
+        nonlocal insert_calls
+        insert_calls += 1
+        # Lot puis première ligne en échec : le lot est remis en file
+        if insert_calls <= 2:
+            raise RuntimeError("database unavailable")
+        written.extend(rows)
+
+    async def scenario() -> ConsumptionBatcher:
+        batcher = _batcher()
+        batcher._write_rows = failing_copy
+        batcher._insert_rows = flaky_insert
+        batcher.start()
+        for row in rows:
+            batcher.submit(row)
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        return batcher
+
+    rows = [_row() for _ in range(25)]
+    batcher = asyncio.run(scenario())
+
+    assert insert_calls > 2
+    assert sorted(r["id"] for r in written) == sorted(r["id"] for r in rows)
+    assert batcher.pending_rows() == []
+
+
+def test_poison_row_is_dropped_without_blocking_others(caplog):
+    written: list[dict] = []
+
+    async def failing_copy(rows):
+        raise RuntimeError("COPY failed")
+
+    async def insert_rejecting_poison(rows):
+        if any(r["id"] == poison["id"] for r in rows):
+            raise IntegrityError("INSERT INTO consumptions ...", {}, Exception("foreign key violation"))
+        written.extend(rows)
+
+    async def scenario() -> ConsumptionBatcher:
+        batcher = _batcher()
+        batcher._write_rows = failing_copy
+        batcher._insert_rows = insert_rejecting_poison
+        batcher.start()
+        for row in rows:
+            batcher.submit(row)
+        await batcher.stop()
+        return batcher
+
+    good = [_row() for _ in range(8)]
+    poison = _row()
+    rows = good[:4] + [poison] + good[4:]
+    with caplog.at_level(logging.ERROR, logger="app.services.consumption"):
+        batcher = asyncio.run(scenario())
+
+    assert sorted(r["id"] for r in written) == sorted(r["id"] for r in good)
+    assert batcher.pending_rows() == []
+    assert str(poison["id"]) in caplog.text
+
+
+def test_pending_rows_visible_until_written():
+    release = None
+
+    async def blocked_write(rows):
+        await release.wait()
+
+    async def scenario() -> tuple[int, int]:
+        nonlocal release
+        release = asyncio.Event()
+        batcher = _batcher()
+        batcher._write_rows = blocked_write
+        batcher.start()
+        batcher.submit(_row())
+        await asyncio.sleep(0.05)
+        before = len(batcher.pending_rows())
+        release.set()
+        await batcher.stop()
+        return before, len(batcher.pending_rows())
+
+    assert asyncio.run(scenario()) == (1, 0)
+
+
+def test_stop_is_bounded_and_reports_unwritten_rows(caplog):
+    async def always_failing(rows):
+        raise RuntimeError("database unavailable")
+
+    async def scenario() -> ConsumptionBatcher:
+        batcher = _batcher(drain_timeout=0.1)
+        batcher._write_rows = always_failing
+        batcher._insert_rows = always_failing
+        batcher.start()
+        for row in rows:
+            batcher.submit(row)
+        await batcher.stop()
+        return batcher
+
+    rows = [_row() for _ in range(3)]
+    with caplog.at_level(logging.ERROR, logger="app.services.consumption"):
+        batcher = asyncio.run(scenario())
+
+    assert not batcher.running
+    assert sorted(r["id"] for r in batcher.pending_rows()) == sorted(r["id"] for r in rows)
+    assert "3 consumption record(s) not written at shutdown" in caplog.text
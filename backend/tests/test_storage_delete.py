@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.framework.storage.agent_storage import ScopedAgentStorage
+from app.routers import agent_runtime
+
+
+class _PartialFailureStorage:
+    """delete_many qui échoue sur certaines clés, indexées comme le vrai stockage."""
+
+    def __init__(self, failing: dict[str, str]):
+        self.failing = failing
+        self.requested: list[str] = []
+
+    async def delete_many(self, keys: list[str]) -> dict[str, str]:
+        self.requested = keys
+        return {k: self.failing[k] for k in keys if k in self.failing}
+
+
+class _FakeMinio:
+    """remove_objects qui enregistre les objets demandés et échoue sur `failing`."""
+
+    def __init__(self, failing: set[str]):
+        self.failing = failing
+        self.removed: list[str] = []
+
+    def remove_objects(self, bucket, objects):
+        for obj in objects:
+            if obj._name in self.failing:
+                yield SimpleNamespace(name=obj._name, message="AccessDenied", code="AccessDenied")
+            else:
+                self.removed.append(obj._name)
+
+
+def _delete(body: dict) -> dict:
+    return asyncio.run(agent_runtime.storage_delete(
+        "demo-agent", body, current_user=SimpleNamespace(id=1),
+    ))
+
+
+def test_multi_key_delete_reports_partial_failure(monkeypatch):
+    storage = _PartialFailureStorage({"c.txt": "AccessDenied", "b.txt": "InternalError"})
+    monkeypatch.setattr(agent_runtime, "_get_scoped_storage", lambda *args: storage)
+
+    response = _delete({"keys": ["c.txt", "a.txt", "b.txt"]})
+
+    assert storage.requested == ["c.txt", "a.txt", "b.txt"]
+    assert response == {
+        "ok": False,
+        "results": [
+            {"key": "c.txt", "ok": False, "error": "AccessDenied"},
+            {"key": "a.txt", "ok": True, "error": None},
+            {"key": "b.txt", "ok": False, "error": "InternalError"},
+        ],
+    }
+
+
+def test_multi_key_delete_rejects_non_string_keys(monkeypatch):
+    monkeypatch.setattr(agent_runtime, "_get_scoped_storage", lambda *args: pytest.fail("storage used"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        _delete({"keys": ["a.txt", 42]})
+
+    assert exc_info.value.status_code == 400
+
+
+def test_delete_many_reports_traversal_keys_and_deletes_the_rest():
+    client = _FakeMinio(failing={"users/1/demo-agent/locked.txt"})
+    storage = ScopedAgentStorage(client, "bucket", "users/1/demo-agent/")
+
+    errors = asyncio.run(storage.delete_many(["a.txt", "../other/secret.txt", "locked.txt"]))
+
+    assert client.removed == ["users/1/demo-agent/a.txt"]
+    assert set(errors) == {"../other/secret.txt", "locked.txt"}
+    assert errors["locked.txt"] == "AccessDenied"
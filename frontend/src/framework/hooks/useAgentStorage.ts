@@ -142,5 +142,22 @@ export function useAgentStorage(
     [agentSlug, workspaceId]
   );
 
-  return { upload, download, listFiles, deleteFile, isUploading, uploadProgress, error };
+  const deleteFiles = useCallback(
+    async (keys: string[]): Promise<boolean> => {
+      const response = await fetch(
+        `${API_BASE}/api/agent-runtime/${agentSlug}/storage/delete`,
+        {
+          method: 'DELETE',
+          headers: { ...getAuthHeaders(), 'Content-Type': 'application/json' },
+          body: JSON.stringify({ keys, workspace_id: workspaceId || undefined }),
+        }
+      );
+      if (!response.ok) return false;
+      const result = await response.json();
+      return result.ok;
+    },
+    [agentSlug, workspaceId]
+  );
+
+  return { upload, download, listFiles, deleteFile, deleteFiles, isUploading, uploadProgress, error };
 }
@@ -101,6 +101,8 @@ export interface SessionInfo {
   created_at: string;
   updated_at: string;
   is_active: boolean;
+  message_count?: number;
+  last_message_at?: string | null;
 }
 
 // =============================================================================